@@ -4,6 +4,7 @@ from collections.abc import Callable
 
 from fontTools.misc import transform
 from fontParts.base import normalizers
+from fontParts.base.errors import FontPartsError
 from fontParts.base.base import (
     BaseObject,
     TransformationMixin,
@@ -49,6 +50,14 @@ class BaseAnchor(
 
     """
 
+    # Compact environment subclasses provide the _glyph slot. They
+    # can't be declared here at runtime, because the environment's
+    # own base class usually holds slots as well.
+    if TYPE_CHECKING:
+        __slots__ = ("_glyph",)
+    else:
+        __slots__ = ()
+
     def _reprContents(self) -> list[str]:
         contents = [f"({self.x}, {self.y})"]
 
@@ -330,7 +339,10 @@ class BaseAnchor(
         glyph = self.glyph
         if glyph is None:
             return None
-        return glyph.anchors.index(self)
+        try:
+            return glyph._getAnchorIndex(self)
+        except FontPartsError:
+            raise ValueError(f"{self!r} is not in the glyph.")
 
     # name
 
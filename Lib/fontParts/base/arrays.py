@@ -0,0 +1,884 @@
+"""Exchange point data as flat buffers instead of point objects.
+
+Coordinates are stored as a flat :class:`array.array` of ``"d"`` values
+holding ``x`` and ``y`` in turn. They are handed to scripters as a
+NumPy array of shape ``(N, 2)`` when NumPy is installed, and otherwise
+as a :class:`memoryview` of that shape over the flat array.
+
+Whole outlines are exchanged as a :class:`PackedOutline`. Outlines
+flattened with a :class:`PolygonPen` can be hit-tested against many
+points at once with :func:`pointsInsidePolygons` and nested with
+:func:`polygonHierarchy` and :func:`polygonDepths`.
+
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from collections.abc import Callable, Sequence
+from math import ceil, hypot, sqrt
+from typing import TYPE_CHECKING, Any
+
+from fontTools.pens.basePen import BasePen
+
+if TYPE_CHECKING:
+    from fontParts.base.annotations import PointPenType
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+#: A NumPy array or a :class:`memoryview` of shape ``(N, 2)``.
+CoordinateArray = Any
+
+
+def hasNumPy() -> bool:
+    """Return :obj:`True` if coordinate arrays are NumPy arrays."""
+    return numpy is not None
+
+
+def makeCoordinateArray(values: array) -> CoordinateArray:
+    """Wrap a flat array of ``x``, ``y`` values as an ``(N, 2)`` array.
+
+    The result shares its memory with `values`.
+
+    :param values: An :class:`array.array` of ``"d"`` values.
+    :return: A NumPy array if NumPy is installed, otherwise a
+        :class:`memoryview`. A :class:`memoryview` can't have a shape
+        containing zero, so for empty `values` it is one-dimensional.
+
+    """
+    if numpy is not None:
+        return numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, 2)
+    view = memoryview(values).cast("B")
+    if not values:
+        return view.cast("d")
+    return view.cast("d", (len(values) // 2, 2))
+
+
+def transformCoordinates(values: array, matrix: Sequence[float]) -> array:
+    """Apply an affine transformation to a flat array of coordinates.
+
+    Every ``x``, ``y`` pair becomes ``(xx * x + yx * y + dx,
+    xy * x + yy * y + dy)``, which matches
+    :meth:`fontTools.misc.transform.Transform.transformPoint`.
+
+    :param values: An :class:`array.array` of ``"d"`` values holding
+        ``x`` and ``y`` in turn.
+    :param matrix: The transformation as a :class:`list` or
+        :class:`tuple` of six numbers.
+    :return: A new :class:`array.array` of ``"d"`` values.
+
+    """
+    xx, xy, yx, yy, dx, dy = matrix
+    result = array("d", values)
+    if not values:
+        return result
+    if numpy is not None:
+        points = numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, 2)
+        x = points[:, 0]
+        y = points[:, 1]
+        transformed = numpy.frombuffer(result, dtype=numpy.float64).reshape(-1, 2)
+        transformed[:, 0] = xx * x + yx * y + dx
+        transformed[:, 1] = xy * x + yy * y + dy
+        return result
+    xs = values[::2]
+    ys = values[1::2]
+    if xy == 0 and yx == 0:
+        if xx == 1 and yy == 1:
+            result[::2] = array("d", [x + dx for x in xs])
+            result[1::2] = array("d", [y + dy for y in ys])
+        else:
+            result[::2] = array("d", [xx * x + dx for x in xs])
+            result[1::2] = array("d", [yy * y + dy for y in ys])
+        return result
+    result[::2] = array("d", [xx * x + yx * y + dx for x, y in zip(xs, ys)])
+    result[1::2] = array("d", [xy * x + yy * y + dy for x, y in zip(xs, ys)])
+    return result
+
+
+# --------------
+# Packed Outline
+# --------------
+
+#: The point types in the order of their codes in
+#: :attr:`PackedOutline.pointTypes`.
+pointTypeCodes: tuple[str, ...] = ("offcurve", "move", "line", "curve", "qcurve")
+
+_BasePackedOutline = namedtuple(
+    "_BasePackedOutline",
+    [
+        "coordinates",
+        "pointTypes",
+        "smoothFlags",
+        "contourEnds",
+        "componentNames",
+        "componentTransformations",
+        "anchorNames",
+        "anchorCoordinates",
+    ],
+)
+
+
+class PackedOutline(_BasePackedOutline):
+    """Represent the outline of a glyph as flat arrays.
+
+    The layout follows the TrueType ``glyf`` table: the points of all
+    contours are stored one after another and the index of the last
+    point of each contour is stored separately. Instances can be
+    pickled, which makes them cheap to cache or to send to another
+    process.
+
+    :param coordinates: An :class:`array.array` of ``"d"`` values
+        holding the ``x`` and ``y`` value of every point in turn.
+    :param pointTypes: An :class:`array.array` of ``"B"`` values
+        holding the type of every point as an index into
+        :data:`pointTypeCodes`.
+    :param smoothFlags: An :class:`array.array` of ``"B"`` values
+        holding ``1`` for every smooth point and ``0`` otherwise.
+    :param contourEnds: An :class:`array.array` of ``"L"`` values
+        holding the index of the last point of every contour.
+    :param componentNames: A :class:`tuple` of the base glyph names
+        of the components, :obj:`None` for a component without one.
+    :param componentTransformations: An :class:`array.array`
+        of ``"d"`` values holding the six transformation values of
+        every component in turn.
+    :param anchorNames: A :class:`tuple` of the names of the anchors,
+        :obj:`None` for an unnamed anchor.
+    :param anchorCoordinates: An :class:`array.array` of ``"d"``
+        values holding the ``x`` and ``y`` value of every anchor in
+        turn.
+
+    Empty contours, point names, identifiers and anchor colors are not
+    stored.
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def contourCount(self) -> int:
+        """Get the number of contours.
+
+        :return: An :class:`int`.
+
+        """
+        return len(self.contourEnds)
+
+    @property
+    def pointCount(self) -> int:
+        """Get the number of points in all contours.
+
+        :return: An :class:`int`.
+
+        """
+        return len(self.pointTypes)
+
+    def getCoordinateArray(self) -> CoordinateArray:
+        """Get the point coordinates as an array of shape ``(N, 2)``.
+
+        The result shares its memory with :attr:`coordinates`.
+
+        :return: A coordinate array as returned by
+            :func:`makeCoordinateArray`.
+
+        """
+        return makeCoordinateArray(self.coordinates)
+
+    def drawPoints(self, pointPen: PointPenType) -> None:
+        """Draw the contours and components with a point pen.
+
+        :param pointPen: The point pen to draw with.
+
+        """
+        coordinates = self.coordinates
+        pointTypes = self.pointTypes
+        smoothFlags = self.smoothFlags
+        start = 0
+        for end in self.contourEnds:
+            pointPen.beginPath()
+            for index in range(start, end + 1):
+                pointType = pointTypes[index]
+                pointPen.addPoint(
+                    (coordinates[index * 2], coordinates[index * 2 + 1]),
+                    segmentType=pointTypeCodes[pointType] if pointType else None,
+                    smooth=bool(smoothFlags[index]),
+                )
+            pointPen.endPath()
+            start = end + 1
+        transformations = self.componentTransformations
+        for index, baseGlyph in enumerate(self.componentNames):
+            pointPen.addComponent(
+                baseGlyph, tuple(transformations[index * 6 : index * 6 + 6])
+            )
+
+
+class PackedOutlinePointPen:
+    """Collect the contours and components drawn into it as arrays.
+
+    This is used to pack outlines that can't be read directly.
+
+    """
+
+    def __init__(self) -> None:
+        self.coordinates = array("d")
+        self.pointTypes = array("B")
+        self.smoothFlags = array("B")
+        self.contourEnds = array("L")
+        self.componentNames: list[str] = []
+        self.componentTransformations = array("d")
+        self._typeCodes: dict[str | None, int] = {
+            pointType: code for code, pointType in enumerate(pointTypeCodes)
+        }
+        self._typeCodes[None] = 0
+        self._contourStart = 0
+
+    def beginPath(self, identifier: str | None = None, **kwargs: Any) -> None:
+        self._contourStart = len(self.pointTypes)
+
+    def endPath(self) -> None:
+        if len(self.pointTypes) > self._contourStart:
+            self.contourEnds.append(len(self.pointTypes) - 1)
+
+    def addPoint(
+        self,
+        pt: tuple[float, float],
+        segmentType: str | None = None,
+        smooth: bool = False,
+        name: str | None = None,
+        identifier: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.coordinates.extend(pt)
+        self.pointTypes.append(self._typeCodes[segmentType])
+        self.smoothFlags.append(1 if smooth else 0)
+
+    def addComponent(
+        self,
+        baseGlyphName: str,
+        transformation: tuple[float, ...],
+        identifier: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.componentNames.append(baseGlyphName)
+        self.componentTransformations.extend(transformation)
+
+
+def interpolatePackedOutlines(
+    outline1: PackedOutline,
+    outline2: PackedOutline,
+    factor: tuple[float, float],
+    roundValue: Callable[[float], float] | None = None,
+) -> PackedOutline | None:
+    """Interpolate between two packed outlines with identical structures.
+
+    Every value is computed as ``value1 + (value2 - value1) * factor``
+    with the ``x`` or ``y`` factor, which matches
+    :class:`fontMath.MathGlyph` interpolation exactly.
+
+    :param outline1: The :class:`PackedOutline` at the 0.0 position.
+    :param outline2: The :class:`PackedOutline` at the 1.0 position.
+    :param factor: The interpolation factors ``(x, y)``.
+    :param roundValue: A function to round coordinates, component
+        offsets and anchor positions with, or :obj:`None` to leave
+        them unrounded.
+    :return: A new :class:`PackedOutline` with the point types and
+        smooth flags of `outline1`, or :obj:`None` if the outlines
+        can't be interpolated this way. This is the case if their point
+        types, contours, components or anchor names differ, if anchor
+        names repeat, or if :class:`fontMath.MathGlyph` would change the
+        structure of the result. MathGlyph moves off-curve points at the
+        start of a closed contour to its end, and turns curves whose
+        off-curve points end up on their on-curve points into lines.
+
+    """
+    interpolator = PackedOutlineInterpolator.fromOutlines(outline1, outline2)
+    if interpolator is None:
+        return None
+    return interpolator.interpolate(factor, roundValue)
+
+
+class PackedOutlineInterpolator:
+    """Interpolate between two packed outlines at any number of factors.
+
+    The differences between the outlines are computed once, so every
+    interpolation only needs one multiplication and one addition per
+    value. Create instances with :meth:`fromOutlines`.
+
+    :param outline: The :class:`PackedOutline` at the 0.0 position.
+    :param coordinateDeltas: An :class:`array.array` of ``"d"`` values
+        holding the point coordinate differences.
+    :param transformationDeltas: An :class:`array.array` of ``"d"``
+        values holding the component transformation differences.
+    :param anchorDeltas: An :class:`array.array` of ``"d"`` values
+        holding the anchor coordinate differences.
+    :param curves: The curves of the shared structure.
+
+    """
+
+    def __init__(
+        self,
+        outline: PackedOutline,
+        coordinateDeltas: array,
+        transformationDeltas: array,
+        anchorDeltas: array,
+        curves: list[tuple[int, int, int, int]],
+    ) -> None:
+        self.outline = outline
+        self.coordinateDeltas = coordinateDeltas
+        self.transformationDeltas = transformationDeltas
+        self.anchorDeltas = anchorDeltas
+        self._curves = curves
+
+    @classmethod
+    def fromOutlines(
+        cls, outline1: PackedOutline, outline2: PackedOutline
+    ) -> PackedOutlineInterpolator | None:
+        """Prepare the interpolation between two packed outlines.
+
+        :param outline1: The :class:`PackedOutline` at the 0.0 position.
+        :param outline2: The :class:`PackedOutline` at the 1.0 position.
+        :return: A new :class:`PackedOutlineInterpolator`, or :obj:`None`
+            if the outlines can't be interpolated without fontMath. See
+            :func:`interpolatePackedOutlines` for when this is the case.
+
+        """
+        curves = _getCompatibleCurves((outline1, outline2))
+        if curves is None:
+            return None
+        return cls(
+            outline1,
+            _subtractValues(outline2.coordinates, outline1.coordinates),
+            _subtractValues(
+                outline2.componentTransformations, outline1.componentTransformations
+            ),
+            _subtractValues(outline2.anchorCoordinates, outline1.anchorCoordinates),
+            curves,
+        )
+
+    def interpolate(
+        self,
+        factor: tuple[float, float],
+        roundValue: Callable[[float], float] | None = None,
+    ) -> PackedOutline | None:
+        """Interpolate the outlines.
+
+        :param factor: The interpolation factors ``(x, y)``.
+        :param roundValue: A function to round coordinates, component
+            offsets and anchor positions with, or :obj:`None` to leave
+            them unrounded.
+        :return: A new :class:`PackedOutline`, or :obj:`None` if
+            :class:`fontMath.MathGlyph` would turn a curve of the result
+            into a line.
+
+        """
+        xFactor, yFactor = factor
+        outline = self.outline
+        coordinates = _addScaledValues(
+            outline.coordinates, self.coordinateDeltas, (xFactor, yFactor)
+        )
+        transformations = _addScaledValues(
+            outline.componentTransformations,
+            self.transformationDeltas,
+            (xFactor, xFactor, yFactor, yFactor, xFactor, yFactor),
+        )
+        anchorCoordinates = _addScaledValues(
+            outline.anchorCoordinates, self.anchorDeltas, (xFactor, yFactor)
+        )
+        return _makeMathOutline(
+            outline,
+            coordinates,
+            transformations,
+            anchorCoordinates,
+            self._curves,
+            roundValue,
+        )
+
+
+def combinePackedOutlines(
+    outlines: Sequence[PackedOutline],
+    weights: Sequence[tuple[float, float]],
+    roundValue: Callable[[float], float] | None = None,
+) -> PackedOutline | None:
+    """Compute a weighted sum of packed outlines with identical structures.
+
+    Every value is computed as the sum of ``value * weight`` over all
+    outlines, in order, with the ``x`` or ``y`` weight. This matches
+    multiplying :class:`fontMath.MathGlyph` objects by their weights
+    and adding them up, without creating the intermediate objects.
+
+    :param outlines: The :class:`PackedOutline` objects to combine.
+    :param weights: The weights ``(x, y)`` of the outlines, in the
+        same order.
+    :param roundValue: A function to round coordinates, component
+        offsets and anchor positions with, or :obj:`None` to leave
+        them unrounded.
+    :return: A new :class:`PackedOutline` with the point types and
+        smooth flags of the first outline, or :obj:`None` if the
+        outlines can't be combined this way. See
+        :func:`interpolatePackedOutlines` for when this is the case.
+
+    """
+    curves = _getCompatibleCurves(outlines)
+    if curves is None:
+        return None
+    xWeights = [xWeight for xWeight, yWeight in weights]
+    yWeights = [yWeight for xWeight, yWeight in weights]
+    coordinates = _combineValues(
+        [outline.coordinates for outline in outlines], (xWeights, yWeights)
+    )
+    transformations = _combineValues(
+        [outline.componentTransformations for outline in outlines],
+        (xWeights, xWeights, yWeights, yWeights, xWeights, yWeights),
+    )
+    anchorCoordinates = _combineValues(
+        [outline.anchorCoordinates for outline in outlines], (xWeights, yWeights)
+    )
+    return _makeMathOutline(
+        outlines[0], coordinates, transformations, anchorCoordinates, curves, roundValue
+    )
+
+
+def _getCompatibleCurves(
+    outlines: Sequence[PackedOutline],
+) -> list[tuple[int, int, int, int]] | None:
+    # Return the curves of the shared structure of the outlines, or
+    # None if the structures differ or MathGlyph would change them.
+    first = outlines[0]
+    pointTypes = first.pointTypes
+    contourEnds = first.contourEnds
+    anchorNames = first.anchorNames
+    if len(set(anchorNames)) != len(anchorNames):
+        return None
+    for outline in outlines[1:]:
+        if (
+            pointTypes != outline.pointTypes
+            or contourEnds != outline.contourEnds
+            or first.componentNames != outline.componentNames
+            or anchorNames != outline.anchorNames
+            or len(first.coordinates) != len(outline.coordinates)
+            or len(first.componentTransformations)
+            != len(outline.componentTransformations)
+            or len(first.anchorCoordinates) != len(outline.anchorCoordinates)
+        ):
+            return None
+    return _getInterpolatableCurves(pointTypes, contourEnds)
+
+
+def _makeMathOutline(
+    structure: PackedOutline,
+    coordinates: array,
+    transformations: array,
+    anchorCoordinates: array,
+    curves: list[tuple[int, int, int, int]],
+    roundValue: Callable[[float], float] | None,
+) -> PackedOutline | None:
+    # Round the computed values like MathGlyph.round and build the
+    # result, or return None if MathGlyph would turn a curve into a
+    # line when drawing it.
+    if roundValue is not None:
+        coordinates = array("d", map(roundValue, coordinates))
+        transformations[4::6] = array("d", map(roundValue, transformations[4::6]))
+        transformations[5::6] = array("d", map(roundValue, transformations[5::6]))
+        anchorCoordinates = array("d", map(roundValue, anchorCoordinates))
+    for index, offCurve1, offCurve2, previous in curves:
+        if (
+            coordinates[offCurve1 * 2] == coordinates[previous * 2]
+            and coordinates[offCurve1 * 2 + 1] == coordinates[previous * 2 + 1]
+            and coordinates[offCurve2 * 2] == coordinates[index * 2]
+            and coordinates[offCurve2 * 2 + 1] == coordinates[index * 2 + 1]
+        ):
+            return None
+    return PackedOutline(
+        coordinates,
+        array("B", structure.pointTypes),
+        array("B", structure.smoothFlags),
+        array("L", structure.contourEnds),
+        structure.componentNames,
+        transformations,
+        structure.anchorNames,
+        anchorCoordinates,
+    )
+
+
+def _getInterpolatableCurves(
+    pointTypes: array, contourEnds: array
+) -> list[tuple[int, int, int, int]] | None:
+    # Return the index of every curve point with the indexes of its two
+    # off-curve points and the preceding on-curve point, or None if
+    # MathGlyph would restructure a contour.
+    offCurve = pointTypeCodes.index("offcurve")
+    line = pointTypeCodes.index("line")
+    curve = pointTypeCodes.index("curve")
+    curves = []
+    start = 0
+    for end in contourEnds:
+        types = pointTypes[start : end + 1]
+        count = len(types)
+        if types[0] == offCurve and any(types):
+            return None
+        for index, pointType in enumerate(types):
+            if pointType == line:
+                if types[index - 1] == offCurve:
+                    return None
+            elif pointType == curve:
+                if (
+                    types[index - 1] != offCurve
+                    or types[index - 2] != offCurve
+                    or types[index - 3] == offCurve
+                ):
+                    return None
+                curves.append(
+                    (
+                        start + index,
+                        start + (index - 2) % count,
+                        start + (index - 1) % count,
+                        start + (index - 3) % count,
+                    )
+                )
+        start = end + 1
+    return curves
+
+
+def _subtractValues(values1: array, values2: array) -> array:
+    # Subtract the values of one array from another.
+    if numpy is not None and values1:
+        result = array("d", values1)
+        numpy.frombuffer(result, dtype=numpy.float64)[:] -= numpy.frombuffer(
+            values2, dtype=numpy.float64
+        )
+        return result
+    return array("d", [value1 - value2 for value1, value2 in zip(values1, values2)])
+
+
+def _addScaledValues(values: array, deltas: array, factors: tuple[float, ...]) -> array:
+    # Add deltas multiplied by factors to interleaved columns of values,
+    # using one factor for each column.
+    result = array("d", values)
+    if not values:
+        return result
+    columns = len(factors)
+    if numpy is not None:
+        first = numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, columns)
+        delta = numpy.frombuffer(deltas, dtype=numpy.float64).reshape(-1, columns)
+        scaled = numpy.frombuffer(result, dtype=numpy.float64).reshape(-1, columns)
+        scaled[:] = first + delta * numpy.array(factors)
+        return result
+    for column, factor in enumerate(factors):
+        result[column::columns] = array(
+            "d",
+            [
+                value + delta * factor
+                for value, delta in zip(
+                    values[column::columns], deltas[column::columns]
+                )
+            ],
+        )
+    return result
+
+
+def _combineValues(valueLists: list[array], weights: tuple[list[float], ...]) -> array:
+    # Sum interleaved columns of values multiplied by their weights,
+    # using one list of weights, with one weight per value list, for
+    # each column.
+    columns = len(weights)
+    result = array("d", bytes(len(valueLists[0]) * 8))
+    if not result:
+        return result
+    if numpy is not None:
+        combined = numpy.frombuffer(result, dtype=numpy.float64).reshape(-1, columns)
+        for index, values in enumerate(valueLists):
+            factors = numpy.array([column[index] for column in weights])
+            combined += (
+                numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, columns)
+                * factors
+            )
+        return result
+    for column, columnWeights in enumerate(weights):
+        sums = [0.0] * (len(result) // columns)
+        for values, weight in zip(valueLists, columnWeights):
+            sums = [
+                total + value * weight
+                for total, value in zip(sums, values[column::columns])
+            ]
+        result[column::columns] = array("d", sums)
+    return result
+
+
+# --------
+# Polygons
+# --------
+
+#: The maximum distance between a curve and the line segments
+#: approximating it in a :class:`PolygonPen`.
+flattenTolerance: float = 0.05
+
+
+class PolygonPen(BasePen):
+    """Flatten the contours drawn into it to polygons.
+
+    Curves are approximated by as many line segments as needed to keep
+    them within `tolerance` of the curve. Every contour becomes one
+    polygon, which is implicitly closed. Components are ignored.
+
+    :param tolerance: The maximum distance between a curve and its
+        line segments.
+
+    """
+
+    def __init__(self, tolerance: float = flattenTolerance) -> None:
+        super().__init__(glyphSet=None)
+        self.tolerance = tolerance
+        self.polygons: list[array] = []
+
+    def _moveTo(self, pt: tuple[float, float]) -> None:
+        self.polygons.append(array("d", pt))
+
+    def _lineTo(self, pt: tuple[float, float]) -> None:
+        self.polygons[-1].extend(pt)
+
+    def _curveToOne(
+        self,
+        pt1: tuple[float, float],
+        pt2: tuple[float, float],
+        pt3: tuple[float, float],
+    ) -> None:
+        x0, y0 = self._getCurrentPoint()
+        x1, y1 = pt1
+        x2, y2 = pt2
+        x3, y3 = pt3
+        # Wang's formula gives the number of steps that keeps the
+        # line segments within the tolerance of the curve.
+        deviation = max(
+            hypot(x0 - 2 * x1 + x2, y0 - 2 * y1 + y2),
+            hypot(x1 - 2 * x2 + x3, y1 - 2 * y2 + y3),
+        )
+        steps = max(1, ceil(sqrt(0.75 * deviation / self.tolerance)))
+        polygon = self.polygons[-1]
+        for step in range(1, steps):
+            t = step / steps
+            s = 1 - t
+            a = s * s * s
+            b = 3 * s * s * t
+            c = 3 * s * t * t
+            d = t * t * t
+            polygon.append(a * x0 + b * x1 + c * x2 + d * x3)
+            polygon.append(a * y0 + b * y1 + c * y2 + d * y3)
+        polygon.extend(pt3)
+
+    def _closePath(self) -> None:
+        pass
+
+    def _endPath(self) -> None:
+        pass
+
+
+def pointsInsidePolygons(polygons: list[array], values: array) -> list[bool]:
+    """Check which points lie inside the filled area of polygons.
+
+    The polygons are filled with the non-zero winding rule, like
+    :class:`fontTools.pens.pointInsidePen.PointInsidePen` does.
+
+    :param polygons: A :class:`list` of polygons as collected by a
+        :class:`PolygonPen`.
+    :param values: An :class:`array.array` of ``"d"`` values holding
+        the ``x`` and ``y`` value of every point in turn.
+    :return: A :class:`list` holding :obj:`True` for every point
+        inside the filled area and :obj:`False` otherwise.
+
+    """
+    count = len(values) // 2
+    if numpy is not None:
+        return _pointsInsidePolygonsNumPy(polygons, values, count)
+    xs = values[::2]
+    ys = values[1::2]
+    order = sorted(range(count), key=ys.__getitem__)
+    sortedYs = [ys[index] for index in order]
+    windings = [0] * count
+    for polygon in polygons:
+        length = len(polygon)
+        for index in range(0, length, 2):
+            x1 = polygon[index]
+            y1 = polygon[index + 1]
+            x2 = polygon[(index + 2) % length]
+            y2 = polygon[(index + 3) % length]
+            if y1 == y2:
+                continue
+            # An edge crosses the horizontal ray of every point whose
+            # y value lies between the y values of its ends, with the
+            # lower end excluded.
+            if y1 < y2:
+                low, high, direction = y1, y2, 1
+            else:
+                low, high, direction = y2, y1, -1
+            dx = x2 - x1
+            dy = y2 - y1
+            start = bisect_right(sortedYs, low)
+            end = bisect_right(sortedYs, high, start)
+            for pointIndex in order[start:end]:
+                t = (ys[pointIndex] - y1) / dy
+                if dx * t + x1 >= xs[pointIndex]:
+                    windings[pointIndex] += direction
+    return [winding != 0 for winding in windings]
+
+
+def _pointsInsidePolygonsNumPy(
+    polygons: list[array], values: array, count: int
+) -> list[bool]:
+    points = numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, 2)
+    edges = [
+        numpy.frombuffer(polygon, dtype=numpy.float64).reshape(-1, 2)
+        for polygon in polygons
+        if polygon
+    ]
+    windings = numpy.zeros(count, dtype=numpy.int64)
+    if not edges or not count:
+        return windings.astype(bool).tolist()
+    starts = numpy.concatenate(edges)
+    ends = numpy.concatenate([numpy.roll(edge, -1, axis=0) for edge in edges])
+    sloped = starts[:, 1] != ends[:, 1]
+    x1, y1 = starts[sloped].T
+    x2, y2 = ends[sloped].T
+    dx = x2 - x1
+    dy = y2 - y1
+    directions = numpy.where(dy > 0, 1, -1)
+    # Compare the points against all edges in chunks to limit memory.
+    chunk = max(1, 1000000 // max(1, len(x1)))
+    for start in range(0, count, chunk):
+        x = points[start : start + chunk, 0:1]
+        y = points[start : start + chunk, 1:2]
+        crossing = (y1 < y) != (y2 < y)
+        t = (y - y1) / dy
+        crossing &= dx * t + x1 >= x
+        windings[start : start + chunk] = (crossing * directions).sum(axis=1)
+    return (windings != 0).tolist()
+
+
+def polygonArea(polygon: array) -> float:
+    """Get the area enclosed by a polygon.
+
+    :param polygon: A polygon as collected by a :class:`PolygonPen`.
+    :return: The area as a :class:`float`. It is positive for
+        counter-clockwise polygons and negative for clockwise ones.
+
+    """
+    xs = polygon[::2]
+    ys = polygon[1::2]
+    if not xs:
+        return 0.0
+    area = xs[-1] * ys[0] - xs[0] * ys[-1]
+    area += sum(x1 * y2 - x2 * y1 for x1, y1, x2, y2 in zip(xs, ys, xs[1:], ys[1:]))
+    return area / 2
+
+
+def polygonBounds(polygon: array) -> tuple[float, float, float, float] | None:
+    """Get the bounding box of a polygon.
+
+    :param polygon: A polygon as collected by a :class:`PolygonPen`.
+    :return: A :class:`tuple` of ``xMin``, ``yMin``, ``xMax`` and
+        ``yMax``, or :obj:`None` if the polygon is empty.
+
+    """
+    if not polygon:
+        return None
+    xs = polygon[::2]
+    ys = polygon[1::2]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def polygonInside(inner: array, outer: array) -> bool:
+    """Check if every point of `inner` lies inside the filled area of `outer`.
+
+    :param inner: A polygon as collected by a :class:`PolygonPen`.
+    :param outer: A polygon as collected by a :class:`PolygonPen`.
+    :return: :obj:`True` if `inner` lies inside `outer`, :obj:`False`
+        otherwise or if either polygon is empty.
+
+    """
+    innerBounds = polygonBounds(inner)
+    outerBounds = polygonBounds(outer)
+    if innerBounds is None or outerBounds is None:
+        return False
+    if not _boundsInside(innerBounds, outerBounds):
+        return False
+    return all(pointsInsidePolygons([outer], inner))
+
+
+def polygonHierarchy(polygons: list[array]) -> list[int | None]:
+    """Find the polygon that immediately contains each polygon.
+
+    A polygon can only lie inside a polygon with a larger area. Of two
+    polygons with the same area, the later one is considered to be
+    inside the earlier one if their points allow it.
+
+    :param polygons: A :class:`list` of polygons as collected by a
+        :class:`PolygonPen`.
+    :return: A :class:`list` holding, for every polygon, the index of
+        the smallest polygon that contains it, or :obj:`None` if no
+        polygon contains it.
+
+    """
+    bounds = [polygonBounds(polygon) for polygon in polygons]
+    order = sorted(
+        range(len(polygons)), key=lambda index: -abs(polygonArea(polygons[index]))
+    )
+    parents: list[int | None] = [None] * len(polygons)
+    for position, index in enumerate(order):
+        innerBounds = bounds[index]
+        if innerBounds is None:
+            continue
+        # Try the smallest candidates first, the first one containing
+        # the polygon is its parent.
+        for candidate in reversed(order[:position]):
+            outerBounds = bounds[candidate]
+            if outerBounds is None or not _boundsInside(innerBounds, outerBounds):
+                continue
+            if all(pointsInsidePolygons([polygons[candidate]], polygons[index])):
+                parents[index] = candidate
+                break
+    return parents
+
+
+def polygonDepths(polygons: list[array]) -> list[int]:
+    """Count the polygons that contain each polygon.
+
+    Unlike the parent chain of :func:`polygonHierarchy`, every
+    containing polygon is counted, also when overlapping polygons
+    contain each other only partially.
+
+    :param polygons: A :class:`list` of polygons as collected by a
+        :class:`PolygonPen`.
+    :return: A :class:`list` holding, for every polygon, the number of
+        other polygons that contain it.
+
+    """
+    bounds = [polygonBounds(polygon) for polygon in polygons]
+    order = sorted(
+        range(len(polygons)), key=lambda index: -abs(polygonArea(polygons[index]))
+    )
+    depths = [0] * len(polygons)
+    for position, index in enumerate(order):
+        innerBounds = bounds[index]
+        if innerBounds is None:
+            continue
+        for candidate in order[:position]:
+            outerBounds = bounds[candidate]
+            if outerBounds is None or not _boundsInside(innerBounds, outerBounds):
+                continue
+            if all(pointsInsidePolygons([polygons[candidate]], polygons[index])):
+                depths[index] += 1
+    return depths
+
+
+def _boundsInside(
+    inner: tuple[float, float, float, float], outer: tuple[float, float, float, float]
+) -> bool:
+    return (
+        inner[0] >= outer[0]
+        and inner[1] >= outer[1]
+        and inner[2] <= outer[2]
+        and inner[3] <= outer[3]
+    )
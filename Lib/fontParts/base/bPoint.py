@@ -39,6 +39,14 @@ class BaseBPoint(
 ):
     """Represent the basis for a bPoint object."""
 
+    # Compact environment subclasses provide the _contour, _point and
+    # _segments slots. They can't be declared here at runtime, because
+    # the environment's own base class usually holds slots as well.
+    if TYPE_CHECKING:
+        __slots__ = ("_contour", "_point", "_segments")
+    else:
+        __slots__ = ()
+
     def _reprContents(self) -> list[str]:
         contents = [f"{self.type}", f"anchor='({self.anchor[0]}, {self.anchor[1]})'"]
         return contents
@@ -101,25 +109,51 @@ class BaseBPoint(
     _segment: dynamicProperty = dynamicProperty("base_segment")
 
     def _get_base_segment(self) -> BaseSegment | None:
-        point = self._point
-        for segment in self.contour.segments:
-            if segment.onCurve == point:
-                return segment
-        return None
+        segments = self._getSegments()
+        if segments is None:
+            return None
+        return segments[0]
 
     _nextSegment: dynamicProperty = dynamicProperty("base_nextSegment")
 
     def _get_base_nextSegment(self) -> BaseSegment | None:
+        segments = self._getSegments()
+        if segments is None:
+            return None
+        return segments[1]
+
+    _segments: tuple[BaseSegment, BaseSegment] | None
+
+    def _setSegments(self, segment: BaseSegment, nextSegment: BaseSegment) -> None:
+        try:
+            self._segments = (segment, nextSegment)
+        except AttributeError:
+            # the environment doesn't store resolved segments
+            pass
+
+    def _getSegments(self) -> tuple[BaseSegment, BaseSegment] | None:
         contour = self.contour
         if contour is None:
             return None
-        segments = contour.segments
-        segment = self._segment
-        i = segments.index(segment) + 1
-        if i >= len(segments):
-            i = i % len(segments)
-        nextSegment = segments[i]
-        return nextSegment
+        segments = getattr(self, "_segments", None)
+        if segments is not None:
+            # segments resolved earlier are reused as long as they
+            # still are adjacent segments of the contour
+            segment, nextSegment = segments
+            span = contour._getSegmentSpan(segment)
+            if span is not None and segment.onCurve == self._point:
+                nextSpan = contour._getSegmentSpan(nextSegment)
+                count = contour._len__points()
+                if nextSpan is not None and nextSpan[0] == (span[1] + 1) % count:
+                    return segments
+        point = self._point
+        allSegments = contour.segments
+        for index, segment in enumerate(allSegments):
+            if segment.onCurve == point:
+                nextSegment = allSegments[(index + 1) % len(allSegments)]
+                self._setSegments(segment, nextSegment)
+                return segment, nextSegment
+        return None
 
     # Contour
 
@@ -608,7 +642,7 @@ class BaseBPoint(
 
         """
         contour = self.contour
-        value = contour.bPoints.index(self)
+        value = contour._getBPointIndex(self)
         return value
 
     # --------------
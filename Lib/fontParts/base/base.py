@@ -3,6 +3,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, NoReturn, TypeVar
 from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import deepcopy
 import math
 from collections.abc import MutableMapping
@@ -123,15 +125,14 @@ class dynamicProperty:
         self.setterName = "_set_" + name
 
     def __get__(self, obj: Any, cls: type[Any]) -> Any:
+        # obj is None when the property is accessed
+        # via the class instead of an instance
+        if obj is None:
+            return self
         getter = getattr(obj, self.getterName, None)
         if getter is not None:
             return getter()
-        else:
-            # obj is None when the property is accessed
-            # via the class instead of an instance
-            if obj is None:
-                return self
-            raise FontPartsError(f"no getter for {self.name!r}")
+        raise FontPartsError(f"no getter for {self.name!r}")
 
     def __set__(self, obj: Any, value: Any) -> None:
         setter = getattr(obj, self.setterName, None)
@@ -174,6 +175,78 @@ def interpolate(
         ) from exc
 
 
+_trustedMode: ContextVar[bool] = ContextVar("trustedMode", default=False)
+
+
+@contextmanager
+def trustedMode() -> Iterator[None]:
+    """Mark data passed around inside the block as produced by fontParts.
+
+    Bulk operations such as interpolation pass values from one fontParts
+    object to another. Those values have already been normalized when
+    they were read, so internal code running inside this block may hand
+    them straight to the environment methods (``_appendAnchor``,
+    ``_set_width``, ...) instead of going through the public, validating
+    API again. Public methods called by scripters validate as usual.
+
+    Example::
+
+        >>> with trustedMode():
+        ...     glyph._fromMathGlyph(mathGlyph, toThisGlyph=True,
+        ...                          filterRedundantPoints=True)
+
+    """
+    token = _trustedMode.set(True)
+    try:
+        yield
+    finally:
+        _trustedMode.reset(token)
+
+
+def isTrustedMode() -> bool:
+    """Return :obj:`True` if the caller is running inside :func:`trustedMode`."""
+    return _trustedMode.get()
+
+
+# -------------
+# Index Lookups
+# -------------
+
+
+def lookupIndex(
+    parent: Any, cacheName: str, item: Any, getItem: Callable[[int], Any], count: int
+) -> int | None:
+    """Get the index of `item` among the `count` children of `parent`.
+
+    A map from child to index is stored on `parent` under `cacheName`.
+    A mapped index is only returned after `getItem` has confirmed that
+    `item` is still at that position, so the map can never return a
+    stale index and doesn't have to be invalidated when the children
+    change. It is rebuilt when a lookup misses. Repeated lookups on an
+    unchanged parent therefore take constant time.
+
+    :param parent: The object the children belong to.
+    :param cacheName: The name of the attribute the map is stored in.
+    :param item: The child to look up. Children must be hashable and
+        compare equal when they represent the same native object.
+    :param getItem: A function returning the child at an index.
+    :param count: The number of children.
+    :return: The index as an :class:`int`, or :obj:`None` if `item` is
+        not a child of `parent`.
+
+    """
+    indexes = getattr(parent, cacheName, None)
+    if indexes is not None:
+        index = indexes.get(item)
+        if index is not None and index < count and getItem(index) == item:
+            return index
+    indexes = {}
+    for index in range(count):
+        indexes.setdefault(getItem(index), index)
+    setattr(parent, cacheName, indexes)
+    return indexes.get(item)
+
+
 # ------------
 # Base Objects
 # ------------
@@ -197,6 +270,8 @@ class BaseObject(Generic[BaseObjectType]):
 
     """
 
+    __slots__ = ()
+
     # --------------
     # Initialization
     # --------------
@@ -959,7 +1034,7 @@ class BaseDict(BaseObject, Generic[KeyType, ValueType]):
 
         """
         for key, value in other.items():
-            self[key] = value
+            self._setItem(key, value)
 
     def clear(self) -> None:
         """Remove all items from the object."""
@@ -976,12 +1051,14 @@ class BaseDict(BaseObject, Generic[KeyType, ValueType]):
 
         """
         for key in self.keys():
-            del self[key]
+            self._delItem(key)
 
 
 class TransformationMixin(ABC):
     """Provide objects transformation-related functionality."""
 
+    __slots__ = ()
+
     # ---------------
     # Transformations
     # ---------------
@@ -1234,6 +1311,8 @@ class InterpolationMixin(ABC):
 
     """
 
+    __slots__ = ()
+
     # -------------
     # Compatibility
     # -------------
@@ -1291,6 +1370,8 @@ class InterpolationMixin(ABC):
 class SelectionMixin(ABC):
     """Provide objects with selection-related functionality."""
 
+    __slots__ = ()
+
     # -------------
     # Selected Flag
     # -------------
@@ -1388,6 +1469,8 @@ class PointPositionMixin(ABC):
 
     """
 
+    __slots__ = ()
+
     position: dynamicProperty = dynamicProperty(
         "base_position",
         """Get or set the point position of the object.
@@ -1498,6 +1581,8 @@ class PointPositionMixin(ABC):
 class IdentifierMixin(ABC):
     """Provide objects with a unique identifier."""
 
+    __slots__ = ()
+
     # identifier
 
     identifier: dynamicProperty = dynamicProperty(
@@ -461,7 +461,10 @@ class BaseComponent(
 
         """
         glyph = self.glyph
-        return glyph.components.index(self)
+        try:
+            return glyph._getComponentIndex(self)
+        except FontPartsError:
+            raise ValueError(f"{self!r} is not in the glyph.")
 
     def _set_index(self, value: int) -> None:
         """Set the index of the native contour.
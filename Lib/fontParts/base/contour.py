@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, cast, Any, TypeVar
-from collections.abc import Callable, Iterator
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext
 
 from fontParts.base.errors import FontPartsError
 from fontParts.base.base import (
@@ -10,9 +12,18 @@ from fontParts.base.base import (
     SelectionMixin,
     IdentifierMixin,
     dynamicProperty,
+    lookupIndex,
     reference,
 )
 from fontParts.base import normalizers
+from fontParts.base.arrays import (
+    CoordinateArray,
+    PolygonPen,
+    makeCoordinateArray,
+    pointsInsidePolygons,
+    polygonInside,
+    transformCoordinates,
+)
 from fontParts.base.bounds import Bounds
 from fontParts.base.compatibility import ContourCompatibilityReporter
 from fontParts.base.deprecated import DeprecatedContour, RemovedContour
@@ -239,7 +250,10 @@ class BaseContour(
 
         """
         glyph = self.glyph
-        return glyph.contours.index(self)
+        try:
+            return glyph._getContourIndex(self)
+        except FontPartsError:
+            raise ValueError(f"{self!r} is not in the glyph.")
 
     def _set_index(self, value: int) -> None:
         """Set the index of the contour.
@@ -464,11 +478,13 @@ class BaseContour(
 
         .. note::
 
-            Subclasses may override this method.
+            Subclasses may override this method. The default
+            transforms the values returned by :meth:`_get_coordinates`
+            in one operation and hands them to :meth:`_set_coordinates`,
+            so subclasses overriding those don't need to override this.
 
         """
-        for point in self.points:
-            point.transformBy(matrix)
+        self._set_coordinates(transformCoordinates(self._get_coordinates(), matrix))
 
     # -------------
     # Interpolation
@@ -720,6 +736,108 @@ class BaseContour(
         self.draw(pen)
         return pen.getResult()
 
+    def pointsInside(self, points: Any) -> tuple[bool, ...]:
+        """Check which of `points` are within the filled area of the contour.
+
+        This gives the same answers as calling :meth:`pointInside` for
+        every point, but the contour is only flattened once and the
+        flattened contour is reused for as long as the contour doesn't
+        change. Curves are flattened to within
+        :data:`fontParts.base.arrays.flattenTolerance` units, so points
+        closer than that to a curve may be answered differently.
+
+        :param points: The points to check as an array of shape
+            ``(N, 2)`` or a sequence of :ref:`type-coordinate` items.
+        :return: A :class:`tuple` holding :obj:`True` for every point
+            inside the filled area of the contour and :obj:`False`
+            otherwise.
+
+        Example::
+
+            >>> contour.pointsInside([(40, 65), (1000, 1000)])
+            (True, False)
+
+        """
+        coordinates = normalizers.normalizeCoordinateArray(points)
+        return self._pointsInside(coordinates)
+
+    def _pointsInside(self, coordinates: array) -> tuple[bool, ...]:
+        """Check which points are within the filled area of the native contour.
+
+        This is the environment implementation of
+        :meth:`BaseContour.pointsInside`.
+
+        :param coordinates: The points to check as an :class:`array.array`
+            of ``"d"`` values holding ``x`` and ``y`` in turn. The value will
+            have been normalized with
+            :func:`normalizers.normalizeCoordinateArray`.
+        :return: A :class:`tuple` of :class:`bool` values.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return tuple(pointsInsidePolygons([self._getPolygon()], coordinates))
+
+    def _getPolygon(self) -> array:
+        """Get the native contour flattened to a polygon.
+
+        The polygon is cached with the key returned by
+        :meth:`_getPolygonKey` and reused for as long as the key stays
+        equal.
+
+        :return: An :class:`array.array` of ``"d"`` values holding the
+            ``x`` and ``y`` value of every polygon point in turn.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        key = self._getPolygonKey()
+        if key is not None:
+            cache = getattr(self, "_polygonCache", None)
+            if cache is not None and cache[0] == key:
+                return cache[1]
+        polygon = self._buildPolygon()
+        if key is not None:
+            self._polygonCache = (key, polygon)
+        return polygon
+
+    def _buildPolygon(self) -> array:
+        """Flatten the native contour to a polygon.
+
+        :return: An :class:`array.array` of ``"d"`` values as returned by
+            :meth:`_getPolygon`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        pen = PolygonPen()
+        self.draw(pen)
+        return pen.polygons[0] if pen.polygons else array("d")
+
+    def _getPolygonKey(self) -> Any:
+        """Get a key describing the outline of the native contour.
+
+        The polygon built by :meth:`_getPolygon` is cached with this key.
+        The key must therefore change whenever the outline changes,
+        including changes of coordinates.
+
+        :return: A key that can be compared with ``==``, or :obj:`None`
+            to disable caching. The base implementation returns
+            :obj:`None`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return None
+
     def contourInside(self, otherContour: BaseContour) -> bool:
         """Check if `otherContour` is within the current contour's filled area.
 
@@ -745,15 +863,17 @@ class BaseContour(
             been normalized with :func:`normalizers.normalizeContour`.
         :return: :obj:`True` if `otherContour` is inside the filled area of the
             current contour instance, :obj:`False` otherwise.
-        :raises NotImplementedError: If the method has not been overridden by a
-            subclass.
 
-        .. important::
+        The base implementation checks every point of the flattened
+        `otherContour` against the flattened contour. Both are taken from
+        the cache used by :meth:`BaseContour.pointsInside`.
 
-            Subclasses must override this method.
+        .. note::
+
+            Subclasses may override this method.
 
         """
-        self.raiseNotImplementedError()
+        return polygonInside(otherContour._getPolygon(), self._getPolygon())
 
     # ---------------
     # Bounds and Area
@@ -893,6 +1013,37 @@ class BaseContour(
             Subclasses may override this method.
 
         """
+        key = self._getSegmentStructureKey()
+        if key is not None:
+            cache = getattr(self, "_segmentCache", None)
+            if cache is not None and cache[0] == key:
+                return cache[1]
+        segments = self._buildSegments()
+        if key is not None:
+            self._segmentCache = (key, segments)
+        return segments
+
+    def _getSegmentStructureKey(self) -> Any:
+        """Get a key describing the structure of the native contour.
+
+        The segments built by :meth:`_get_segments` are cached with this
+        key and reused for as long as the key stays equal. The key must
+        therefore change whenever a point is added, removed or reordered,
+        or when the type of a point changes. Coordinate changes don't
+        need to change the key, because segments read their points live.
+
+        :return: A key that can be compared with ``==``, or :obj:`None`
+            to disable caching. The base implementation returns
+            :obj:`None`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return None
+
+    def _buildSegments(self) -> tuple[BaseSegment, ...]:
         points = self.points
         if not points:
             return ()
@@ -982,6 +1133,60 @@ class BaseContour(
         """
         return len(self.segments)
 
+    def _getStructureIndexes(
+        self,
+    ) -> tuple[tuple[BaseSegment, ...], dict[int, int], dict[BasePoint, int]]:
+        # Segment and bPoint indexes depend only on the structure of
+        # the contour, so they are kept for as long as the segments
+        # are served from the segment cache.
+        segments = self.segments
+        cache = getattr(self, "_structureIndexes", None)
+        if cache is None or cache[0] is not segments:
+            segmentIndexes = {id(segment): i for i, segment in enumerate(segments)}
+            bPointIndexes: dict[BasePoint, int] = {}
+            for i in range(self._len__points()):
+                point = self._getPoint(i)
+                if point.type in ("move", "line", "curve"):
+                    bPointIndexes[point] = len(bPointIndexes)
+            cache = (segments, segmentIndexes, bPointIndexes)
+            self._structureIndexes = cache
+        return cache
+
+    def _getSegmentSpan(self, segment: BaseSegment) -> tuple[int, int] | None:
+        # Get the indexes of the first and last native point of
+        # segment if it still is a segment of this contour. Only the
+        # points of the segment and the point before it are looked
+        # at, so this doesn't depend on the size of the contour.
+        points = segment.points
+        count = self._len__points()
+        if not points or len(points) > count:
+            return None
+        try:
+            end = self._getPointIndex(points[-1])
+        except ValueError:
+            return None
+        start = end - len(points) + 1
+        isOpen = self._getPoint(0).type == "move"
+        if isOpen and start < 0:
+            return None
+        last = len(points) - 1
+        for offset, point in enumerate(points):
+            other = self._getPoint((start + offset) % count)
+            if other != point or (other.type == "offcurve") != (offset < last):
+                return None
+        if not (isOpen and start == 0):
+            previous = self._getPoint((start - 1) % count)
+            if previous.type == "offcurve":
+                return None
+        return start, end
+
+    def _getSegmentIndex(self, segment: BaseSegment) -> int:
+        segments, indexes, _ = self._getStructureIndexes()
+        index = indexes.get(id(segment))
+        if index is not None and segments[index] is segment:
+            return index
+        return segments.index(segment)
+
     def appendSegment(
         self,
         type: str | None = None,
@@ -1271,6 +1476,15 @@ class BaseContour(
     )
 
     def _get_bPoints(self) -> tuple[BaseBPoint, ...]:
+        # resolve the segment and the next segment of every bPoint
+        # in one pass, so that reading the handles of all bPoints
+        # doesn't have to resolve the segments again for each one
+        segments = self.segments
+        segmentIndexes: dict[BasePoint, int] = {}
+        for index, segment in enumerate(segments):
+            onCurve = segment.onCurve
+            if onCurve is not None:
+                segmentIndexes[onCurve] = index
         bPoints: list[BaseBPoint] = []
         for point in self.points:
             if point.type not in ("move", "line", "curve"):
@@ -1280,9 +1494,20 @@ class BaseContour(
             bPoint = self.bPointClass()
             bPoint.contour = self
             bPoint._setPoint(point)
+            segmentIndex = segmentIndexes.get(point)
+            if segmentIndex is not None:
+                nextSegment = segments[(segmentIndex + 1) % len(segments)]
+                bPoint._setSegments(segments[segmentIndex], nextSegment)
             bPoints.append(bPoint)
         return tuple(bPoints)
 
+    def _getBPointIndex(self, bPoint: BaseBPoint) -> int:
+        _, _, indexes = self._getStructureIndexes()
+        index = indexes.get(bPoint._point)
+        if index is None:
+            raise ValueError(f"{bPoint!r} is not in the contour.")
+        return index
+
     def appendBPoint(
         self,
         type: str | None = None,
@@ -1524,6 +1749,163 @@ class BaseContour(
 
         self.removePoint(bPoint._point)
 
+    # -----------
+    # Coordinates
+    # -----------
+
+    coordinates: dynamicProperty = dynamicProperty(
+        "base_coordinates",
+        """Get or set the coordinates of all points in the contour.
+
+        The coordinates are handed out as one buffer instead of one
+        :class:`BasePoint` per point, which makes them suitable for
+        numerical work. The value is an array of shape ``(N, 2)``, where
+        ``N`` is the number of points. It is a NumPy array if NumPy is
+        installed and a :class:`memoryview` otherwise. Either way it is
+        a copy, so changes to it only reach the contour when it is
+        assigned back.
+
+        The value to set must have the same shape and may be a NumPy
+        array, a :class:`memoryview` or a sequence of coordinate pairs.
+        The points are updated in one operation with a single change
+        notification.
+
+        :raises ValueError: If the number of coordinates to set doesn't
+            match the number of points.
+
+        Example::
+
+            >>> coordinates = contour.coordinates
+            >>> coordinates[:, 0] += 10
+            >>> contour.coordinates = coordinates
+
+        """,
+    )
+
+    def _get_base_coordinates(self) -> CoordinateArray:
+        return makeCoordinateArray(self._get_coordinates())
+
+    def _set_base_coordinates(self, value: Any) -> None:
+        values = normalizers.normalizeCoordinateArray(value)
+        count = self._len__points()
+        if len(values) != count * 2:
+            raise ValueError(f"Expected {count} coordinates, not {len(values) // 2}.")
+        self._set_coordinates(values)
+
+    def _get_coordinates(self) -> array:
+        """Get the coordinates of all points in the native contour.
+
+        This is the environment implementation of the
+        :attr:`BaseContour.coordinates` property getter.
+
+        :return: A flat :class:`array.array` of ``"d"`` values holding
+            the ``x`` and ``y`` value of every point in turn.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        values = array("d")
+        for point in self.points:
+            values.append(point.x)
+            values.append(point.y)
+        return values
+
+    def _set_coordinates(self, value: array) -> None:
+        """Set the coordinates of all points in the native contour.
+
+        This is the environment implementation of the
+        :attr:`BaseContour.coordinates` property setter.
+
+        :param value: A flat :class:`array.array` of ``"d"`` values
+            holding the ``x`` and ``y`` value of every point in turn.
+            The value will have been normalized with
+            :func:`normalizers.normalizeCoordinateArray` and holds
+            exactly one pair per point.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        glyph = self.glyph
+        with glyph.holdChanges() if glyph is not None else nullcontext():
+            for index, point in enumerate(self.points):
+                point.x = value[index * 2]
+                point.y = value[index * 2 + 1]
+
+    pointTypes: dynamicProperty = dynamicProperty(
+        "base_pointTypes",
+        """Get the types of all points in the contour.
+
+        This property is read-only.
+
+        :return: A :class:`tuple` of :class:`str` in the same order as
+            :attr:`coordinates`. See :attr:`BasePoint.type` for the
+            possible values.
+
+        Example::
+
+            >>> contour.pointTypes
+            ('line', 'offcurve', 'offcurve', 'curve')
+
+        """,
+    )
+
+    def _get_base_pointTypes(self) -> tuple[str, ...]:
+        return tuple(self._get_pointTypes())
+
+    def _get_pointTypes(self) -> tuple[str, ...]:
+        """Get the types of all points in the native contour.
+
+        This is the environment implementation of the
+        :attr:`BaseContour.pointTypes` property getter.
+
+        :return: A :class:`tuple` of point types as :class:`str`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return tuple(point.type for point in self.points)
+
+    smoothFlags: dynamicProperty = dynamicProperty(
+        "base_smoothFlags",
+        """Get the smooth state of all points in the contour.
+
+        This property is read-only.
+
+        :return: A :class:`tuple` of :class:`bool` in the same order as
+            :attr:`coordinates`.
+
+        Example::
+
+            >>> contour.smoothFlags
+            (False, False, False, True)
+
+        """,
+    )
+
+    def _get_base_smoothFlags(self) -> tuple[bool, ...]:
+        return tuple(bool(value) for value in self._get_smoothFlags())
+
+    def _get_smoothFlags(self) -> tuple[bool, ...]:
+        """Get the smooth state of all points in the native contour.
+
+        This is the environment implementation of the
+        :attr:`BaseContour.smoothFlags` property getter.
+
+        :return: A :class:`tuple` of :class:`bool`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return tuple(point.smooth for point in self.points)
+
     # ------
     # Points
     # ------
@@ -1600,10 +1982,12 @@ class BaseContour(
         self.raiseNotImplementedError()
 
     def _getPointIndex(self, point: BasePoint) -> int:
-        for i, other in enumerate(self.points):
-            if point == other:
-                return i
-        raise FontPartsError("The point could not be found.")
+        index = lookupIndex(
+            self, "_pointIndexes", point, self._getPoint, self._len__points()
+        )
+        if index is None:
+            raise ValueError(f"{point!r} is not in the contour.")
+        return index
 
     def appendPoint(
         self,
@@ -1693,6 +2077,30 @@ class BaseContour(
             values will be copied. Defaults to :obj:`None`.
 
         """
+        normalizedIndex = normalizers.normalizeIndex(index)
+        if normalizedIndex is None:
+            raise TypeError("Index cannot be None.")
+        position, type, smooth, name, identifier = self._normalizePointData(
+            position, type, smooth, name, identifier, point
+        )
+        self._insertPoint(
+            normalizedIndex,
+            position=position,
+            type=type,
+            smooth=smooth,
+            name=name,
+            identifier=identifier,
+        )
+
+    @staticmethod
+    def _normalizePointData(
+        position: CoordinateLike | None,
+        type: str | None,
+        smooth: bool,
+        name: str | None,
+        identifier: str | None,
+        point: BasePoint | None,
+    ) -> tuple[CoordinateLike, str, bool, str | None, str | None]:
         if point is not None:
             if position is None:
                 position = point.position
@@ -1703,9 +2111,6 @@ class BaseContour(
                 name = point.name
             if identifier is None:
                 identifier = point.identifier
-        normalizedIndex = normalizers.normalizeIndex(index)
-        if normalizedIndex is None:
-            raise TypeError("Index cannot be None.")
         if position is None:
             raise TypeError("Position cannot be None.")
         position = normalizers.normalizeCoordinateTuple(position)
@@ -1716,14 +2121,7 @@ class BaseContour(
             name = normalizers.normalizePointName(name)
         if identifier is not None:
             identifier = normalizers.normalizeIdentifier(identifier)
-        self._insertPoint(
-            normalizedIndex,
-            position=position,
-            type=type,
-            smooth=smooth,
-            name=name,
-            identifier=identifier,
-        )
+        return position, type, smooth, name, identifier
 
     def _insertPoint(
         self,
@@ -1789,7 +2187,10 @@ class BaseContour(
             >>> contour.removePoint(2, preserveCurve=True)
 
         """
-        index = self.points.index(point) if not isinstance(point, int) else point
+        if isinstance(point, int):
+            index = point
+        else:
+            index = self._getPointIndex(point)
         normalizedIndex = normalizers.normalizeIndex(index)
         # Avoid mypy conflict with normalizeIndex -> Optional[int]
         if normalizedIndex is None:  # pragma: no cover
@@ -1821,6 +2222,174 @@ class BaseContour(
         """
         self.raiseNotImplementedError()
 
+    def appendPoints(
+        self, points: Iterable[BasePoint | tuple[Any, ...] | list[Any]]
+    ) -> None:
+        """Append several points to the contour in one operation.
+
+        See :meth:`insertPoints` for the accepted items.
+
+        :param points: An iterable of points to append.
+
+        Example::
+
+            >>> contour.appendPoints([((0, 0), "line"), ((0, 100), "line")])
+
+        """
+        self.insertPoints(self._len__points(), points)
+
+    def insertPoints(
+        self, index: int, points: Iterable[BasePoint | tuple[Any, ...] | list[Any]]
+    ) -> None:
+        """Insert several points into the contour in one operation.
+
+        All points are normalized before the contour is changed, so an
+        invalid item leaves the contour untouched. Each item is either
+        a :class:`BasePoint` instance whose attributes are copied, or a
+        :class:`tuple` or :class:`list` holding the arguments of
+        :meth:`insertPoint` after `index` in order: ``(position, type,
+        smooth, name, identifier)``. Trailing items may be omitted and
+        `type` defaults to ``"line"``.
+
+        :param index: The index of the first inserted point as
+            an :class:`int`.
+        :param points: An iterable of points to insert.
+        :raises TypeError: If an item is neither a point nor a sequence.
+        :raises ValueError: If a sequence has no or more than five items.
+
+        Example::
+
+            >>> contour.insertPoints(2, [
+            ...     ((10, 20), "offcurve"),
+            ...     ((30, 40), "offcurve"),
+            ...     ((50, 50), "curve", True),
+            ... ])
+
+        """
+        normalizedIndex = normalizers.normalizeIndex(index)
+        if normalizedIndex is None:
+            raise TypeError("Index cannot be None.")
+        defaults = (None, None, False, None, None)
+        normalizedPoints = []
+        for item in points:
+            if isinstance(item, (tuple, list)):
+                if not 1 <= len(item) <= 5:
+                    raise ValueError(
+                        f"Point sequences must have 1 to 5 items, not {len(item)}."
+                    )
+                position, type, smooth, name, identifier = (
+                    tuple(item) + defaults[len(item) :]
+                )
+                data = self._normalizePointData(
+                    position, type, smooth, name, identifier, None
+                )
+            else:
+                point = normalizers.normalizePoint(item)
+                data = self._normalizePointData(None, None, False, None, None, point)
+            normalizedPoints.append(data)
+        if normalizedPoints:
+            self._insertPoints(normalizedIndex, normalizedPoints)
+
+    def _insertPoints(
+        self,
+        index: int,
+        points: list[tuple[CoordinateLike, str, bool, str | None, str | None]],
+        **kwargs: Any,
+    ) -> None:
+        r"""Insert several points into the native contour.
+
+        This is the environment implementation of
+        :meth:`BaseContour.insertPoints` and
+        :meth:`BaseContour.appendPoints`.
+
+        :param index: The index of the first inserted point as
+            an :class:`int`. The value will have been normalized
+            with :func:`normalizers.normalizeIndex`.
+        :param points: A :class:`list` of ``(position, type, smooth,
+            name, identifier)`` tuples, normalized as the arguments of
+            :meth:`_insertPoint` are. The list is never empty.
+        :param \**kwargs: Additional keyword arguments.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        glyph = self.glyph
+        with glyph.holdChanges() if glyph is not None else nullcontext():
+            for offset, (position, type, smooth, name, identifier) in enumerate(points):
+                self._insertPoint(
+                    index + offset,
+                    position=position,
+                    type=type,
+                    smooth=smooth,
+                    name=name,
+                    identifier=identifier,
+                )
+
+    def removePoints(
+        self, points: Iterable[BasePoint | int], preserveCurve: bool = False
+    ) -> None:
+        """Remove several points from the contour in one operation.
+
+        :param points: An iterable of points to remove as
+            :class:`BasePoint` instances or :class:`int` indexes.
+        :param preserveCurve: A :class:`bool` indicating whether to
+            preserve the curve's shape after each point is removed.
+            Defaults to :obj:`False`.
+        :raises ValueError: If a point index is out of range, a point is
+            not part of the contour or a point is given more than once.
+
+        Example::
+
+            >>> contour.removePoints([1, 2])
+            >>> contour.removePoints(selectedPoints, preserveCurve=True)
+
+        """
+        count = self._len__points()
+        indexes = set()
+        for point in points:
+            if isinstance(point, int):
+                index = normalizers.normalizeIndex(point)
+            else:
+                index = self._getPointIndex(point)
+            if index is None or not -count <= index < count:
+                raise ValueError(f"No point located at index {index}.")
+            index %= count
+            if index in indexes:
+                raise ValueError(f"The point at index {index} is given twice.")
+            indexes.add(index)
+        preserveCurve = normalizers.normalizeBoolean(preserveCurve)
+        if indexes:
+            self._removePoints(sorted(indexes), preserveCurve)
+
+    def _removePoints(
+        self, indexes: list[int], preserveCurve: bool, **kwargs: Any
+    ) -> None:
+        r"""Remove several points from the native contour.
+
+        This is the environment implementation of
+        :meth:`BaseContour.removePoints`.
+
+        :param indexes: The indexes of the points to remove as a sorted
+            :class:`list` of unique :class:`int` values in range. The
+            list is never empty.
+        :param preserveCurve: A :class:`bool` indicating whether to
+            preserve the curve's shape after each point is removed. The
+            value will have been normalized with
+            :func:`normalizers.normalizeBoolean`.
+        :param \**kwargs: Additional keyword arguments.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        glyph = self.glyph
+        with glyph.holdChanges() if glyph is not None else nullcontext():
+            for index in reversed(indexes):
+                self._removePoint(index, preserveCurve)
+
     def setStartPoint(self, point: BasePoint | int) -> None:
         """Set the first segment in the contour.
 
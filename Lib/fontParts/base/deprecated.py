@@ -14,12 +14,16 @@ class RemovedError(Exception):
 
 
 class RemovedBase:
+    __slots__ = ()
+
     def setParent(self, parent):
         objName = self.__class__.__name__.replace("Removed", "")
         raise RemovedError(f"'{objName}.setParent()'")
 
 
 class DeprecatedBase:
+    __slots__ = ()
+
     def update(self):
         objName = self.__class__.__name__.replace("Deprecated", "")
         warnings.warn(
@@ -41,6 +45,8 @@ class DeprecatedBase:
 
 
 class DeprecatedTransformation:
+    __slots__ = ()
+
     def move(self, *args, **kwargs):
         objName = self.__class__.__name__.replace("Deprecated", "")
         warnings.warn(f"'{objName}.move()': use {objName}.moveBy()", DeprecationWarning)
@@ -95,12 +101,16 @@ class DeprecatedTransformation:
 
 
 class RemovedPoint(RemovedBase):
+    __slots__ = ()
+
     @staticmethod
     def select(state=True):
         raise RemovedError("'Point.select'")
 
 
 class DeprecatedPoint(DeprecatedBase, DeprecatedTransformation):
+    __slots__ = ()
+
     def _generateIdentifier(self):
         warnings.warn(
             "'Point._generateIdentifier()': use 'Point._getIdentifier()'",
@@ -126,12 +136,16 @@ class DeprecatedPoint(DeprecatedBase, DeprecatedTransformation):
 
 
 class RemovedBPoint(RemovedBase):
+    __slots__ = ()
+
     @staticmethod
     def select(state=True):
         raise RemovedError("'BPoint.select'")
 
 
 class DeprecatedBPoint(DeprecatedBase, DeprecatedTransformation):
+    __slots__ = ()
+
     def _generateIdentifier(self):
         warnings.warn(
             "'BPoint._generateIdentifier()': use 'BPoint._getIdentifier()'",
@@ -157,6 +171,8 @@ class DeprecatedBPoint(DeprecatedBase, DeprecatedTransformation):
 
 
 class RemovedAnchor(RemovedBase):
+    __slots__ = ()
+
     @staticmethod
     def draw(pen):
         raise RemovedError("'Anchor.draw': UFO3 is not drawing anchors into pens")
@@ -169,6 +185,8 @@ class RemovedAnchor(RemovedBase):
 
 
 class DeprecatedAnchor(DeprecatedBase, DeprecatedTransformation):
+    __slots__ = ()
+
     def _generateIdentifier(self):
         warnings.warn(
             "'Anchor._generateIdentifier()': use 'Anchor._getIdentifier()'",
@@ -263,6 +281,8 @@ class DeprecatedComponent(DeprecatedBase):
 
 
 class RemovedSegment(RemovedBase):
+    __slots__ = ()
+
     @staticmethod
     def insertPoint(point):
         raise RemovedError("Segment.insertPoint()")
@@ -273,6 +293,8 @@ class RemovedSegment(RemovedBase):
 
 
 class DeprecatedSegment(DeprecatedBase, DeprecatedTransformation):
+    __slots__ = ()
+
     def getParent(self):
         warnings.warn(
             "'Segment.getParent()': use 'Segment.contour'", DeprecationWarning
@@ -412,10 +434,12 @@ class DeprecatedGlyph(DeprecatedBase, DeprecatedTransformation):
 
 
 class RemovedGuideline(RemovedBase):
-    pass
+    __slots__ = ()
 
 
 class DeprecatedGuideline(DeprecatedBase, DeprecatedTransformation):
+    __slots__ = ()
+
     def _generateIdentifier(self):
         warnings.warn(
             ("'Guideline._generateIdentifier()': use 'Guideline._getIdentifier()'"),
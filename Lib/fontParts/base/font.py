@@ -1,17 +1,19 @@
 # pylint: disable=C0103, W0613
 from __future__ import annotations
+from contextlib import AbstractContextManager, nullcontext
 import os
 from typing import TYPE_CHECKING, Any
 
 from fontTools import ufoLib
 from fontParts.base.errors import FontPartsError
-from fontParts.base.base import dynamicProperty, InterpolationMixin
+from fontParts.base.base import dynamicProperty, lookupIndex, InterpolationMixin
 from fontParts.base.layer import _BaseGlyphVendor
 from fontParts.base import normalizers
 from fontParts.base.compatibility import FontCompatibilityReporter
 from fontParts.base.deprecated import DeprecatedFont, RemovedFont
 from fontParts.base.annotations import (
     InterpolationFactorPair,
+    InterpolationFactor,
     InterpolationFactorLike,
     RGBALike,
     CoordinateLike,
@@ -555,7 +557,8 @@ class BaseFont(_BaseGlyphVendor, InterpolationMixin, DeprecatedFont, RemovedFont
 
     def _get_base_info(self) -> BaseInfo:
         info: BaseInfo = self._get_info()
-        info.font = self
+        if info.font is None:
+            info.font = self
         return info
 
     def _get_info(self) -> BaseInfo:  # type: ignore[return]
@@ -594,7 +597,8 @@ class BaseFont(_BaseGlyphVendor, InterpolationMixin, DeprecatedFont, RemovedFont
 
     def _get_base_groups(self) -> BaseGroups:
         groups: BaseGroups = self._get_groups()
-        groups.font = self
+        if groups.font is None:
+            groups.font = self
         return groups
 
     def _get_groups(self) -> BaseGroups:  # type: ignore[return]
@@ -634,7 +638,8 @@ class BaseFont(_BaseGlyphVendor, InterpolationMixin, DeprecatedFont, RemovedFont
 
     def _get_base_kerning(self) -> BaseKerning:
         kerning: BaseKerning = self._get_kerning()
-        kerning.font = self
+        if kerning.font is None:
+            kerning.font = self
         return kerning
 
     def _get_kerning(self) -> BaseKerning:  # type: ignore[return]
@@ -1453,6 +1458,42 @@ class BaseFont(_BaseGlyphVendor, InterpolationMixin, DeprecatedFont, RemovedFont
         layer = self.defaultLayer
         return layer.keys()
 
+    def _contains(self, name: str, **kwargs: Any) -> bool:
+        r"""Test if the native default layer contains the specified glyph.
+
+        This is the environment implementation of
+        :meth:`BaseFont.__contains__`.
+
+        :param name: The name of the glyph to check. The value will have been
+            normalized with :func:`normalizers.normalizeGlyphName`.
+        :param \**kwargs: Additional keyword arguments.
+        :return: :obj:`True` if the glyph exists in the default layer,
+            :obj:`False` otherwise.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        layer = self.defaultLayer
+        return layer._contains(name)
+
+    def _len(self, **kwargs: Any) -> int:
+        r"""Return the number of glyphs in the native default layer.
+
+        This is the environment implementation of :meth:`BaseFont.__len__`.
+
+        :param \**kwargs: Additional keyword arguments.
+        :return: The number of glyphs in the default layer as an :class:`int`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        layer = self.defaultLayer
+        return layer._len()
+
     def _newGlyph(self, name: str, **kwargs: Any) -> BaseGlyph:
         r"""Create a new glyph in the native default layer.
 
@@ -1629,6 +1670,103 @@ class BaseFont(_BaseGlyphVendor, InterpolationMixin, DeprecatedFont, RemovedFont
         for guideline in self.guidelines:
             guideline.round()
 
+    def rescaleUnitsPerEm(self, value: IntFloatType, round: bool = False) -> None:
+        """Change the font's units per em and scale all font data to match.
+
+        Everything measured in font units is scaled by the ratio of
+        `value` to the current :attr:`BaseInfo.unitsPerEm`. Unlike
+        :meth:`font.round`, this applies to the glyphs in every layer.
+        It covers:
+
+        - the contours, anchors, guidelines, image, width and height of
+          every glyph
+        - the offsets of all components, whose scale is kept since their
+          base glyphs are scaled as well
+        - :attr:`kerning`
+        - :attr:`guidelines`
+        - the metrics in :attr:`info`, see :meth:`BaseInfo.scaleBy`
+
+        Feature code is not changed.
+
+        :param value: The new units per em as an :class:`int`
+            or :class:`float`.
+        :param round: Whether to round the scaled data to integers,
+            as with :meth:`BaseGlyph.round`, :meth:`BaseKerning.round`
+            and :meth:`BaseInfo.round`. Defaults to :obj:`False`.
+        :raises FontPartsError: If the font's units per em is not set.
+
+        Example::
+
+            >>> font.rescaleUnitsPerEm(2048)
+            >>> font.rescaleUnitsPerEm(1000, round=True)
+
+        """
+        value = normalizers.normalizeUnitsPerEm(value)
+        round = normalizers.normalizeBoolean(round)
+        unitsPerEm = self.info.unitsPerEm
+        if not unitsPerEm:
+            raise FontPartsError("The font's units per em is not set.")
+        factor = value / unitsPerEm
+        with self.holdChanges():
+            self._rescaleUnitsPerEm(value, factor=factor, round=round)
+
+    def _rescaleUnitsPerEm(
+        self, value: IntFloatType, factor: float, round: bool, **kwargs: Any
+    ) -> None:
+        r"""Change the native font's units per em and scale all font data.
+
+        This is the environment implementation of
+        :meth:`BaseFont.rescaleUnitsPerEm`.
+
+        :param value: The new units per em as an :class:`int`
+            or :class:`float`. The value will have been normalized
+            with :func:`normalizers.normalizeUnitsPerEm`.
+        :param factor: The ratio of `value` to the current units per em
+            as a :class:`float`.
+        :param round: Whether to round the scaled data to integers.
+        :param \**kwargs: Additional keyword arguments.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        matrix = (factor, 0, 0, factor, 0, 0)
+        for layer in self.layers:
+            for glyph in layer:
+                components = glyph.components
+                transformations = [component.transformation for component in components]
+                glyph.transformBy(matrix)
+                for component, transformation in zip(components, transformations):
+                    xScale, xyScale, yxScale, yScale, xOffset, yOffset = transformation
+                    component.transformation = (
+                        xScale,
+                        xyScale,
+                        yxScale,
+                        yScale,
+                        xOffset * factor,
+                        yOffset * factor,
+                    )
+                image = glyph.image
+                if image.data is not None:
+                    image.transformBy(matrix)
+                glyph.width *= factor
+                glyph.height *= factor
+                if round:
+                    glyph.round()
+        for guideline in self.guidelines:
+            guideline.transformBy(matrix)
+            if round:
+                guideline.round()
+        kerning = self.kerning
+        kerning.scaleBy(factor)
+        info = self.info
+        info.scaleBy(factor)
+        info.unitsPerEm = value
+        if round:
+            kerning.round()
+            info.round()
+
     def autoUnicodes(self) -> None:
         """Use heuristics to set Unicode values in all font glyphs.
 
@@ -1657,6 +1795,45 @@ class BaseFont(_BaseGlyphVendor, InterpolationMixin, DeprecatedFont, RemovedFont
         layer = self.defaultLayer
         layer.autoUnicodes()
 
+    def holdChanges(self) -> AbstractContextManager[None]:
+        """Hold change notifications for the font until the block exits.
+
+        Use this when editing many glyphs in the font. The notifications
+        posted by edits made inside the block are coalesced and
+        delivered once, when the outermost block exits. This makes bulk
+        edits much cheaper in environments that observe changes.
+        Only notifications about changed content are held. Names,
+        unicodes and which glyphs exist are updated at once. Derived
+        data, such as cached bounds, may not be updated until the block
+        exits. Blocks may be nested.
+
+        :return: A context manager.
+
+        Example::
+
+            >>> with font.holdChanges():
+            ...     for glyph in font:
+            ...         glyph.moveBy((10, 0))
+
+        """
+        return self._holdChanges()
+
+    def _holdChanges(self) -> AbstractContextManager[None]:
+        """Hold change notifications for the native font until the block exits.
+
+        This is the environment implementation of
+        :meth:`BaseFont.holdChanges`. The default implementation
+        does nothing.
+
+        :return: A context manager.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return nullcontext()
+
     # ----------
     # Guidelines
     # ----------
@@ -1744,10 +1921,16 @@ class BaseFont(_BaseGlyphVendor, InterpolationMixin, DeprecatedFont, RemovedFont
         self.raiseNotImplementedError()
 
     def _getGuidelineIndex(self, guideline: BaseGuideline) -> int:
-        for i, other in enumerate(self.guidelines):
-            if guideline == other:
-                return i
-        raise FontPartsError("The guideline could not be found.")
+        index = lookupIndex(
+            self,
+            "_guidelineIndexes",
+            guideline,
+            self._getGuideline,
+            self._len__guidelines(),
+        )
+        if index is None:
+            raise FontPartsError("The guideline could not be found.")
+        return index
 
     def appendGuideline(
         self,
@@ -2030,6 +2213,102 @@ class BaseFont(_BaseGlyphVendor, InterpolationMixin, DeprecatedFont, RemovedFont
             factor, minFont.info, maxFont.info, round=round, suppressError=suppressError
         )
 
+    def combine(
+        self,
+        masters: CollectionType[tuple[BaseFont, InterpolationFactorLike]],
+        round: bool = True,
+        suppressError: bool = True,
+    ) -> None:
+        """Replace all possible data in the font with a weighted sum of fonts.
+
+        Each master is multiplied by its weight and the results are
+        added up. Weights that add up to 1.0 give an interpolation
+        between any number of masters. The layers are combined with
+        :meth:`BaseLayer.combine` and the info with
+        :meth:`BaseInfo.combine`. The kerning and groups are combined with
+        the private ``BaseKerning._combine``, which only uses the ``x``
+        weights. Kerning has no public ``combine`` method, because
+        ``Kerning.combine`` was a RoboFab method with a different meaning.
+
+        :param masters: A :class:`list` or :class:`tuple` of
+            ``(font, weight)`` pairs, where each font is a :class:`BaseFont`
+            instance and each weight is a single :class:`int`
+            or :class:`float` or a :class:`tuple` of two :class:`int`
+            or :class:`float` values representing the weights ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers. Defaults to :obj:`True`.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found. Defaults to :obj:`True`.
+        :raises TypeError: If `masters` is not a list of pairs or any
+            master is not an instance of :class:`BaseFont`.
+        :raises ValueError: If `masters` is empty.
+
+        Example::
+
+            >>> font.combine([(light, 0.25), (regular, 0.5), (bold, 0.25)])
+
+        """
+        normalizedMasters = normalizers.normalizeCombinationMasters(masters, BaseFont)
+        round = normalizers.normalizeBoolean(round)
+        suppressError = normalizers.normalizeBoolean(suppressError)
+        self._combine(normalizedMasters, round=round, suppressError=suppressError)
+
+    def _combine(
+        self,
+        masters: list[tuple[BaseFont, InterpolationFactor]],
+        round: bool,
+        suppressError: bool,
+    ) -> None:
+        """Replace all possible data in the native font with a weighted sum of fonts.
+
+        This is the environment implementation of :meth:`BaseFont.combine`.
+
+        :param masters: A :class:`list` of ``(font, weight)`` pairs, where
+            each font is a :class:`BaseFont` subclass instance and each
+            weight is a :class:`tuple` of two :class:`float` values
+            representing the weights ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        # layers
+        for layerName in self.layerOrder:
+            self.removeLayer(layerName)
+        firstFont = masters[0][0]
+        for layerName in firstFont.layerOrder:
+            if not all(layerName in font.layerOrder for font, _ in masters):
+                continue
+            layerMasters = [
+                (font.getLayer(layerName), weight) for font, weight in masters
+            ]
+            dstLayer = self.newLayer(layerName)
+            dstLayer._combine(layerMasters, round=round, suppressError=suppressError)
+        if self.layerOrder:
+            if ufoLib.DEFAULT_LAYER_NAME in self.layerOrder:
+                self.defaultLayer = self.getLayer(ufoLib.DEFAULT_LAYER_NAME)
+            else:
+                self.defaultLayer = self.getLayer(self.layerOrder[0])
+        # kerning and groups
+        self.kerning._combine(
+            [(font.kerning, weight) for font, weight in masters],
+            round=round,
+            suppressError=suppressError,
+        )
+        # info
+        self.info._combine(
+            [(font.info, weight) for font, weight in masters],
+            round=round,
+            suppressError=suppressError,
+        )
+
     compatibilityReporterClass = FontCompatibilityReporter
 
     def isCompatible(
@@ -1,5 +1,7 @@
 # pylint: disable=C0103, C0302, C0114, W0613
 from __future__ import annotations
+from array import array
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING, Any
 from collections.abc import Iterator
 from itertools import zip_longest
@@ -12,7 +14,18 @@ from fontMath.mathFunctions import setRoundIntegerFunction
 from fontTools.pens.pointInsidePen import PointInsidePen
 from fontTools.pens.areaPen import AreaPen
 from fontTools.pens.boundsPen import BoundsPen
-
+from fontTools.pens.recordingPen import RecordingPointPen
+
+from fontParts.base.arrays import (
+    PackedOutline,
+    PackedOutlinePointPen,
+    combinePackedOutlines,
+    interpolatePackedOutlines,
+    pointsInsidePolygons,
+    polygonDepths,
+    polygonHierarchy,
+    transformCoordinates,
+)
 from fontParts.base.bounds import Bounds
 from fontParts.base.errors import FontPartsError
 from fontParts.base.base import (
@@ -22,6 +35,9 @@ from fontParts.base.base import (
     SelectionMixin,
     dynamicProperty,
     interpolate,
+    isTrustedMode,
+    lookupIndex,
+    trustedMode,
     FuzzyNumber,
 )
 from fontParts.base import normalizers
@@ -29,6 +45,7 @@ from fontParts.base.compatibility import GlyphCompatibilityReporter
 from fontParts.base.color import Color
 from fontParts.base.deprecated import DeprecatedGlyph, RemovedGlyph
 from fontParts.base.annotations import (
+    InterpolationFactor,
     InterpolationFactorLike,
     InterpolationFactorPair,
     ScaleFactorLike,
@@ -137,20 +154,88 @@ class BaseGlyph(
 
         """
         super().copyData(source)
-        for contour in source.contours:
-            self.appendContour(contour)
-        for component in source.components:
-            self.appendComponent(component=component)
-        for anchor in source.anchors:
-            self.appendAnchor(anchor=anchor)
-        for guideline in source.guidelines:
-            self.appendGuideline(guideline=guideline)
+        self._copyData(source)
         sourceImage = source.image
         if sourceImage.data is not None:
             selfImage = self.addImage(data=sourceImage.data)
             selfImage.transformation = sourceImage.transformation
             selfImage.color = sourceImage.color
 
+    def _copyData(self: BaseGlyph, source: BaseGlyph) -> None:
+        """Copy the outline data of another glyph into the native glyph.
+
+        This is the environment implementation of :meth:`BaseGlyph.copyData`.
+        It appends the contours, components, anchors and guidelines of
+        `source`. The attributes listed in :attr:`copyAttributes` and the
+        image are copied by :meth:`BaseGlyph.copyData`.
+
+        :param source: The source :class:`BaseGlyph` instance from which
+            to copy data.
+
+        The base implementation passes the data of every element to the
+        environment append methods. Environments that can copy their
+        native objects directly should do so.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        # The source data has been normalized on the way out of the
+        # source glyph, so it is passed straight to the environment
+        # methods rather than through the public append methods.
+        for contour in source.contours:
+            self._appendContour(contour, (0, 0))
+        identifiers = {
+            c.identifier for c in self.components if c.identifier is not None
+        }
+        name = self.name
+        for component in source.components:
+            if name is not None and component.baseGlyph == name:
+                raise FontPartsError(
+                    "A glyph cannot contain a component referencing itself."
+                )
+            identifier = component.identifier
+            if identifier in identifiers:
+                identifier = None
+            elif identifier is not None:
+                identifiers.add(identifier)
+            self._appendComponent(
+                component.baseGlyph,
+                transformation=component.transformation,
+                identifier=identifier,
+            )
+        identifiers = {a.identifier for a in self.anchors if a.identifier is not None}
+        for anchor in source.anchors:
+            identifier = anchor.identifier
+            if identifier in identifiers:
+                identifier = None
+            elif identifier is not None:
+                identifiers.add(identifier)
+            self._appendAnchor(
+                anchor.name,
+                position=anchor.position,
+                color=anchor.color,
+                identifier=identifier,
+            )
+        identifiers = {
+            g.identifier for g in self.guidelines if g.identifier is not None
+        }
+        for guideline in source.guidelines:
+            identifier = guideline.identifier
+            if identifier in identifiers:
+                identifier = None
+            elif identifier is not None:
+                identifiers.add(identifier)
+            newGuideline = self._appendGuideline(
+                guideline.position,
+                guideline.angle,
+                name=guideline.name,
+                color=guideline.color,
+                identifier=identifier,
+            )
+            self._setGlyphInGuideline(newGuideline)
+
     # -------
     # Parents
     # -------
@@ -1231,10 +1316,12 @@ class BaseGlyph(
         self.raiseNotImplementedError()
 
     def _getContourIndex(self, contour: BaseContour) -> int:
-        for i, other in enumerate(self.contours):
-            if contour == other:
-                return i
-        raise FontPartsError("The contour could not be found.")
+        index = lookupIndex(
+            self, "_contourIndexes", contour, self._getContour, self._lenContours()
+        )
+        if index is None:
+            raise FontPartsError("The contour could not be found.")
+        return index
 
     def insertContour(
         self, index: int, contour: BaseContour, offset: CoordinateLike | None = None
@@ -1531,10 +1618,16 @@ class BaseGlyph(
         self.raiseNotImplementedError()
 
     def _getComponentIndex(self, component: BaseComponent) -> int:
-        for i, other in enumerate(self.components):
-            if component == other:
-                return i
-        raise FontPartsError("The component could not be found.")
+        index = lookupIndex(
+            self,
+            "_componentIndexes",
+            component,
+            self._getComponent,
+            self._len__components(),
+        )
+        if index is None:
+            raise FontPartsError("The component could not be found.")
+        return index
 
     def appendComponent(
         self,
@@ -1808,10 +1901,12 @@ class BaseGlyph(
         self.raiseNotImplementedError()
 
     def _getAnchorIndex(self, anchor: BaseAnchor) -> int:
-        for i, other in enumerate(self.anchors):
-            if anchor == other:
-                return i
-        raise FontPartsError("The anchor could not be found.")
+        index = lookupIndex(
+            self, "_anchorIndexes", anchor, self._getAnchor, self._len__anchors()
+        )
+        if index is None:
+            raise FontPartsError("The anchor could not be found.")
+        return index
 
     def appendAnchor(
         self,
@@ -2052,10 +2147,16 @@ class BaseGlyph(
         self.raiseNotImplementedError()
 
     def _getGuidelineIndex(self, guideline: BaseGuideline) -> int:
-        for i, other in enumerate(self.guidelines):
-            if guideline == other:
-                return i
-        raise FontPartsError("The guideline could not be found.")
+        index = lookupIndex(
+            self,
+            "_guidelineIndexes",
+            guideline,
+            self._getGuideline,
+            self._len__guidelines(),
+        )
+        if index is None:
+            raise FontPartsError("The guideline could not be found.")
+        return index
 
     def appendGuideline(
         self,
@@ -2275,6 +2376,61 @@ class BaseGlyph(
         self.width = normalizers.normalizeVisualRounding(self.width)
         self.height = normalizers.normalizeVisualRounding(self.height)
 
+    def getContourHierarchy(self) -> tuple[tuple[int | None, tuple[int, ...]], ...]:
+        """Get the containment tree of the glyph's contours.
+
+        A contour is the child of the smallest contour whose filled area
+        contains it. The tree is computed once and reused for as long as
+        the contours don't change.
+
+        :return: A :class:`tuple` holding, for every contour in the order
+            of :attr:`contours`, a :class:`tuple` of the index of its
+            parent contour or :obj:`None` and a :class:`tuple` of the
+            indexes of its child contours.
+
+        Example::
+
+            >>> glyph.getContourHierarchy()
+            ((None, (1,)), (0, ()))
+
+        """
+        return self._getContourHierarchy()
+
+    def _getContourHierarchy(self) -> tuple[tuple[int | None, tuple[int, ...]], ...]:
+        """Get the containment tree of the native glyph's contours.
+
+        This is the environment implementation of
+        :meth:`BaseGlyph.getContourHierarchy`.
+
+        :return: A :class:`tuple` of ``(parent, children)`` pairs as
+            described in :meth:`BaseGlyph.getContourHierarchy`.
+
+        The base implementation compares the polygons returned by
+        :meth:`_getContourPolygons`, rejecting pairs by their bounds
+        first, and caches the result with the key returned by
+        :meth:`_getPolygonKey`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        key = self._getPolygonKey()
+        cache = getattr(self, "_contourHierarchyCache", None)
+        if key is not None and cache is not None and cache[0] == key:
+            return cache[1]
+        parents = polygonHierarchy(self._getContourPolygons())
+        children: list[list[int]] = [[] for _ in parents]
+        for index, parent in enumerate(parents):
+            if parent is not None:
+                children[parent].append(index)
+        hierarchy = tuple(
+            (parent, tuple(indexes)) for parent, indexes in zip(parents, children)
+        )
+        if key is not None:
+            self._contourHierarchyCache = (key, hierarchy)
+        return hierarchy
+
     def correctDirection(self, trueType: bool = False) -> None:
         """Correct the winding direction of the glyph's contours.
 
@@ -2300,15 +2456,22 @@ class BaseGlyph(
         :param trueType: Whether to follow TrueType rather than PostScript
             winding recommendations.
         :param \**kwargs: Additional keyword arguments.
-        :raises NotImplementedError: If the method has not been overridden by a
-            subclass.
+
+        The base implementation counts the other contours containing
+        each contour in the polygons returned by
+        :meth:`_getContourPolygons`. Contours contained by an even number
+        of contours are made counter-clockwise and the others clockwise,
+        or the other way around for TrueType.
 
         .. note::
 
             Subclasses may override this method.
 
         """
-        self.raiseNotImplementedError()
+        depths = polygonDepths(self._getContourPolygons())
+        with self.holdChanges():
+            for contour, depth in zip(self.contours, depths):
+                contour.clockwise = bool(depth % 2) != trueType
 
     def autoContourOrder(self) -> None:
         """Automatically order the glyph's contours based on heuristics.
@@ -2411,14 +2574,15 @@ class BaseGlyph(
             Subclasses may override this method.
 
         """
-        for contour in self.contours:
-            contour.transformBy(matrix)
-        for component in self.components:
-            component.transformBy(matrix)
-        for anchor in self.anchors:
-            anchor.transformBy(matrix)
-        for guideline in self.guidelines:
-            guideline.transformBy(matrix)
+        with self.holdChanges():
+            for contour in self.contours:
+                contour.transformBy(matrix)
+            for component in self.components:
+                component.transformBy(matrix)
+            for anchor in self.anchors:
+                anchor.transformBy(matrix)
+            for guideline in self.guidelines:
+                guideline.transformBy(matrix)
 
     def scaleBy(
         self,
@@ -2622,6 +2786,9 @@ class BaseGlyph(
         # populate
         pen = copied.getPointPen()
         mathGlyph.drawPoints(pen, filterRedundantPoints=filterRedundantPoints)
+        if isTrustedMode():
+            copied._fromTrustedMathGlyphData(mathGlyph, toThisGlyph)
+            return copied
         for anchor in mathGlyph.anchors:
             a = copied.appendAnchor(
                 name=anchor.get("name"),
@@ -2656,6 +2823,52 @@ class BaseGlyph(
         copied.note = mathGlyph.note
         return copied
 
+    def _fromTrustedMathGlyphData(
+        self, mathGlyph: MathGlyph, toThisGlyph: bool
+    ) -> None:
+        """Copy the non-outline data of a trusted mathGlyph into the native glyph.
+
+        This is used by :meth:`BaseGlyph._fromMathGlyph` inside
+        :func:`~fontParts.base.base.trustedMode`, where `mathGlyph` was
+        built from fontParts glyphs, so its values are passed to the
+        environment methods without normalization.
+
+        :param mathGlyph: The :class:`fontMath.MathGlyph` object containing
+            the data.
+        :param toThisGlyph: Whether the data is being applied to an existing
+            glyph, in which case its name and unicodes are kept.
+
+        """
+        for anchor in mathGlyph.anchors:
+            color = anchor.get("color")
+            if color is not None:
+                color = tuple(color)
+            self._appendAnchor(
+                anchor.get("name"),
+                position=(anchor["x"], anchor["y"]),
+                color=color,
+                identifier=anchor.get("identifier"),
+            )
+        for guideline in mathGlyph.guidelines:
+            color = guideline.get("color")
+            if color is not None:
+                color = tuple(color)
+            newGuideline = self._appendGuideline(
+                (guideline["x"], guideline["y"]),
+                guideline["angle"],
+                name=guideline.get("name"),
+                color=color,
+                identifier=guideline.get("identifier"),
+            )
+            self._setGlyphInGuideline(newGuideline)
+        self.lib._update(deepcopy(dict(mathGlyph.lib)))
+        if not toThisGlyph:
+            self._set_name(mathGlyph.name)
+            self._set_unicodes(tuple(mathGlyph.unicodes))
+        self._set_width(mathGlyph.width)
+        self._set_height(mathGlyph.height)
+        self._set_note(mathGlyph.note)
+
     def __mul__(self, factor: InterpolationFactorLike) -> BaseGlyph:
         """Multiply the current glyph by a given factor.
 
@@ -2672,9 +2885,10 @@ class BaseGlyph(
         """
         mathGlyph = self._toMathGlyph(scaleComponentTransform=True, strict=False)
         result = mathGlyph * factor
-        copied = self._fromMathGlyph(
-            result, toThisGlyph=False, filterRedundantPoints=True
-        )
+        with trustedMode():
+            copied = self._fromMathGlyph(
+                result, toThisGlyph=False, filterRedundantPoints=True
+            )
         return copied
 
     __rmul__ = __mul__
@@ -2695,9 +2909,10 @@ class BaseGlyph(
         """
         mathGlyph = self._toMathGlyph(scaleComponentTransform=True, strict=False)
         result = mathGlyph / factor
-        copied = self._fromMathGlyph(
-            result, toThisGlyph=False, filterRedundantPoints=True
-        )
+        with trustedMode():
+            copied = self._fromMathGlyph(
+                result, toThisGlyph=False, filterRedundantPoints=True
+            )
         return copied
 
     # py2 support
@@ -2717,9 +2932,10 @@ class BaseGlyph(
         selfMathGlyph = self._toMathGlyph(scaleComponentTransform=True, strict=False)
         otherMathGlyph = other._toMathGlyph(scaleComponentTransform=True, strict=False)
         result = selfMathGlyph + otherMathGlyph
-        copied = self._fromMathGlyph(
-            result, toThisGlyph=False, filterRedundantPoints=True
-        )
+        with trustedMode():
+            copied = self._fromMathGlyph(
+                result, toThisGlyph=False, filterRedundantPoints=True
+            )
         return copied
 
     def __sub__(self, other: BaseGlyph) -> BaseGlyph:
@@ -2739,9 +2955,10 @@ class BaseGlyph(
         selfMathGlyph = self._toMathGlyph(scaleComponentTransform=True, strict=False)
         otherMathGlyph = other._toMathGlyph(scaleComponentTransform=True, strict=False)
         result = selfMathGlyph - otherMathGlyph
-        copied = self._fromMathGlyph(
-            result, toThisGlyph=False, filterRedundantPoints=True
-        )
+        with trustedMode():
+            copied = self._fromMathGlyph(
+                result, toThisGlyph=False, filterRedundantPoints=True
+            )
         return copied
 
     def interpolate(
@@ -2826,6 +3043,8 @@ class BaseGlyph(
             Subclasses may override this method.
 
         """
+        if self._interpolateDirect(factor, minGlyph, maxGlyph, round=round):
+            return
         setRoundIntegerFunction(normalizers.normalizeVisualRounding)
 
         minMathGlyph = minGlyph._toMathGlyph(scaleComponentTransform=True, strict=False)
@@ -2841,8 +3060,316 @@ class BaseGlyph(
         if result is not None:
             if round:
                 result = result.round()
+            with trustedMode():
+                self._fromMathGlyph(
+                    result, toThisGlyph=True, filterRedundantPoints=True
+                )
+
+    def _interpolateDirect(
+        self,
+        factor: InterpolationFactorPair,
+        minGlyph: BaseGlyph,
+        maxGlyph: BaseGlyph,
+        round: bool,
+    ) -> bool:
+        """Interpolate structurally identical glyphs without fontMath.
+
+        This is called by :meth:`BaseGlyph._interpolate` before it
+        converts the glyphs to :class:`fontMath.MathGlyph` objects. The
+        glyphs are compared and interpolated as
+        :class:`fontParts.base.arrays.PackedOutline` objects with
+        :func:`fontParts.base.arrays.interpolatePackedOutlines`, and the
+        result is written with the structure of `minGlyph`. This gives
+        the same result as the fontMath interpolation.
+
+        The result doesn't go through the redundant point filter of
+        fontMath, which turns curves whose off-curve points lie on their
+        on-curve points into lines. Glyphs whose result would contain
+        such a curve are left to fontMath instead.
+
+        :param factor: The interpolation value as a :class:`tuple` of two
+            :class:`int` or :class:`float` values representing the factors
+            ``(x, y)``.
+        :param minGlyph: The :class:`BaseGlyph` subclass instance
+            corresponding to the 0.0 position in the interpolation.
+        :param maxGlyph: The :class:`BaseGlyph` subclass instance
+            corresponding to the 1.0 position in the interpolation.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers.
+        :return: :obj:`True` if the glyph was interpolated, or :obj:`False`
+            if the glyphs have guidelines, empty contours or differing
+            structures, or if the result would contain a redundant curve,
+            and must be interpolated with fontMath.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        outlines = self._getMathOutlines((minGlyph, maxGlyph))
+        if outlines is None:
+            return False
+        minOutline, maxOutline = outlines
+        xFactor, yFactor = factor
+        roundValue = normalizers.normalizeVisualRounding if round else None
+        outline = interpolatePackedOutlines(
+            minOutline, maxOutline, (xFactor, yFactor), roundValue
+        )
+        if outline is None:
+            return False
+        width = minGlyph.width + (maxGlyph.width - minGlyph.width) * xFactor
+        height = minGlyph.height + (maxGlyph.height - minGlyph.height) * yFactor
+        self._setMathOutline(minGlyph, outline, width, height, round)
+        return True
+
+    def _getMathOutlines(
+        self, glyphs: CollectionType[BaseGlyph]
+    ) -> list[PackedOutline] | None:
+        """Get the packed outlines of glyphs for direct glyph math.
+
+        This is used by :meth:`BaseGlyph._interpolateDirect` and
+        :meth:`BaseGlyph._combineDirect`.
+
+        :param glyphs: The :class:`BaseGlyph` subclass instances to pack.
+        :return: A :class:`list` of
+            :class:`fontParts.base.arrays.PackedOutline` objects, or
+            :obj:`None` if the glyphs have guidelines, empty contours or
+            differing component identifiers, which only fontMath handles.
+
+        """
+        outlines = []
+        componentIdentifiers = None
+        for glyph in glyphs:
+            if glyph.guidelines:
+                return None
+            outline = glyph._toPackedOutline()
+            if outline.contourCount != len(glyph.contours):
+                return None
+            identifiers = [component.identifier for component in glyph.components]
+            if componentIdentifiers is None:
+                componentIdentifiers = identifiers
+            elif identifiers != componentIdentifiers:
+                return None
+            outlines.append(outline)
+        return outlines
+
+    def _setMathOutline(
+        self,
+        source: BaseGlyph,
+        outline: PackedOutline,
+        width: float,
+        height: float,
+        round: bool,
+    ) -> None:
+        """Replace the native glyph's data with the result of direct glyph math.
+
+        This is used by :meth:`BaseGlyph._interpolateDirect` and
+        :meth:`BaseGlyph._combineDirect`. Everything the packed outline
+        doesn't store is copied from `source`, which may be this glyph.
+
+        :param source: The :class:`BaseGlyph` subclass instance with the
+            structure of the result.
+        :param outline: The computed
+            :class:`fontParts.base.arrays.PackedOutline`.
+        :param width: The computed width.
+        :param height: The computed height.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers.
+
+        """
+        convert = int if round else float
+        if round:
+            width = normalizers.normalizeVisualRounding(width)
+            height = normalizers.normalizeVisualRounding(height)
+        # Read everything from the source before clearing, because it may
+        # be this glyph.
+        recording = RecordingPointPen()
+        source.drawPoints(recording)
+        anchors = [
+            (anchor.name, anchor.color, anchor.identifier) for anchor in source.anchors
+        ]
+        lib = deepcopy(dict(source.lib))
+        note = source.note
+        coordinates = outline.coordinates
+        transformations = outline.componentTransformations
+        with self.holdChanges():
+            self.clear()
+            pen = self.getPointPen()
+            pointIndex = 0
+            componentIndex = 0
+            for method, args, kwargs in recording.value:
+                if method == "addPoint":
+                    position = (
+                        convert(coordinates[pointIndex * 2]),
+                        convert(coordinates[pointIndex * 2 + 1]),
+                    )
+                    args = (position,) + args[1:]
+                    pointIndex += 1
+                elif method == "addComponent":
+                    transformation = list(
+                        transformations[componentIndex * 6 : componentIndex * 6 + 6]
+                    )
+                    transformation[4:] = map(convert, transformation[4:])
+                    args = (args[0], tuple(transformation))
+                    componentIndex += 1
+                getattr(pen, method)(*args, **kwargs)
+            anchorCoordinates = outline.anchorCoordinates
+            for index, (name, color, identifier) in enumerate(anchors):
+                if color is not None:
+                    color = tuple(color)
+                self._appendAnchor(
+                    name,
+                    position=(
+                        convert(anchorCoordinates[index * 2]),
+                        convert(anchorCoordinates[index * 2 + 1]),
+                    ),
+                    color=color,
+                    identifier=identifier,
+                )
+            self.lib._update(lib)
+            self._set_width(width)
+            self._set_height(height)
+            self._set_note(note)
+
+    def combine(
+        self,
+        masters: CollectionType[tuple[BaseGlyph, InterpolationFactorLike]],
+        round: bool = True,
+        suppressError: bool = True,
+    ) -> None:
+        """Replace all possible data in the glyph with a weighted sum of glyphs.
+
+        Each master is multiplied by its weight and the results are
+        added up, which gives the same result as ``master1 * weight1 +
+        master2 * weight2 + ...`` without creating the intermediate
+        glyphs. Weights that add up to 1.0 give an interpolation
+        between any number of masters, and :meth:`interpolate` is
+        equivalent, up to floating-point rounding, to combining
+        `minGlyph` with ``1 - factor`` and `maxGlyph` with `factor`. The
+        first master gives the result its structure, lib and note.
+
+        :param masters: A :class:`list` or :class:`tuple` of
+            ``(glyph, weight)`` pairs, where each glyph is
+            a :class:`BaseGlyph` instance and each weight is a
+            single :class:`int` or :class:`float` or a :class:`tuple` of
+            two :class:`int` or :class:`float` values representing the
+            weights ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers. Defaults to :obj:`True`.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found. Defaults to :obj:`True`.
+        :raises TypeError: If `masters` is not a list of pairs or any
+            master is not an instance of :class:`BaseGlyph`.
+        :raises ValueError: If `masters` is empty.
+
+        Example::
+
+            >>> glyph.combine([(light, 0.25), (regular, 0.5), (bold, 0.25)])
+            >>> glyph.combine([(regular, 1), (boldDelta, (0.5, 0))], round=False)
+
+        """
+        normalizedMasters = normalizers.normalizeCombinationMasters(masters, BaseGlyph)
+        round = normalizers.normalizeBoolean(round)
+        suppressError = normalizers.normalizeBoolean(suppressError)
+        self._combine(normalizedMasters, round=round, suppressError=suppressError)
+
+    def _combine(
+        self,
+        masters: list[tuple[BaseGlyph, InterpolationFactor]],
+        round: bool,
+        suppressError: bool,
+    ) -> None:
+        """Replace all possible data in the native glyph with a weighted sum of glyphs.
+
+        This is the environment implementation of :meth:`BaseGlyph.combine`.
+
+        :param masters: A :class:`list` of ``(glyph, weight)`` pairs, where
+            each glyph is a :class:`BaseGlyph` subclass instance and each
+            weight is a :class:`tuple` of two :class:`float` values
+            representing the weights ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found.
+        :raises FontPartsError: If ``suppressError=False`` and the glyphs
+            could not be combined.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        if self._combineDirect(masters, round=round):
+            return
+        setRoundIntegerFunction(normalizers.normalizeVisualRounding)
+        result: MathGlyph | None = None
+        try:
+            for glyph, weight in masters:
+                mathGlyph = glyph._toMathGlyph(
+                    scaleComponentTransform=True, strict=False
+                )
+                if result is None:
+                    result = mathGlyph * weight
+                else:
+                    result = result + mathGlyph * weight
+        except IndexError:
+            result = None
+        if result is None:
+            if not suppressError:
+                names = ", ".join(repr(glyph.name) for glyph, _ in masters)
+                raise FontPartsError(f"Glyphs {names} could not be combined.")
+            return
+        if round:
+            result = result.round()
+        with trustedMode():
             self._fromMathGlyph(result, toThisGlyph=True, filterRedundantPoints=True)
 
+    def _combineDirect(
+        self, masters: list[tuple[BaseGlyph, InterpolationFactor]], round: bool
+    ) -> bool:
+        """Combine structurally identical glyphs without fontMath.
+
+        This is called by :meth:`BaseGlyph._combine` before it converts
+        the glyphs to :class:`fontMath.MathGlyph` objects. The glyphs
+        are combined as :class:`fontParts.base.arrays.PackedOutline`
+        objects with :func:`fontParts.base.arrays.combinePackedOutlines`
+        in one pass, and the result is written with the structure of the
+        first glyph. As in :meth:`BaseGlyph._interpolateDirect`, glyphs
+        whose result fontMath's redundant point filter would change are
+        left to fontMath.
+
+        :param masters: A :class:`list` of ``(glyph, weight)`` pairs, where
+            each glyph is a :class:`BaseGlyph` subclass instance and each
+            weight is a :class:`tuple` of two :class:`float` values
+            representing the weights ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers.
+        :return: :obj:`True` if the glyph was combined, or :obj:`False`
+            if the glyphs have guidelines, empty contours or differing
+            structures, or if the result would contain a redundant curve,
+            and must be combined with fontMath.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        glyphs = [glyph for glyph, _ in masters]
+        weights = [weight for _, weight in masters]
+        outlines = self._getMathOutlines(glyphs)
+        if outlines is None:
+            return False
+        roundValue = normalizers.normalizeVisualRounding if round else None
+        outline = combinePackedOutlines(outlines, weights, roundValue)
+        if outline is None:
+            return False
+        width = sum(glyph.width * xWeight for glyph, (xWeight, _) in masters)
+        height = sum(glyph.height * yWeight for glyph, (_, yWeight) in masters)
+        self._setMathOutline(glyphs[0], outline, width, height, round)
+        return True
+
     compatibilityReporterClass = GlyphCompatibilityReporter
 
     @staticmethod
@@ -2891,6 +3418,12 @@ class BaseGlyph(
         """
         GuidelineListType = list[tuple[str | None, int]]
 
+        fingerprint = self._getCompatibilityFingerprint()
+        if (
+            fingerprint is not None
+            and fingerprint == other._getCompatibilityFingerprint()
+        ):
+            return
         glyph1 = self
         glyph2 = other
         # contour count
@@ -3001,6 +3534,145 @@ class BaseGlyph(
                     missing_from_glyph2.elements()
                 )
 
+    def _getCompatibilityFingerprint(self) -> Any:
+        """Get a fingerprint of the interpolation structure of the native glyph.
+
+        :meth:`_isCompatible` compares the fingerprints of both glyphs
+        first and only builds the detailed report when they differ. Equal
+        fingerprints must therefore mean that the detailed report would
+        find neither fatal errors nor warnings.
+
+        :return: A value that can be compared with ``==``, or :obj:`None`
+            to always build the detailed report. The base implementation
+            returns a :class:`tuple` of the point types of every contour,
+            with ``"line"`` reported as ``"curve"``, the base glyph names
+            of the components and the names of the anchors and guidelines.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        contours = []
+        for contour in self.contours:
+            contours.append(
+                tuple(
+                    "curve" if point.type == "line" else point.type
+                    for point in contour.points
+                )
+            )
+        return (
+            tuple(contours),
+            tuple(component.baseGlyph for component in self.components),
+            tuple(anchor.name for anchor in self.anchors),
+            tuple(guideline.name for guideline in self.guidelines),
+        )
+
+    # --------------
+    # Packed Outline
+    # --------------
+
+    def toPackedOutline(self) -> PackedOutline:
+        """Return the glyph's outline as flat arrays.
+
+        The contours, components and anchors are read without drawing
+        with a pen or creating an object for every point. The result is
+        a copy, so it stays valid when the glyph changes. It can be
+        cached, pickled or handed to :meth:`fromPackedOutline` of any
+        glyph.
+
+        :return: A :class:`fontParts.base.arrays.PackedOutline`.
+
+        Example::
+
+            >>> outline = glyph.toPackedOutline()
+            >>> outline.pointCount
+            24
+
+        """
+        return self._toPackedOutline()
+
+    def _toPackedOutline(self) -> PackedOutline:
+        """Return the native glyph's outline as flat arrays.
+
+        This is the environment implementation of
+        :meth:`BaseGlyph.toPackedOutline`.
+
+        :return: A :class:`fontParts.base.arrays.PackedOutline`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        pen = PackedOutlinePointPen()
+        self.drawPoints(pen)
+        anchorNames = []
+        anchorCoordinates = array("d")
+        for anchor in self.anchors:
+            anchorNames.append(anchor.name)
+            anchorCoordinates.extend((anchor.x, anchor.y))
+        return PackedOutline(
+            pen.coordinates,
+            pen.pointTypes,
+            pen.smoothFlags,
+            pen.contourEnds,
+            tuple(pen.componentNames),
+            pen.componentTransformations,
+            tuple(anchorNames),
+            anchorCoordinates,
+        )
+
+    def fromPackedOutline(self, outline: PackedOutline) -> None:
+        """Replace the glyph's outline with a packed outline.
+
+        The glyph's contours, components and anchors are replaced with
+        the ones in `outline`. Everything else is left untouched.
+
+        :param outline: The :class:`fontParts.base.arrays.PackedOutline`
+            to read, usually one returned by :meth:`toPackedOutline`.
+        :raises TypeError: If `outline` is not a packed outline.
+        :raises ValueError: If the arrays in `outline` don't describe a
+            valid outline.
+
+        Example::
+
+            >>> glyph.fromPackedOutline(otherGlyph.toPackedOutline())
+
+        """
+        outline = normalizers.normalizePackedOutline(outline)
+        with self.holdChanges():
+            self._fromPackedOutline(outline)
+
+    def _fromPackedOutline(self, outline: PackedOutline) -> None:
+        """Replace the native glyph's outline with a packed outline.
+
+        This is the environment implementation of
+        :meth:`BaseGlyph.fromPackedOutline`.
+
+        :param outline: The :class:`fontParts.base.arrays.PackedOutline`
+            to read. The value will have been normalized with
+            :func:`normalizers.normalizePackedOutline`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        self.clear(
+            contours=True, components=True, anchors=True, guidelines=False, image=False
+        )
+        outline.drawPoints(self.getPointPen())
+        coordinates = outline.anchorCoordinates
+        # appendAnchor doesn't accept unnamed anchors
+        for index, name in enumerate(outline.anchorNames):
+            self._appendAnchor(
+                name,
+                position=(coordinates[index * 2], coordinates[index * 2 + 1]),
+                color=None,
+                identifier=None,
+            )
+
     # ------------
     # Data Queries
     # ------------
@@ -3039,6 +3711,128 @@ class BaseGlyph(
         self.draw(pen)
         return pen.getResult()
 
+    def pointsInside(self, points: Any) -> tuple[bool, ...]:
+        """Check which of `points` lie inside the filled area of the glyph.
+
+        The outline is flattened once and reused for as long as the
+        contours don't change, which makes this much faster than calling
+        :meth:`pointInside` for every point. Components are decomposed
+        with the glyph's layer. Curves are flattened to within
+        :data:`fontParts.base.arrays.flattenTolerance` units, so points
+        closer than that to a curve may be answered differently than by
+        :meth:`pointInside`.
+
+        :param points: The points to check as an array of shape
+            ``(N, 2)`` or a sequence of :ref:`type-coordinate` items.
+        :return: A :class:`tuple` holding :obj:`True` for every point
+            inside the filled area of the glyph and :obj:`False`
+            otherwise.
+
+        Example::
+
+            >>> glyph.pointsInside([(40, 65), (1000, 1000)])
+            (True, False)
+
+        """
+        coordinates = normalizers.normalizeCoordinateArray(points)
+        return self._pointsInside(coordinates)
+
+    def _pointsInside(self, coordinates: array) -> tuple[bool, ...]:
+        """Check which points lie inside the filled area of the native glyph.
+
+        This is the environment implementation of
+        :meth:`BaseGlyph.pointsInside`.
+
+        :param coordinates: The points to check as an :class:`array.array`
+            of ``"d"`` values holding ``x`` and ``y`` in turn. The value will
+            have been normalized with
+            :func:`normalizers.normalizeCoordinateArray`.
+        :return: A :class:`tuple` of :class:`bool` values.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return tuple(pointsInsidePolygons(self._getPolygons(), coordinates))
+
+    def _getPolygons(self) -> list[array]:
+        """Get the native glyph flattened to polygons.
+
+        The polygons of the contours are taken from
+        :meth:`_getContourPolygons`. Components are decomposed with the
+        glyph's layer every time, and are skipped if the glyph has no
+        layer or the base glyph doesn't exist.
+
+        :return: A :class:`list` of :class:`array.array` instances of
+            ``"d"`` values holding the ``x`` and ``y`` value of every
+            polygon point in turn.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        polygons = self._getContourPolygons()
+        layer = self.layer
+        if layer is None or not self.components:
+            return polygons
+        polygons = list(polygons)
+        for component in self.components:
+            if component.baseGlyph not in layer:
+                continue
+            baseGlyph = layer[component.baseGlyph]
+            matrix = component.transformation
+            polygons.extend(
+                transformCoordinates(polygon, matrix)
+                for polygon in baseGlyph._getPolygons()
+            )
+        return polygons
+
+    def _getContourPolygons(self) -> list[array]:
+        """Get the contours of the native glyph flattened to polygons.
+
+        The polygons are cached with the key returned by
+        :meth:`_getPolygonKey` and reused for as long as the key stays
+        equal.
+
+        :return: A :class:`list` holding one :class:`array.array` of
+            ``"d"`` values per contour, as returned by
+            :meth:`BaseContour._getPolygon`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        key = self._getPolygonKey()
+        cache = getattr(self, "_polygonCache", None)
+        if key is not None and cache is not None and cache[0] == key:
+            return cache[1]
+        polygons = [contour._getPolygon() for contour in self.contours]
+        if key is not None:
+            self._polygonCache = (key, polygons)
+        return polygons
+
+    def _getPolygonKey(self) -> Any:
+        """Get a key describing the contours of the native glyph.
+
+        The polygons built by :meth:`_getContourPolygons` and the
+        hierarchy built by :meth:`_getContourHierarchy` are cached with
+        this key. The key must therefore change whenever a contour changes,
+        including changes of coordinates.
+
+        :return: A key that can be compared with ``==``, or :obj:`None`
+            to disable caching. The base implementation returns
+            :obj:`None`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return None
+
     bounds: dynamicProperty = dynamicProperty(
         "base_bounds",
         """Get the bounds of the glyph.
@@ -3672,6 +4466,50 @@ class BaseGlyph(
         """
         self.raiseNotImplementedError()
 
+    # -------
+    # Changes
+    # -------
+
+    def holdChanges(self) -> AbstractContextManager[None]:
+        """Hold change notifications for the glyph until the block exits.
+
+        Use this when making many edits to the glyph's outline. The
+        notifications posted by edits made inside the block are
+        coalesced and delivered once, when the outermost block exits.
+        This makes bulk edits much cheaper in environments that observe
+        changes. Only notifications about changed content are held.
+        Names, unicodes and which glyphs exist are updated at once.
+        Derived data, such as cached bounds, may not be updated until
+        the block exits. Blocks may be nested.
+
+        :return: A context manager.
+
+        Example::
+
+            >>> with glyph.holdChanges():
+            ...     for contour in glyph.contours:
+            ...         for point in contour.points:
+            ...             point.x += 10
+
+        """
+        return self._holdChanges()
+
+    def _holdChanges(self) -> AbstractContextManager[None]:
+        """Hold change notifications for the native glyph until the block exits.
+
+        This is the environment implementation of
+        :meth:`BaseGlyph.holdChanges`. The default implementation
+        does nothing.
+
+        :return: A context manager.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return nullcontext()
+
     # ---
     # API
     # ---
@@ -14,6 +14,7 @@ from fontParts.base.base import (
     reference,
 )
 from fontParts.base import normalizers
+from fontParts.base.errors import FontPartsError
 from fontParts.base.compatibility import GuidelineCompatibilityReporter
 from fontParts.base.color import Color
 from fontParts.base.deprecated import DeprecatedGuideline, RemovedGuideline
@@ -49,6 +50,14 @@ class BaseGuideline(
 
     """
 
+    # Compact environment subclasses provide the _font and _glyph slots. They
+    # can't be declared here at runtime, because the environment's
+    # own base class usually holds slots as well.
+    if TYPE_CHECKING:
+        __slots__ = ("_font", "_glyph")
+    else:
+        __slots__ = ()
+
     copyAttributes: tuple[str, ...] = ("x", "y", "angle", "name", "color")
 
     def _reprContents(self) -> list[str]:
@@ -444,7 +453,10 @@ class BaseGuideline(
             parent = self.font
         if parent is None:
             return None
-        return parent.guidelines.index(self)
+        try:
+            return parent._getGuidelineIndex(self)
+        except FontPartsError:
+            raise ValueError(f"{self!r} is not in its parent.")
 
     # name
 
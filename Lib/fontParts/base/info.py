@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any
 from collections.abc import Callable
 
 from fontTools.ufoLib import fontInfoAttributesVersion3
+from fontTools.ufoLib import fontInfoAttributesVersion3ValueData
 from fontTools.ufoLib import validateFontInfoVersion3ValueForAttribute
 from fontMath import MathInfo
 from fontMath.mathFunctions import setRoundIntegerFunction
@@ -11,7 +12,14 @@ from fontParts.base.base import BaseObject, dynamicProperty, interpolate, refere
 from fontParts.base import normalizers
 from fontParts.base.errors import FontPartsError
 from fontParts.base.deprecated import DeprecatedInfo, RemovedInfo
-from fontParts.base.annotations import InterpolationFactorPair, InterpolationFactorLike
+from fontParts.base.annotations import (
+    InterpolationFactorPair,
+    InterpolationFactor,
+    InterpolationFactorLike,
+    ScaleFactorLike,
+    ScaleFactorPair,
+    CollectionType,
+)
 
 if TYPE_CHECKING:
     from fontParts.base.font import BaseFont
@@ -471,6 +479,52 @@ class BaseInfo(BaseObject, DeprecatedInfo, RemovedInfo):
     fontInfoAttributes.remove("guidelines")
     copyAttributes = tuple(fontInfoAttributes)
 
+    # Attributes measured in font units, grouped by the direction they
+    # scale in. The directions follow fontMath's MathInfo.
+    horizontalScaleAttributes: tuple[str, ...] = (
+        "openTypeOS2SubscriptXSize",
+        "openTypeOS2SubscriptXOffset",
+        "openTypeOS2SuperscriptXSize",
+        "openTypeOS2SuperscriptXOffset",
+        "postscriptStemSnapH",
+        "postscriptDefaultWidthX",
+        "postscriptNominalWidthX",
+    )
+    verticalScaleAttributes: tuple[str, ...] = (
+        "descender",
+        "xHeight",
+        "capHeight",
+        "ascender",
+        "openTypeHheaAscender",
+        "openTypeHheaDescender",
+        "openTypeHheaLineGap",
+        "openTypeHheaCaretOffset",
+        "openTypeOS2TypoAscender",
+        "openTypeOS2TypoDescender",
+        "openTypeOS2TypoLineGap",
+        "openTypeOS2WinAscent",
+        "openTypeOS2WinDescent",
+        "openTypeOS2SubscriptYSize",
+        "openTypeOS2SubscriptYOffset",
+        "openTypeOS2SuperscriptYSize",
+        "openTypeOS2SuperscriptYOffset",
+        "openTypeOS2StrikeoutSize",
+        "openTypeOS2StrikeoutPosition",
+        "openTypeVheaVertTypoAscender",
+        "openTypeVheaVertTypoDescender",
+        "openTypeVheaVertTypoLineGap",
+        "openTypeVheaCaretOffset",
+        "postscriptUnderlineThickness",
+        "postscriptUnderlinePosition",
+        "postscriptBlueValues",
+        "postscriptOtherBlues",
+        "postscriptFamilyBlues",
+        "postscriptFamilyOtherBlues",
+        "postscriptStemSnapV",
+        "postscriptBlueFuzz",
+        "postscriptBlueShift",
+    )
+
     def _reprContents(self) -> list[str]:
         contents = []
         if self.font is not None:
@@ -706,6 +760,65 @@ class BaseInfo(BaseObject, DeprecatedInfo, RemovedInfo):
         mathInfo = mathInfo.round()
         self._fromMathInfo(mathInfo, guidelines=False)
 
+    # --------------
+    # Transformation
+    # --------------
+
+    def scaleBy(self, value: ScaleFactorLike) -> None:
+        """Scale the attributes measured in font units.
+
+        The attributes in :attr:`horizontalScaleAttributes` are scaled
+        by the x factor and those in :attr:`verticalScaleAttributes` by
+        the y factor. Attributes that only allow integers are rounded.
+        Proportions such as :attr:`unitsPerEm`, angles, classes and
+        caret slopes are left untouched.
+
+        :param value: The value to scale by as a single :class:`int` or
+            :class:`float`, or a :class:`tuple` or :class:`list` of two
+            :class:`int` or :class:`float` values representing the
+            factors ``(x, y)``.
+
+        Example::
+
+            >>> info.scaleBy(2)
+            >>> info.scaleBy((0.5, 2))
+
+        """
+        value = normalizers.normalizeTransformationScale(value)
+        self._scaleBy(value)
+
+    def _scaleBy(self, value: ScaleFactorPair, **kwargs: Any) -> None:
+        r"""Scale the native attributes measured in font units.
+
+        This is the environment implementation of :meth:`BaseInfo.scaleBy`.
+
+        :param value: The factors ``(x, y)`` to scale by as a :class:`tuple`
+            of two :class:`float` values. The value will have been
+            normalized with :func:`normalizers.normalizeTransformationScale`.
+        :param \**kwargs: Additional keyword arguments.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        xFactor, yFactor = value
+        for attributes, factor in (
+            (self.horizontalScaleAttributes, xFactor),
+            (self.verticalScaleAttributes, yFactor),
+        ):
+            for attr in attributes:
+                attrValue = getattr(self, attr)
+                if attrValue is None:
+                    continue
+                if fontInfoAttributesVersion3ValueData[attr]["type"] is int:
+                    attrValue = normalizers.normalizeVisualRounding(attrValue * factor)
+                elif isinstance(attrValue, list):
+                    attrValue = [v * factor for v in attrValue]
+                else:
+                    attrValue *= factor
+                setattr(self, attr, attrValue)
+
     # --------
     # Updating
     # --------
@@ -913,3 +1026,69 @@ class BaseInfo(BaseObject, DeprecatedInfo, RemovedInfo):
         if round:
             result = result.round()
         self._fromMathInfo(result)
+
+    def combine(
+        self,
+        masters: CollectionType[tuple[BaseInfo, InterpolationFactorLike]],
+        round: bool = True,
+        suppressError: bool = True,
+    ) -> None:
+        """Replace all possible data in the info object with a weighted sum.
+
+        :param masters: A :class:`list` or :class:`tuple` of
+            ``(info, weight)`` pairs, where each info is a :class:`BaseInfo`
+            instance and each weight is a single :class:`int`
+            or :class:`float` or a :class:`tuple` of two :class:`int`
+            or :class:`float` values representing the weights ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers. Defaults to :obj:`True`.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found. Defaults to :obj:`True`.
+        :raises TypeError: If `masters` is not a list of pairs or any
+            master is not an instance of :class:`BaseInfo`.
+        :raises ValueError: If `masters` is empty.
+
+        Example::
+
+            >>> info.combine([(otherInfo1, 0.25), (otherInfo2, 0.75)])
+
+        """
+        normalizedMasters = normalizers.normalizeCombinationMasters(masters, BaseInfo)
+        round = normalizers.normalizeBoolean(round)
+        suppressError = normalizers.normalizeBoolean(suppressError)
+        self._combine(normalizedMasters, round=round, suppressError=suppressError)
+
+    def _combine(
+        self,
+        masters: list[tuple[BaseInfo, InterpolationFactor]],
+        round: bool,
+        suppressError: bool,
+    ) -> None:
+        """Replace all possible data in the native info object with a weighted sum.
+
+        This is the environment implementation of :meth:`BaseInfo.combine`.
+
+        :param masters: A :class:`list` of ``(info, weight)`` pairs, where
+            each info is a :class:`BaseInfo` subclass instance and each
+            weight is a :class:`tuple` of two :class:`float` values
+            representing the weights ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        setRoundIntegerFunction(normalizers.normalizeVisualRounding)
+        firstInfo, firstWeight = masters[0]
+        result = firstInfo._toMathInfo() * firstWeight
+        for info, weight in masters[1:]:
+            result = result + info._toMathInfo() * weight
+        if round:
+            result = result.round()
+        self._fromMathInfo(result)
@@ -0,0 +1,358 @@
+"""Interpolate between the same masters at many factors.
+
+The objects in this module are returned by
+:meth:`BaseLayer.prepareInterpolation <fontParts.base.BaseLayer.prepareInterpolation>`.
+They convert and compare the masters once, so generating every further
+instance only costs the arithmetic and the writing of the result.
+
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from fontMath import MathGlyph
+from fontMath.mathFunctions import setRoundIntegerFunction
+
+from fontParts.base import normalizers
+from fontParts.base.annotations import InterpolationFactor, InterpolationFactorLike
+from fontParts.base.arrays import (
+    PackedOutline,
+    PackedOutlineInterpolator,
+    PackedOutlinePointPen,
+)
+from fontParts.base.base import trustedMode
+from fontParts.base.errors import FontPartsError
+
+if TYPE_CHECKING:
+    from fontParts.base.glyph import BaseGlyph
+    from fontParts.base.layer import BaseLayer
+
+
+class GlyphInterpolation:
+    """Interpolate between two glyphs at any number of factors.
+
+    The outlines and metrics of the masters are read when the object is
+    created, so it must be created again after the masters change.
+
+    :param minGlyph: The :class:`BaseGlyph` instance corresponding to the
+        0.0 position in the interpolation.
+    :param maxGlyph: The :class:`BaseGlyph` instance corresponding to the
+        1.0 position in the interpolation.
+
+    """
+
+    def __init__(self, minGlyph: BaseGlyph, maxGlyph: BaseGlyph) -> None:
+        self.name = minGlyph.name
+        self._minGlyph = minGlyph
+        self._maxGlyph = maxGlyph
+        self._width = (minGlyph.width, maxGlyph.width - minGlyph.width)
+        self._height = (minGlyph.height, maxGlyph.height - minGlyph.height)
+        self._interpolator = None
+        outlines = self._minGlyph._getMathOutlines((self._minGlyph, self._maxGlyph))
+        if outlines is not None:
+            self._interpolator = PackedOutlineInterpolator.fromOutlines(*outlines)
+        self._mathGlyphs: tuple[MathGlyph, MathGlyph | None] | None = None
+
+    def _getMathGlyphs(self) -> tuple[MathGlyph, MathGlyph | None]:
+        # Return the MathGlyph of the min master and the difference
+        # to the max master, or None for incompatible masters.
+        if self._mathGlyphs is None:
+            minMathGlyph = self._minGlyph._toMathGlyph(
+                scaleComponentTransform=True, strict=False
+            )
+            maxMathGlyph = self._maxGlyph._toMathGlyph(
+                scaleComponentTransform=True, strict=False
+            )
+            # The subtraction doesn't fail for every incompatibility,
+            # so the addition done by every instance is tried as well.
+            try:
+                delta = maxMathGlyph - minMathGlyph
+                minMathGlyph + delta
+            except IndexError:
+                delta = None
+            self._mathGlyphs = (minMathGlyph, delta)
+        return self._mathGlyphs
+
+    def _interpolateMathGlyph(
+        self, factor: InterpolationFactor, round: bool
+    ) -> MathGlyph | None:
+        minMathGlyph, delta = self._getMathGlyphs()
+        if delta is None:
+            return None
+        setRoundIntegerFunction(normalizers.normalizeVisualRounding)
+        result = minMathGlyph + delta * factor
+        if round:
+            result = result.round()
+        return result
+
+    def _interpolateOutline(
+        self, factor: InterpolationFactor, round: bool
+    ) -> PackedOutline | None:
+        if self._interpolator is None:
+            return None
+        roundValue = normalizers.normalizeVisualRounding if round else None
+        return self._interpolator.interpolate(factor, roundValue)
+
+    def interpolateGlyph(
+        self,
+        factor: InterpolationFactorLike,
+        glyph: BaseGlyph | None = None,
+        round: bool = True,
+        suppressError: bool = True,
+    ) -> BaseGlyph:
+        """Interpolate the masters into a glyph.
+
+        :param factor: The interpolation value as a single :class:`int`
+            or :class:`float` or a :class:`tuple` of two :class:`int`
+            or :class:`float` values representing the factors ``(x, y)``.
+        :param glyph: The :class:`BaseGlyph` instance to replace the data
+            of, or :obj:`None` to create a new glyph with the name of the
+            min master. Defaults to :obj:`None`.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers. Defaults to :obj:`True`.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found. Defaults to :obj:`True`.
+        :return: The interpolated :class:`BaseGlyph` instance.
+        :raises TypeError: If `glyph` is not a :class:`BaseGlyph` instance.
+        :raises FontPartsError: If ``suppressError=False`` and the masters
+            could not be interpolated.
+
+        Example::
+
+            >>> glyph = interpolation.interpolateGlyph(0.5)
+
+        """
+        factor = normalizers.normalizeInterpolationFactor(factor)
+        if glyph is None:
+            copyClass = self._minGlyph.copyClass
+            if copyClass is None:
+                copyClass = self._minGlyph.__class__
+            glyph = copyClass()
+            glyph.name = self.name
+        else:
+            glyph = normalizers.normalizeGlyph(glyph)
+        round = normalizers.normalizeBoolean(round)
+        suppressError = normalizers.normalizeBoolean(suppressError)
+        self._interpolateGlyph(factor, glyph, round, suppressError)
+        return glyph
+
+    def _interpolateGlyph(
+        self,
+        factor: InterpolationFactor,
+        glyph: BaseGlyph,
+        round: bool,
+        suppressError: bool,
+    ) -> None:
+        outline = self._interpolateOutline(factor, round)
+        if outline is not None:
+            xFactor, yFactor = factor
+            minWidth, widthDelta = self._width
+            minHeight, heightDelta = self._height
+            glyph._setMathOutline(
+                self._minGlyph,
+                outline,
+                minWidth + widthDelta * xFactor,
+                minHeight + heightDelta * yFactor,
+                round,
+            )
+            return
+        result = self._interpolateMathGlyph(factor, round)
+        if result is None:
+            if not suppressError:
+                raise FontPartsError(f"Glyph '{self.name}' could not be interpolated.")
+            return
+        with trustedMode():
+            glyph._fromMathGlyph(result, toThisGlyph=True, filterRedundantPoints=True)
+
+    def interpolateOutline(
+        self, factor: InterpolationFactorLike, round: bool = True
+    ) -> PackedOutline | None:
+        """Interpolate the outlines of the masters without creating a glyph.
+
+        :param factor: The interpolation value as a single :class:`int`
+            or :class:`float` or a :class:`tuple` of two :class:`int`
+            or :class:`float` values representing the factors ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers. Defaults to :obj:`True`.
+        :return: A :class:`fontParts.base.arrays.PackedOutline` with the
+            same contours, components and anchors an interpolated glyph
+            would get, or :obj:`None` if the masters could not be
+            interpolated.
+
+        Example::
+
+            >>> outline = interpolation.interpolateOutline(0.5)
+
+        """
+        factor = normalizers.normalizeInterpolationFactor(factor)
+        round = normalizers.normalizeBoolean(round)
+        outline = self._interpolateOutline(factor, round)
+        if outline is not None:
+            return outline
+        result = self._interpolateMathGlyph(factor, round)
+        if result is None:
+            return None
+        pen = PackedOutlinePointPen()
+        result.drawPoints(pen, filterRedundantPoints=True)
+        anchorNames = []
+        anchorCoordinates = array("d")
+        for anchor in result.anchors:
+            anchorNames.append(anchor.get("name"))
+            anchorCoordinates.extend((anchor["x"], anchor["y"]))
+        return PackedOutline(
+            pen.coordinates,
+            pen.pointTypes,
+            pen.smoothFlags,
+            pen.contourEnds,
+            tuple(pen.componentNames),
+            pen.componentTransformations,
+            tuple(anchorNames),
+            anchorCoordinates,
+        )
+
+
+class LayerInterpolation:
+    """Interpolate between two layers at any number of factors.
+
+    Only the glyphs that are in both layers are interpolated. The
+    masters are read when the object is created, so it must be created
+    again after they change.
+
+    :param layer: The :class:`BaseLayer` instance that
+        :meth:`interpolateLayer` writes to by default.
+    :param minLayer: The :class:`BaseLayer` instance corresponding to the
+        0.0 position in the interpolation.
+    :param maxLayer: The :class:`BaseLayer` instance corresponding to the
+        1.0 position in the interpolation.
+
+    """
+
+    glyphInterpolationClass = GlyphInterpolation
+
+    def __init__(
+        self, layer: BaseLayer, minLayer: BaseLayer, maxLayer: BaseLayer
+    ) -> None:
+        self._layer = layer
+        self._glyphs: dict[str, GlyphInterpolation] = {}
+        for glyphName in minLayer._keys():
+            if not maxLayer._contains(glyphName):
+                continue
+            minGlyph = minLayer._getItem(glyphName)
+            minLayer._setLayerInGlyph(minGlyph)
+            maxGlyph = maxLayer._getItem(glyphName)
+            maxLayer._setLayerInGlyph(maxGlyph)
+            self._glyphs[glyphName] = self.glyphInterpolationClass(minGlyph, maxGlyph)
+
+    def keys(self) -> tuple[str, ...]:
+        """Get the names of the glyphs that are interpolated.
+
+        :return: A :class:`tuple` of glyph names.
+
+        """
+        return tuple(self._glyphs)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._glyphs
+
+    def __getitem__(self, name: str) -> GlyphInterpolation:
+        """Get the interpolation of a glyph.
+
+        :param name: The name of the glyph.
+        :return: A :class:`GlyphInterpolation`.
+        :raises KeyError: If the glyph is not in both masters.
+
+        """
+        name = normalizers.normalizeGlyphName(name)
+        if name not in self._glyphs:
+            raise KeyError(f"No glyph named '{name}' is in both masters.")
+        return self._glyphs[name]
+
+    def interpolateLayer(
+        self,
+        factor: InterpolationFactorLike,
+        layer: BaseLayer | None = None,
+        round: bool = True,
+        suppressError: bool = True,
+    ) -> BaseLayer:
+        """Interpolate the masters into a layer.
+
+        This gives the same result as :meth:`BaseLayer.interpolate`.
+
+        :param factor: The interpolation value as a single :class:`int`
+            or :class:`float` or a :class:`tuple` of two :class:`int`
+            or :class:`float` values representing the factors ``(x, y)``.
+        :param layer: The :class:`BaseLayer` instance to replace the
+            glyphs of, or :obj:`None` for the layer the interpolation
+            was prepared with. Defaults to :obj:`None`.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers. Defaults to :obj:`True`.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found. Defaults to :obj:`True`.
+        :return: The interpolated :class:`BaseLayer` instance.
+        :raises TypeError: If `layer` is not a :class:`BaseLayer` instance.
+        :raises FontPartsError: If ``suppressError=False`` and any glyph
+            could not be interpolated.
+
+        Example::
+
+            >>> for index, layer in enumerate(instanceLayers):
+            ...     interpolation.interpolateLayer(index / 10, layer)
+
+        """
+        factor = normalizers.normalizeInterpolationFactor(factor)
+        if layer is None:
+            layer = self._layer
+        else:
+            layer = normalizers.normalizeLayer(layer)
+        round = normalizers.normalizeBoolean(round)
+        suppressError = normalizers.normalizeBoolean(suppressError)
+        for glyphName in layer._keys():
+            layer._removeGlyph(glyphName)
+        for glyphName, glyphInterpolation in self._glyphs.items():
+            glyph = layer._newGlyph(glyphName)
+            layer._setLayerInGlyph(glyph)
+            glyphInterpolation._interpolateGlyph(factor, glyph, round, suppressError)
+        return layer
+
+    def interpolateGlyph(
+        self,
+        name: str,
+        factor: InterpolationFactorLike,
+        glyph: BaseGlyph | None = None,
+        round: bool = True,
+        suppressError: bool = True,
+    ) -> BaseGlyph:
+        """Interpolate one glyph of the masters.
+
+        See :meth:`GlyphInterpolation.interpolateGlyph`.
+
+        :param name: The name of the glyph.
+
+        Example::
+
+            >>> glyph = interpolation.interpolateGlyph("A", 0.5)
+
+        """
+        return self[name].interpolateGlyph(
+            factor, glyph=glyph, round=round, suppressError=suppressError
+        )
+
+    def interpolateOutline(
+        self, name: str, factor: InterpolationFactorLike, round: bool = True
+    ) -> PackedOutline | None:
+        """Interpolate the outline of one glyph without creating a glyph.
+
+        See :meth:`GlyphInterpolation.interpolateOutline`.
+
+        :param name: The name of the glyph.
+
+        Example::
+
+            >>> outline = interpolation.interpolateOutline("A", 0.5)
+
+        """
+        return self[name].interpolateOutline(factor, round=round)
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, TypeVar
 
 from fontParts.base import normalizers
 from fontParts.base.annotations import (
+    InterpolationFactor,
     InterpolationFactorLike,
     InterpolationFactorPair,
     ScaleFactorLike,
@@ -284,8 +285,72 @@ class BaseKerning(BaseDict, DeprecatedKerning, RemovedKerning):
             result = interpolate(minMathKerning, maxMathKerning, factor)
             if round:
                 result.round()
-            self.clear()
-            result.extractKerning(self.font)
+            # This is MathKerning.extractKerning without the
+            # normalization of every pair and group on the way in.
+            self._clear()
+            self._update(dict(result.items()))
+            groups = self.font.groups
+            groups._update(
+                {name: tuple(members) for name, members in result.groups().items()}
+            )
+
+    def _combine(
+        self,
+        masters: list[tuple[BaseKerning, InterpolationFactor]],
+        round: bool,
+        suppressError: bool,
+    ) -> None:
+        """Replace all kerning pairs in the native font with a weighted sum of kernings.
+
+        The kerning data will be replaced by the combined kerning. Only
+        the ``x`` weights are used. This is used by
+        :meth:`BaseFont.combine`. It isn't public, because
+        ``Kerning.combine`` was a RoboFab method with a different
+        meaning.
+
+        :param masters: A :class:`list` of ``(kerning, weight)`` pairs,
+            where each kerning is a :class:`BaseKerning` subclass instance
+            and each weight is a :class:`tuple` of two :class:`float`
+            values representing the weights ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found.
+        :raises ValueError: If the kerning groups of the masters are not
+            compatible and `supressError` is :obj:`False`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        from fontMath import MathKerning
+        from fontMath.mathFunctions import setRoundIntegerFunction
+
+        setRoundIntegerFunction(normalizers.normalizeVisualRounding)
+        firstKerning = masters[0][0]
+        for kerning, _ in masters[1:]:
+            if not self._testKerningGroupCompatibility(
+                firstKerning, kerning, suppressError=suppressError
+            ):
+                self.clear()
+                return
+        result = (
+            MathKerning(kerning=firstKerning, groups=firstKerning.font.groups)
+            * masters[0][1]
+        )
+        for kerning, weight in masters[1:]:
+            mathKerning = MathKerning(kerning=kerning, groups=kerning.font.groups)
+            result = result + mathKerning * weight
+        if round:
+            result.round()
+        self._clear()
+        self._update(dict(result.items()))
+        groups = self.font.groups
+        groups._update(
+            {name: tuple(members) for name, members in result.groups().items()}
+        )
 
     @staticmethod
     def _testKerningGroupCompatibility(
@@ -1,5 +1,6 @@
 # pylint: disable=C0103, C0302, C0114, W0613
 from __future__ import annotations
+from contextlib import AbstractContextManager, nullcontext
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 from collections.abc import Callable, Iterator
@@ -14,10 +15,12 @@ from fontParts.base.base import (
 )
 from fontParts.base import normalizers
 from fontParts.base.compatibility import LayerCompatibilityReporter
+from fontParts.base.interpolation import LayerInterpolation
 from fontParts.base.color import Color
 from fontParts.base.deprecated import DeprecatedLayer, RemovedLayer
 from fontParts.base.annotations import (
     InterpolationFactorPair,
+    InterpolationFactor,
     InterpolationFactorLike,
     RGBALike,
     RGBA,
@@ -116,8 +119,13 @@ class _BaseGlyphVendor(BaseObject, SelectionMixin, ABC):
             Subclasses may override this method.
 
         """
+        # The names come straight from the native layer, so
+        # there is no need to normalize them or test their
+        # membership again for every glyph.
         for name in self.keys():
-            yield self[name]
+            glyph = self._getItem(name)
+            self._setLayerInGlyph(glyph)
+            yield glyph
 
     def __getitem__(self, name: str) -> BaseGlyph:
         """Get the specified glyph from the layer.
@@ -132,7 +140,7 @@ class _BaseGlyphVendor(BaseObject, SelectionMixin, ABC):
 
         """
         name = normalizers.normalizeGlyphName(name)
-        if name not in self:
+        if not self._contains(name):
             raise KeyError(f"No glyph named '{name}'.")
         glyph = self._getItem(name)
         self._setLayerInGlyph(glyph)
@@ -178,8 +186,8 @@ class _BaseGlyphVendor(BaseObject, SelectionMixin, ABC):
 
         """
         name = normalizers.normalizeGlyphName(name)
-        if name in self:
-            del self[name]
+        if self._contains(name):
+            self._removeGlyph(name)
         return self._insertGlyph(glyph, name=name)
 
     def __delitem__(self, name: str) -> None:
@@ -191,7 +199,7 @@ class _BaseGlyphVendor(BaseObject, SelectionMixin, ABC):
 
         """
         name = normalizers.normalizeGlyphName(name)
-        if name not in self:
+        if not self._contains(name):
             raise KeyError(f"No glyph named '{name}'.")
         self._removeGlyph(name)
 
@@ -276,7 +284,10 @@ class _BaseGlyphVendor(BaseObject, SelectionMixin, ABC):
 
         .. note::
 
-            Subclasses may override this method.
+            Subclasses may override this method. The default
+            implementation searches :meth:`keys`, so environments
+            with a hashed native glyph store should override it
+            to make membership tests constant time.
 
         """
         return name in self.keys()
@@ -689,7 +700,7 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
         super().copyData(source)
         for name in source.keys():
             glyph = self.newGlyph(name)
-            glyph.copyData(source[name])
+            glyph.copyData(source._getItem(name))
 
     # -------
     # Parents
@@ -1028,6 +1039,45 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
         for glyph in self:
             glyph.autoUnicodes()
 
+    def holdChanges(self) -> AbstractContextManager[None]:
+        """Hold change notifications for the layer until the block exits.
+
+        Use this when editing many glyphs in the layer. The
+        notifications posted by edits made inside the block are
+        coalesced and delivered once, when the outermost block exits.
+        This makes bulk edits much cheaper in environments that observe
+        changes. Only notifications about changed content are held.
+        Names, unicodes and which glyphs exist are updated at once.
+        Derived data, such as cached bounds, may not be updated until
+        the block exits. Blocks may be nested.
+
+        :return: A context manager.
+
+        Example::
+
+            >>> with layer.holdChanges():
+            ...     for glyph in layer:
+            ...         glyph.moveBy((10, 0))
+
+        """
+        return self._holdChanges()
+
+    def _holdChanges(self) -> AbstractContextManager[None]:
+        """Hold change notifications for the native layer until the block exits.
+
+        This is the environment implementation of
+        :meth:`BaseLayer.holdChanges`. The default implementation
+        does nothing.
+
+        :return: A context manager.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return nullcontext()
+
     # -------------
     # Interpolation
     # -------------
@@ -1113,18 +1163,163 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
             Subclasses may override this method.
 
         """
+        # The glyph names and arguments have all been normalized already,
+        # so the environment methods are called directly.
         for glyphName in self.keys():
-            del self[glyphName]
+            self._removeGlyph(glyphName)
         for glyphName in minLayer.keys():
-            if glyphName not in maxLayer:
+            if not maxLayer._contains(glyphName):
                 continue
-            minGlyph = minLayer[glyphName]
-            maxGlyph = maxLayer[glyphName]
-            dstGlyph = self.newGlyph(glyphName)
-            dstGlyph.interpolate(
+            minGlyph = minLayer._getItem(glyphName)
+            minLayer._setLayerInGlyph(minGlyph)
+            maxGlyph = maxLayer._getItem(glyphName)
+            maxLayer._setLayerInGlyph(maxGlyph)
+            dstGlyph = self._newGlyph(glyphName)
+            self._setLayerInGlyph(dstGlyph)
+            dstGlyph._interpolate(
                 factor, minGlyph, maxGlyph, round=round, suppressError=suppressError
             )
 
+    def combine(
+        self,
+        masters: CollectionType[tuple[BaseLayer, InterpolationFactorLike]],
+        round: bool = True,
+        suppressError: bool = True,
+    ) -> None:
+        """Replace all possible data in the layer with a weighted sum of layers.
+
+        Every glyph that is in all of the masters is combined with
+        :meth:`BaseGlyph.combine`.
+
+        :param masters: A :class:`list` or :class:`tuple` of
+            ``(layer, weight)`` pairs, where each layer is
+            a :class:`BaseLayer` instance and each weight is a
+            single :class:`int` or :class:`float` or a :class:`tuple` of
+            two :class:`int` or :class:`float` values representing the
+            weights ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers. Defaults to :obj:`True`.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found. Defaults to :obj:`True`.
+        :raises TypeError: If `masters` is not a list of pairs or any
+            master is not an instance of :class:`BaseLayer`.
+        :raises ValueError: If `masters` is empty.
+
+        Example::
+
+            >>> layer.combine([(light, 0.25), (regular, 0.5), (bold, 0.25)])
+
+        """
+        normalizedMasters = normalizers.normalizeCombinationMasters(masters, BaseLayer)
+        round = normalizers.normalizeBoolean(round)
+        suppressError = normalizers.normalizeBoolean(suppressError)
+        self._combine(normalizedMasters, round=round, suppressError=suppressError)
+
+    def _combine(
+        self,
+        masters: list[tuple[BaseLayer, InterpolationFactor]],
+        round: bool,
+        suppressError: bool,
+    ) -> None:
+        """Replace all possible data in the native layer with a weighted sum of layers.
+
+        This is the environment implementation of :meth:`BaseLayer.combine`.
+
+        :param masters: A :class:`list` of ``(layer, weight)`` pairs, where
+            each layer is a :class:`BaseLayer` subclass instance and each
+            weight is a :class:`tuple` of two :class:`float` values
+            representing the weights ``(x, y)``.
+        :param round: A :class:`bool` indicating whether the result should
+            be rounded to integers.
+        :param suppressError: A :class:`bool` indicating whether to ignore
+            incompatible data or raise an error when such
+            incompatibilities are found.
+        :raises FontPartsError: If ``suppressError=False`` and the glyphs
+            could not be combined.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        # The masters and arguments have all been normalized already,
+        # so the environment methods are called directly.
+        for glyphName in self.keys():
+            self._removeGlyph(glyphName)
+        firstLayer = masters[0][0]
+        for glyphName in firstLayer._keys():
+            if not all(layer._contains(glyphName) for layer, _ in masters):
+                continue
+            glyphMasters = []
+            for layer, weight in masters:
+                glyph = layer._getItem(glyphName)
+                layer._setLayerInGlyph(glyph)
+                glyphMasters.append((glyph, weight))
+            dstGlyph = self._newGlyph(glyphName)
+            self._setLayerInGlyph(dstGlyph)
+            dstGlyph._combine(glyphMasters, round=round, suppressError=suppressError)
+
+    interpolationClass = LayerInterpolation
+
+    def prepareInterpolation(
+        self, minLayer: BaseLayer, maxLayer: BaseLayer
+    ) -> LayerInterpolation:
+        """Prepare the interpolation between two layers for many factors.
+
+        The masters are converted and compared once. The returned object
+        generates instance layers, glyphs or packed outlines at any
+        factor in a fraction of the time :meth:`interpolate` needs.
+        Prepare the interpolation again after changing the masters.
+
+        :param minLayer: The :class:`BaseLayer` instance corresponding to the
+            0.0 position in the interpolation.
+        :param maxLayer: The :class:`BaseLayer` instance corresponding to the
+            1.0 position in the interpolation.
+        :return: A :class:`fontParts.base.interpolation.LayerInterpolation`
+            that writes to this layer by default.
+        :raises TypeError: If `minLayer` or `maxLayer` are not instances
+            of :class:`BaseLayer`.
+
+        Example::
+
+            >>> interpolation = layer.prepareInterpolation(lightLayer, boldLayer)
+            >>> interpolation.interpolateLayer(0.25)
+            >>> glyph = interpolation.interpolateGlyph("A", 0.75)
+            >>> outline = interpolation.interpolateOutline("A", 0.5)
+
+        """
+        if not isinstance(minLayer, BaseLayer):
+            raise TypeError(
+                f"Interpolation to an instance of {self.__class__.__name__!r} can not be performed from an instance of {minLayer.__class__.__name__!r}."
+            )
+        if not isinstance(maxLayer, BaseLayer):
+            raise TypeError(
+                f"Interpolation to an instance of {self.__class__.__name__!r} can not be performed from an instance of {maxLayer.__class__.__name__!r}."
+            )
+        return self._prepareInterpolation(minLayer, maxLayer)
+
+    def _prepareInterpolation(
+        self, minLayer: BaseLayer, maxLayer: BaseLayer
+    ) -> LayerInterpolation:
+        """Prepare the interpolation between two native layers for many factors.
+
+        This is the environment implementation of
+        :meth:`BaseLayer.prepareInterpolation`.
+
+        :param minLayer: The :class:`BaseLayer` subclass instance
+            corresponding to the 0.0 position in the interpolation.
+        :param maxLayer: The :class:`BaseLayer` subclass instance
+            corresponding to the 1.0 position in the interpolation.
+        :return: An instance of :attr:`interpolationClass`.
+
+        .. note::
+
+            Subclasses may override this method.
+
+        """
+        return self.interpolationClass(self, minLayer, maxLayer)
+
     compatibilityReporterClass = LayerCompatibilityReporter
 
     def isCompatible(
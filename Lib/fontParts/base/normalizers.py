@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from array import array
 from collections import Counter
 from fontTools.misc.fixedTools import otRound
 from pathlib import Path
@@ -40,6 +41,7 @@ if TYPE_CHECKING:
     from fontParts.base.component import BaseComponent
     from fontParts.base.anchor import BaseAnchor
     from fontParts.base.guideline import BaseGuideline
+    from fontParts.base.arrays import PackedOutline
 
 # ----
 # Font
@@ -164,6 +166,25 @@ def normalizeGlyphOrder(value: CollectionType[str]) -> tuple[str, ...]:
     return tuple(value)
 
 
+def normalizeUnitsPerEm(value: IntFloatType) -> IntFloatType:
+    """Normalize a font's units per em.
+
+    :param value: The units per em to normalize as an :class:`int`
+        or :class:`float`.
+    :return: The normalized value as an :class:`int` or :class:`float`.
+    :raises TypeError: If `value` is not an :class:`int` or :class:`float`.
+    :raises ValueError: If `value` is not greater than zero.
+
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(
+            f"Units per em must be an int or float, not {type(value).__name__}."
+        )
+    if value <= 0:
+        raise ValueError(f"Units per em must be greater than zero, not {value}.")
+    return value
+
+
 # -------
 # Kerning
 # -------
@@ -1106,6 +1127,142 @@ def normalizeRotationAngle(value: IntFloatType) -> float:
     return float(value)
 
 
+def normalizeCoordinateArray(value: Any) -> array:
+    """Normalize an array of coordinates.
+
+    :param value: The coordinates to normalize as an array of shape
+        ``(N, 2)``. This may be a NumPy array, a :class:`memoryview`
+        as returned by :func:`fontParts.base.arrays.makeCoordinateArray`
+        or a sequence of coordinate pairs.
+    :return: A flat :class:`array.array` of ``"d"`` values holding the
+        ``x`` and ``y`` values in turn.
+    :raises TypeError:
+        - If `value` is not an array or a sequence.
+        - If any value is not a number.
+    :raises ValueError: If `value` does not have the shape ``(N, 2)``.
+
+    """
+    from fontParts.base.arrays import numpy
+
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        if value.ndim != 2 or value.shape[1] != 2:
+            raise ValueError(
+                f"Coordinate arrays must have the shape (N, 2), not {value.shape}."
+            )
+        if not numpy.issubdtype(value.dtype, numpy.number):
+            raise TypeError(
+                f"Coordinate arrays must contain numbers, not {value.dtype}."
+            )
+        contiguous = numpy.ascontiguousarray(value, dtype=numpy.float64)
+        return array("d", contiguous.tobytes())
+    if isinstance(value, memoryview):
+        if not len(value):
+            return array("d")
+        if value.ndim != 2 or value.shape is None or value.shape[1] != 2:
+            raise ValueError(
+                f"Coordinate arrays must have the shape (N, 2), not {value.shape}."
+            )
+        if value.format == "d" and value.c_contiguous:
+            return array("d", value.cast("B").tobytes())
+        value = value.tolist()
+    if not isinstance(value, (list, tuple)):
+        raise TypeError(
+            f"Coordinate arrays must be arrays or sequences, not {type(value).__name__}."
+        )
+    values = array("d")
+    for pair in value:
+        if not isinstance(pair, (list, tuple)):
+            raise TypeError(
+                f"Coordinates must be tuple instances, not {type(pair).__name__}."
+            )
+        if len(pair) != 2:
+            raise ValueError(
+                f"Coordinates must be tuples containing two items, not {len(pair)}."
+            )
+        for v in pair:
+            if isinstance(v, bool) or not isinstance(v, (int, float)):
+                raise TypeError(
+                    f"Coordinate values must be int or float, not {type(v).__name__}."
+                )
+        values.extend(pair)
+    return values
+
+
+def normalizePackedOutline(value: PackedOutline) -> PackedOutline:
+    """Normalize a packed outline.
+
+    :param value: The :class:`fontParts.base.arrays.PackedOutline` to
+        normalize.
+    :return: A :class:`fontParts.base.arrays.PackedOutline` holding
+        :class:`array.array` instances of the documented types.
+    :raises TypeError:
+        - If `value` is not a packed outline.
+        - If any array can't be converted to the documented type.
+        - If any component or anchor name is not a :class:`str`
+          or :obj:`None`.
+    :raises ValueError:
+        - If the array lengths don't match each other.
+        - If any point type code is unknown.
+        - If the contour end indexes don't increase or don't end at
+          the last point.
+
+    """
+    from fontParts.base.arrays import PackedOutline, pointTypeCodes
+
+    if not isinstance(value, PackedOutline):
+        raise TypeError(
+            f"Packed outlines must be PackedOutline instances, not {type(value).__name__}."
+        )
+    try:
+        coordinates = array("d", value.coordinates)
+        pointTypes = array("B", value.pointTypes)
+        smoothFlags = array("B", value.smoothFlags)
+        contourEnds = array("L", value.contourEnds)
+        componentTransformations = array("d", value.componentTransformations)
+        anchorCoordinates = array("d", value.anchorCoordinates)
+    except OverflowError as error:
+        raise ValueError(f"Packed outline value out of range: {error}.") from error
+    componentNames = tuple(value.componentNames)
+    anchorNames = tuple(value.anchorNames)
+    pointCount = len(pointTypes)
+    if len(coordinates) != pointCount * 2 or len(smoothFlags) != pointCount:
+        raise ValueError(
+            "Packed outlines must have one coordinate pair, point type and "
+            "smooth flag per point."
+        )
+    if pointTypes and max(pointTypes) >= len(pointTypeCodes):
+        raise ValueError(f"Unknown point type code: {max(pointTypes)}.")
+    previous = -1
+    for end in contourEnds:
+        if end <= previous:
+            raise ValueError("Packed outline contour ends must increase.")
+        previous = end
+    if previous != pointCount - 1:
+        raise ValueError("Packed outline contour ends must end at the last point.")
+    for name in componentNames + anchorNames:
+        if name is not None and not isinstance(name, str):
+            raise TypeError(
+                "Packed outline names must be strings or None, "
+                f"not {type(name).__name__}."
+            )
+    if len(componentTransformations) != len(componentNames) * 6:
+        raise ValueError(
+            "Packed outlines must have six transformation values per component."
+        )
+    if len(anchorCoordinates) != len(anchorNames) * 2:
+        raise ValueError("Packed outlines must have one coordinate pair per anchor.")
+    return PackedOutline(
+        coordinates,
+        pointTypes,
+        smoothFlags,
+        contourEnds,
+        componentNames,
+        componentTransformations,
+        anchorNames,
+        anchorCoordinates,
+    )
+
+
 # Color
 
 
@@ -1219,6 +1376,51 @@ def normalizeInterpolationFactor(value: InterpolationFactorLike) -> Interpolatio
     return (float(value[0]), float(value[1]))
 
 
+def normalizeCombinationMasters(
+    value: CollectionType[tuple[T, InterpolationFactorLike]], cls: type[T]
+) -> list[tuple[T, InterpolationFactor]]:
+    """Normalize the masters and weights of a linear combination.
+
+    :param value: The masters to normalize as a :class:`list` or
+        :class:`tuple` of ``(master, weight)`` pairs. Each weight is
+        normalized with :func:`normalizeInterpolationFactor`.
+    :param cls: The class every master must be an instance of.
+    :return: A :class:`list` of ``(master, weight)`` :class:`tuple`
+        pairs with normalized weights.
+    :raises TypeError:
+        - If `value` is not a :class:`list` or :class:`tuple`.
+        - If any `value` item is not a :class:`list` or :class:`tuple`.
+        - If any master is not an instance of `cls`.
+    :raises ValueError:
+        - If `value` is empty.
+        - If any `value` item does not contain exactly two items.
+
+    """
+    if not isinstance(value, (list, tuple)):
+        raise TypeError(
+            f"Combination masters must be a list or tuple, not {type(value).__name__}."
+        )
+    if not value:
+        raise ValueError("Combination masters must contain at least one master.")
+    masters = []
+    for item in value:
+        if not isinstance(item, (list, tuple)):
+            raise TypeError(
+                f"Combination masters must be (master, weight) pairs, not {type(item).__name__}."
+            )
+        if len(item) != 2:
+            raise ValueError(
+                f"Combination master pairs must contain two items, not {len(item)}."
+            )
+        master, weight = item
+        if not isinstance(master, cls):
+            raise TypeError(
+                f"Combination masters must be instances of {cls.__name__}, not {type(master).__name__}."
+            )
+        masters.append((master, normalizeInterpolationFactor(weight)))
+    return masters
+
+
 # ---------------
 # Transformations
 # ---------------
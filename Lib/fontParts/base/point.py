@@ -43,6 +43,14 @@ class BasePoint(
 
     """
 
+    # Compact environment subclasses provide the _contour slot. They
+    # can't be declared here at runtime, because the environment's
+    # own base class usually holds slots as well.
+    if TYPE_CHECKING:
+        __slots__ = ("_contour",)
+    else:
+        __slots__ = ()
+
     copyAttributes: tuple[str, str, str, str, str] = (
         "type",
         "smooth",
@@ -493,7 +501,7 @@ class BasePoint(
         contour = self.contour
         if contour is None:
             return None
-        return contour.points.index(self)
+        return contour._getPointIndex(self)
 
     # name
 
@@ -34,6 +34,14 @@ class BaseSegment(
 ):
     """Represent the basis for a segment object."""
 
+    # Compact environment subclasses provide the _contour and _points slots. They
+    # can't be declared here at runtime, because the environment's
+    # own base class usually holds slots as well.
+    if TYPE_CHECKING:
+        __slots__ = ("_contour", "_points")
+    else:
+        __slots__ = ()
+
     def _setPoints(self, points: CollectionType[BasePoint]) -> None:
         if hasattr(self, "_points"):
             raise AssertionError("segment has points")
@@ -232,7 +240,7 @@ class BaseSegment(
 
         """
         contour = self.contour
-        value = contour.segments.index(self)
+        value = contour._getSegmentIndex(self)
         return value
 
     # ----------
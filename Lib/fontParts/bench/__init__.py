@@ -0,0 +1,66 @@
+from fontParts.bench import bench_contour, bench_font, bench_glyph, bench_layer
+from fontParts.bench.runner import (
+    BenchmarkCase,
+    makeReport,
+    percentile,
+    runBenchmarks,
+    timeOperation,
+    writeReport,
+)
+
+
+def benchmarkEnvironment(
+    objectGenerator,
+    glyphCount=100,
+    repeat=20,
+    minTime=0.01,
+    names=None,
+    outputPath=None,
+    environment=None,
+    countCalls=False,
+    memory=False,
+    allocations=False,
+    verbosity=1,
+):
+    """Run the benchmark suite against an environment.
+
+    `objectGenerator` follows the same protocol as the one passed to
+    :func:`fontParts.test.testEnvironment`. See
+    :func:`fontParts.bench.runner.runBenchmarks` for the other
+    arguments. The report is returned and, if `outputPath` is given,
+    written there as JSON.
+
+    """
+    cases = [
+        bench_font.BenchFont,
+        bench_layer.BenchLayer,
+        bench_glyph.BenchGlyph,
+        bench_glyph.BenchLargeGlyph,
+        bench_contour.BenchContour,
+        bench_contour.BenchLargeContour,
+    ]
+    results = runBenchmarks(
+        cases,
+        objectGenerator,
+        glyphCount=glyphCount,
+        repeat=repeat,
+        minTime=minTime,
+        names=names,
+        countCalls=countCalls,
+        memory=memory,
+        allocations=allocations,
+        verbosity=verbosity,
+    )
+    report = makeReport(
+        results,
+        environment=environment,
+        glyphCount=glyphCount,
+        repeat=repeat,
+        minTime=minTime,
+        countCalls=countCalls,
+        memory=memory,
+        allocations=allocations,
+    )
+    if outputPath is not None:
+        writeReport(report, outputPath)
+    return report
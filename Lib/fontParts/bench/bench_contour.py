@@ -0,0 +1,173 @@
+from fontParts.bench.fixtures import drawOutline
+from fontParts.bench.runner import BenchmarkCase
+
+
+class BenchContour(BenchmarkCase):
+    pointCount = 64
+
+    def getContour(self):
+        glyph, _ = self.objectGenerator("glyph")
+        drawOutline(glyph, contourCount=1, pointCount=self.pointCount)
+        return glyph.contours[0]
+
+    # ------
+    # Points
+    # ------
+
+    def bench_pointIteration(self):
+        contour = self.getContour()
+
+        def operation():
+            for point in contour.points:
+                pass
+
+        return operation, len(contour.points)
+
+    def bench_pointAttributeGet(self):
+        contour = self.getContour()
+        points = contour.points
+
+        def operation():
+            for point in points:
+                _ = point.x
+                _ = point.y
+                _ = point.type
+
+        return operation, len(points)
+
+    def bench_pointAttributeSet(self):
+        contour = self.getContour()
+        points = contour.points
+
+        def operation():
+            for point in points:
+                point.x = point.x
+                point.y = point.y
+
+        return operation, len(points)
+
+    def bench_pointIndex(self):
+        contour = self.getContour()
+        points = contour.points
+
+        def operation():
+            for point in points:
+                _ = point.index
+
+        return operation, len(points)
+
+    def bench_appendPoints(self):
+        points = [((i, i), "line") for i in range(self.pointCount)]
+
+        def operation():
+            contour, _ = self.objectGenerator("contour")
+            contour.appendPoints(points)
+
+        return operation, len(points)
+
+    # ------------
+    # Point Inside
+    # ------------
+
+    def bench_pointsInside(self):
+        contour = self.getContour()
+        xMin, yMin, xMax, yMax = contour.bounds
+        points = [
+            (xMin + (xMax - xMin) * x / 31, yMin + (yMax - yMin) * y / 31)
+            for x in range(32)
+            for y in range(32)
+        ]
+
+        def operation():
+            contour.pointsInside(points)
+
+        return operation, len(points)
+
+    # -----------
+    # Coordinates
+    # -----------
+
+    def bench_coordinatesGet(self):
+        contour = self.getContour()
+
+        def operation():
+            _ = contour.coordinates
+
+        return operation, len(contour.points)
+
+    def bench_coordinatesSet(self):
+        contour = self.getContour()
+        coordinates = contour.coordinates
+
+        def operation():
+            contour.coordinates = coordinates
+
+        return operation, len(contour.points)
+
+    # --------
+    # Segments
+    # --------
+
+    def bench_segmentIteration(self):
+        contour = self.getContour()
+
+        def operation():
+            for segment in contour.segments:
+                pass
+
+        return operation, len(contour.segments)
+
+    def bench_segmentGetItem(self):
+        contour = self.getContour()
+        indexes = range(len(contour))
+
+        def operation():
+            for index in indexes:
+                contour[index]
+
+        return operation, len(indexes)
+
+    def bench_segmentIndex(self):
+        contour = self.getContour()
+        segments = contour.segments
+
+        def operation():
+            for segment in segments:
+                _ = segment.index
+
+        return operation, len(segments)
+
+    def bench_bPointIteration(self):
+        contour = self.getContour()
+
+        def operation():
+            for bPoint in contour.bPoints:
+                pass
+
+        return operation, len(contour.bPoints)
+
+    def bench_bPointHandles(self):
+        contour = self.getContour()
+        count = len(contour.bPoints)
+
+        def operation():
+            for bPoint in contour.bPoints:
+                _ = bPoint.bcpIn
+                _ = bPoint.bcpOut
+                _ = bPoint.type
+
+        return operation, count
+
+    def bench_bPointIndex(self):
+        contour = self.getContour()
+        bPoints = contour.bPoints[:: max(1, len(contour.bPoints) // 32)]
+
+        def operation():
+            for bPoint in bPoints:
+                _ = bPoint.index
+
+        return operation, len(bPoints)
+
+
+class BenchLargeContour(BenchContour):
+    pointCount = 2048
@@ -0,0 +1,150 @@
+import os
+import shutil
+import tempfile
+
+from fontParts.bench.fixtures import glyphName, makeFont
+from fontParts.bench.runner import BenchmarkCase
+
+
+class BenchFont(BenchmarkCase):
+    def getFont(self, offset=0):
+        return makeFont(self.objectGenerator, self.glyphCount, offset=offset)
+
+    # ------
+    # Glyphs
+    # ------
+
+    def bench_glyphLookup(self):
+        font = self.getFont()
+        names = [glyphName(i) for i in range(self.glyphCount)]
+
+        def operation():
+            for name in names:
+                font[name]
+
+        return operation, len(names)
+
+    def bench_glyphContains(self):
+        font = self.getFont()
+        names = [glyphName(i) for i in range(self.glyphCount)]
+        names += [name + ".missing" for name in names]
+
+        def operation():
+            for name in names:
+                _ = name in font
+
+        return operation, len(names)
+
+    def bench_glyphIteration(self):
+        font = self.getFont()
+
+        def operation():
+            for glyph in font:
+                pass
+
+        return operation, self.glyphCount
+
+    def bench_pointIteration(self):
+        font = self.getFont()
+        pointCount = sum(
+            len(contour.points) for glyph in font for contour in glyph.contours
+        )
+
+        def operation():
+            for glyph in font:
+                for contour in glyph.contours:
+                    for point in contour.points:
+                        pass
+
+        return operation, pointCount
+
+    # -------
+    # Kerning
+    # -------
+
+    def bench_getFlatKerning(self):
+        font = self.getFont()
+        return font.getFlatKerning, len(font.kerning)
+
+    # --------------
+    # Transformation
+    # --------------
+
+    def bench_rescaleUnitsPerEm(self):
+        font = self.getFont()
+        info = font.info
+
+        def operation():
+            font.rescaleUnitsPerEm(2000 if info.unitsPerEm == 1000 else 1000)
+
+        return operation, self.glyphCount
+
+    # ----
+    # Copy
+    # ----
+
+    def bench_copy(self):
+        font = self.getFont()
+        return font.copy, self.glyphCount
+
+    # -------------
+    # Interpolation
+    # -------------
+
+    def bench_interpolate(self):
+        font = self.getFont()
+        minFont = self.getFont()
+        maxFont = self.getFont(offset=100)
+
+        def operation():
+            font.interpolate(0.5, minFont, maxFont)
+
+        return operation, self.glyphCount
+
+    def bench_isCompatible(self):
+        font = self.getFont()
+        other = self.getFont(offset=100)
+
+        def operation():
+            font.isCompatible(other)
+
+        return operation, self.glyphCount
+
+    # ---------------
+    # File Operations
+    # ---------------
+
+    def _tempDirectory(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        return root
+
+    def bench_save(self):
+        font = self.getFont()
+        root = self._tempDirectory()
+        # alternate between two paths so that every call writes a
+        # complete UFO instead of only the changed files
+        paths = [os.path.join(root, "bench1.ufo"), os.path.join(root, "bench2.ufo")]
+
+        def operation():
+            path = paths.pop(0)
+            paths.append(path)
+            if os.path.exists(path):
+                shutil.rmtree(path)
+            font.save(path)
+
+        return operation, self.glyphCount
+
+    def bench_open(self):
+        font = self.getFont()
+        path = os.path.join(self._tempDirectory(), "bench.ufo")
+        font.save(path)
+        fontClass = type(font)
+
+        def operation():
+            opened = fontClass(path, showInterface=False)
+            for glyph in opened:
+                pass
+            opened.close()
+
+        return operation, self.glyphCount
@@ -0,0 +1,216 @@
+from fontParts.bench.fixtures import drawOutline, glyphName, makeFont
+from fontParts.bench.runner import BenchmarkCase
+
+
+class BenchGlyph(BenchmarkCase):
+    contourCount = 4
+    pointCount = 16
+
+    def getGlyph(self, offset=0):
+        glyph, _ = self.objectGenerator("glyph")
+        glyph.name = "bench"
+        glyph.width = 500 + offset
+        drawOutline(glyph, self.contourCount, self.pointCount, offset)
+        glyph.appendAnchor("top", (250 + offset, 700))
+        return glyph
+
+    def getFontGlyph(self):
+        font = makeFont(
+            self.objectGenerator,
+            glyphCount=1,
+            contourCount=self.contourCount,
+            pointCount=self.pointCount,
+        )
+        return font[glyphName(0)]
+
+    def pointCountOf(self, glyph):
+        return sum(len(contour.points) for contour in glyph.contours)
+
+    # -----
+    # Edits
+    # -----
+
+    def bench_transformBy(self):
+        glyph = self.getGlyph()
+
+        def operation():
+            glyph.transformBy((1, 0, 0, 1, 1, 0))
+
+        return operation, self.pointCountOf(glyph)
+
+    def bench_movePoints(self):
+        glyph = self.getFontGlyph()
+
+        def operation():
+            for contour in glyph.contours:
+                for point in contour.points:
+                    point.x += 1
+
+        return operation, self.pointCountOf(glyph)
+
+    def bench_movePointsHeld(self):
+        glyph = self.getFontGlyph()
+
+        def operation():
+            with glyph.holdChanges():
+                for contour in glyph.contours:
+                    for point in contour.points:
+                        point.x += 1
+
+        return operation, self.pointCountOf(glyph)
+
+    # ----
+    # Copy
+    # ----
+
+    def bench_copy(self):
+        glyph = self.getGlyph()
+        return glyph.copy, self.pointCountOf(glyph)
+
+    # --------------
+    # Packed Outline
+    # --------------
+
+    def bench_toPackedOutline(self):
+        glyph = self.getGlyph()
+        return glyph.toPackedOutline, self.pointCountOf(glyph)
+
+    def bench_fromPackedOutline(self):
+        glyph = self.getFontGlyph()
+        outline = glyph.toPackedOutline()
+
+        def operation():
+            glyph.fromPackedOutline(outline)
+
+        return operation, self.pointCountOf(glyph)
+
+    # -------
+    # Queries
+    # -------
+
+    def bench_pointsInside(self):
+        glyph = self.getGlyph()
+        xMin, yMin, xMax, yMax = glyph.bounds
+        points = [
+            (xMin + (xMax - xMin) * x / 31, yMin + (yMax - yMin) * y / 31)
+            for x in range(32)
+            for y in range(32)
+        ]
+
+        def operation():
+            glyph.pointsInside(points)
+
+        return operation, len(points)
+
+    def bench_getContourHierarchy(self):
+        glyph = self.getGlyph()
+
+        def operation():
+            glyph.moveBy((1, 0))
+            glyph.getContourHierarchy()
+
+        return operation, len(glyph.contours)
+
+    def bench_correctDirection(self):
+        glyph = self.getGlyph()
+
+        def operation():
+            glyph.moveBy((1, 0))
+            glyph.correctDirection()
+
+        return operation, len(glyph.contours)
+
+    # -------------
+    # Interpolation
+    # -------------
+
+    def bench_interpolate(self):
+        glyph = self.getGlyph()
+        minGlyph = self.getGlyph()
+        maxGlyph = self.getGlyph(offset=100)
+
+        def operation():
+            glyph.interpolate(0.5, minGlyph, maxGlyph)
+
+        return operation, self.pointCountOf(minGlyph)
+
+    def bench_combine(self):
+        glyph = self.getGlyph()
+        masters = [(self.getGlyph(offset=offset), 0.25) for offset in (0, 50, 100, 150)]
+
+        def operation():
+            glyph.combine(masters)
+
+        return operation, self.pointCountOf(glyph)
+
+    def bench_isCompatible(self):
+        glyph = self.getGlyph()
+        other = self.getGlyph(offset=100)
+
+        def operation():
+            glyph.isCompatible(other)
+
+        return operation, self.pointCountOf(glyph)
+
+    def bench_toMathGlyph(self):
+        glyph = self.getGlyph()
+        return glyph.toMathGlyph, self.pointCountOf(glyph)
+
+    def bench_multiply(self):
+        glyph = self.getGlyph()
+
+        def operation():
+            glyph * 2
+
+        return operation, self.pointCountOf(glyph)
+
+
+class BenchLargeGlyph(BenchmarkCase):
+    contourCount = 16
+    pointCount = 512
+
+    def getGlyph(self):
+        glyph, _ = self.objectGenerator("glyph")
+        drawOutline(glyph, self.contourCount, self.pointCount)
+        glyph.appendAnchor("top", (250, 700))
+        return glyph
+
+    def pointCountOf(self, glyph):
+        return sum(len(contour.points) for contour in glyph.contours)
+
+    # ---------------
+    # Transformations
+    # ---------------
+
+    def bench_transformBy(self):
+        glyph = self.getGlyph()
+
+        def operation():
+            glyph.transformBy((1, 0, 0, 1, 1, 0))
+
+        return operation, self.pointCountOf(glyph)
+
+    def bench_scaleBy(self):
+        glyph = self.getGlyph()
+
+        def operation():
+            glyph.scaleBy((1.5, 0.5), origin=(100, 100))
+
+        return operation, self.pointCountOf(glyph)
+
+    def bench_rotateBy(self):
+        glyph = self.getGlyph()
+
+        def operation():
+            glyph.rotateBy(15)
+
+        return operation, self.pointCountOf(glyph)
+
+    def bench_contourTransformBy(self):
+        glyph = self.getGlyph()
+
+        def operation():
+            for contour in glyph.contours:
+                contour.transformBy((1, 0, 0, 1, 1, 0))
+
+        return operation, self.pointCountOf(glyph)
@@ -0,0 +1,63 @@
+from fontParts.bench.fixtures import makeFont
+from fontParts.bench.runner import BenchmarkCase
+
+
+class BenchLayer(BenchmarkCase):
+    def getLayer(self, offset=0):
+        font = makeFont(self.objectGenerator, self.glyphCount, offset=offset)
+        return font.defaultLayer
+
+    # ----
+    # Copy
+    # ----
+
+    def bench_copy(self):
+        layer = self.getLayer()
+        return layer.copy, self.glyphCount
+
+    # -------------
+    # Interpolation
+    # -------------
+
+    def bench_interpolate(self):
+        layer = self.getLayer()
+        minLayer = self.getLayer()
+        maxLayer = self.getLayer(offset=100)
+
+        def operation():
+            layer.interpolate(0.5, minLayer, maxLayer)
+
+        return operation, self.glyphCount
+
+    def bench_interpolatePrepared(self):
+        layer = self.getLayer()
+        interpolation = layer.prepareInterpolation(
+            self.getLayer(), self.getLayer(offset=100)
+        )
+
+        def operation():
+            interpolation.interpolateLayer(0.5)
+
+        return operation, self.glyphCount
+
+    def bench_interpolateOutlinePrepared(self):
+        layer = self.getLayer()
+        interpolation = layer.prepareInterpolation(
+            self.getLayer(), self.getLayer(offset=100)
+        )
+        glyphNames = interpolation.keys()
+
+        def operation():
+            for glyphName in glyphNames:
+                interpolation.interpolateOutline(glyphName, 0.5)
+
+        return operation, self.glyphCount
+
+    def bench_combine(self):
+        layer = self.getLayer()
+        masters = [(self.getLayer(offset=offset), 0.25) for offset in (0, 50, 100, 150)]
+
+        def operation():
+            layer.combine(masters)
+
+        return operation, self.glyphCount
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fontParts.base.font import BaseFont
+    from fontParts.base.glyph import BaseGlyph
+
+
+def glyphName(index: int) -> str:
+    """Return the name of the glyph at `index` in generated fonts."""
+    return f"glyph{index:05d}"
+
+
+def drawOutline(
+    glyph: BaseGlyph, contourCount: int = 2, pointCount: int = 8, offset: float = 0
+) -> None:
+    """Draw `contourCount` closed contours into `glyph`.
+
+    Every contour has `pointCount` on-curve points and alternates
+    between line and curve segments. Outlines drawn with the same
+    counts are compatible for interpolation, whatever the `offset`.
+
+    """
+    pen = glyph.getPen()
+    for contourIndex in range(contourCount):
+        base = contourIndex * 200 + offset
+        points = [
+            (base + 100 * (i % 2) + 10 * i, 50 * (i // 2) + offset)
+            for i in range(pointCount)
+        ]
+        pen.moveTo(points[0])
+        for i, point in enumerate(points[1:], start=1):
+            if i % 2:
+                previous = points[i - 1]
+                pen.curveTo(
+                    (previous[0], previous[1] + 20), (point[0], point[1] + 20), point
+                )
+            else:
+                pen.lineTo(point)
+        pen.closePath()
+
+
+def makeFont(
+    objectGenerator: Any,
+    glyphCount: int = 100,
+    contourCount: int = 2,
+    pointCount: int = 8,
+    offset: float = 0,
+) -> BaseFont:
+    """Build a font for benchmarking with `objectGenerator`.
+
+    Every glyph gets an outline, an anchor and a width. Every fourth
+    glyph also gets a component referencing the glyph before it. The
+    font has one first and one second side kerning group per ten
+    glyphs, and kerning between groups and between glyphs. Fonts built
+    with the same counts are compatible for interpolation.
+
+    :param objectGenerator: The environment's object generator.
+    :param glyphCount: The number of glyphs.
+    :param contourCount: The number of contours per glyph.
+    :param pointCount: The number of on-curve points per contour.
+    :param offset: A value added to coordinates and metrics, used to
+        build distinct but compatible masters.
+
+    """
+    font, _ = objectGenerator("font")
+    font.info.unitsPerEm = 1000
+    for index in range(glyphCount):
+        glyph = font.newGlyph(glyphName(index))
+        glyph.width = 500 + offset
+        drawOutline(glyph, contourCount, pointCount, offset)
+        glyph.appendAnchor("top", (250 + offset, 700))
+        if index % 4 == 3:
+            glyph.appendComponent(glyphName(index - 1), offset=(offset, 0))
+    groupCount = max(1, glyphCount // 10)
+    for groupIndex in range(groupCount):
+        members = tuple(glyphName(i) for i in range(groupIndex, glyphCount, groupCount))
+        font.groups[f"public.kern1.group{groupIndex}"] = members
+        font.groups[f"public.kern2.group{groupIndex}"] = members
+    for first in range(groupCount):
+        for second in range(groupCount):
+            font.kerning[
+                f"public.kern1.group{first}", f"public.kern2.group{second}"
+            ] = -10 - first - second - offset
+    for index in range(0, glyphCount, 3):
+        left = glyphName(index)
+        right = glyphName((index * 7) % glyphCount)
+        font.kerning[left, right] = -5 - offset
+    return font
@@ -0,0 +1,268 @@
+"""Count and time calls that cross the base/environment boundary.
+
+Instrumentation is off by default and costs nothing while it is off.
+:func:`enable` wraps the following so that each call is counted and
+timed:
+
+- :class:`~fontParts.base.base.dynamicProperty` gets and sets
+- environment ``_get_*`` and ``_set_*`` methods
+- the sub-object accessors listed in :data:`environmentMethods`
+- the functions in :mod:`fontParts.base.normalizers`
+- object construction through :class:`~fontParts.base.BaseObject`
+
+:func:`disable` restores the original functions. Only classes that
+exist when :func:`enable` is called are instrumented.
+
+Example::
+
+    >>> from fontParts.bench import instrumentation
+    >>> with instrumentation.instrumented():
+    ...     font.interpolate(0.5, font1, font2)
+    >>> print(instrumentation.report())
+
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from types import FunctionType
+from typing import Any
+
+from fontParts.base import normalizers
+from fontParts.base.base import BaseObject, dynamicProperty
+
+#: The names of the environment methods that are instrumented in
+#: addition to all ``_get_*`` and ``_set_*`` methods.
+environmentMethods = (
+    "_getItem",
+    "_getLayer",
+    "_getContour",
+    "_getComponent",
+    "_getAnchor",
+    "_getGuideline",
+    "_getPoint",
+    "_getSegment",
+    "_getBPoint",
+)
+
+# (class name, method name) -> [call count, total seconds]
+_counters: dict[tuple[str, str], list[float]] = {}
+# (owner, attribute name, original value) for everything patched
+_patches: list[tuple[Any, str, Any]] = []
+
+
+def _record(key: tuple[str, str], elapsed: float) -> None:
+    counter = _counters.get(key)
+    if counter is None:
+        _counters[key] = [1, elapsed]
+    else:
+        counter[0] += 1
+        counter[1] += elapsed
+
+
+# --------
+# Wrappers
+# --------
+
+
+def _wrapMethod(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    timer = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        start = timer()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            _record((type(self).__name__, name), timer() - start)
+
+    return wrapper
+
+
+def _wrapFunction(
+    key: tuple[str, str], function: Callable[..., Any]
+) -> Callable[..., Any]:
+    timer = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(key, timer() - start)
+
+    return wrapper
+
+
+def _wrapDescriptor(function: Callable[..., Any], label: str) -> Callable[..., Any]:
+    timer = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(self: dynamicProperty, obj: Any, *args: Any) -> Any:
+        if obj is None:
+            return function(self, obj, *args)
+        start = timer()
+        try:
+            return function(self, obj, *args)
+        finally:
+            _record((type(obj).__name__, f"{self.name} [{label}]"), timer() - start)
+
+    return wrapper
+
+
+def _patch(owner: Any, name: str, value: Any) -> None:
+    _patches.append((owner, name, getattr(owner, name)))
+    setattr(owner, name, value)
+
+
+# -----------------
+# Class Enumeration
+# -----------------
+
+
+def _baseObjectClasses() -> Iterator[type]:
+    seen = set()
+    pending: list[type] = [BaseObject]
+    while pending:
+        cls = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        yield cls
+        pending.extend(cls.__subclasses__())
+
+
+def _isEnvironmentMethod(name: str) -> bool:
+    if name in environmentMethods:
+        return True
+    if name.startswith(("_get_", "_set_")):
+        return not name[5:].startswith("base_")
+    return False
+
+
+# ---
+# API
+# ---
+
+
+def isEnabled() -> bool:
+    """Return :obj:`True` if instrumentation is enabled."""
+    return bool(_patches)
+
+
+def enable() -> None:
+    """Start counting calls.
+
+    Calling this while instrumentation is enabled does nothing.
+
+    """
+    if _patches:
+        return
+    classes = list(_baseObjectClasses())
+    for cls in classes:
+        for name, value in list(cls.__dict__.items()):
+            if isinstance(value, FunctionType) and _isEnvironmentMethod(name):
+                _patch(cls, name, _wrapMethod(name, value))
+    _patch(BaseObject, "__init__", _wrapMethod("__init__", BaseObject.__init__))
+    _patch(dynamicProperty, "__get__", _wrapDescriptor(dynamicProperty.__get__, "get"))
+    _patch(dynamicProperty, "__set__", _wrapDescriptor(dynamicProperty.__set__, "set"))
+    # modules that imported normalizers by name call them directly
+    modules = [
+        module
+        for moduleName, module in list(sys.modules.items())
+        if moduleName.startswith("fontParts.") and module is not None
+    ]
+    for name, value in list(vars(normalizers).items()):
+        if not (name.startswith("normalize") and isinstance(value, FunctionType)):
+            continue
+        wrapper = _wrapFunction(("normalizers", name), value)
+        for module in modules:
+            if getattr(module, name, None) is value:
+                _patch(module, name, wrapper)
+
+
+def disable() -> None:
+    """Stop counting calls and restore the original functions.
+
+    The counters are kept until :func:`reset` is called.
+
+    """
+    while _patches:
+        owner, name, original = _patches.pop()
+        setattr(owner, name, original)
+
+
+def reset() -> None:
+    """Set all counters back to zero."""
+    _counters.clear()
+
+
+def snapshot() -> dict[str, dict[str, tuple[int, float]]]:
+    """Return the current counters.
+
+    :return: A :class:`dict` mapping class names to dictionaries that
+        map method names to ``(callCount, totalSeconds)`` tuples.
+        Property access is listed as ``"name [get]"`` and
+        ``"name [set]"``, and normalizer functions are listed under
+        ``"normalizers"``. Times are inclusive, so the time of a method
+        includes the time of the instrumented calls it makes.
+
+    """
+    result: dict[str, dict[str, tuple[int, float]]] = {}
+    for (className, methodName), (count, elapsed) in _counters.items():
+        result.setdefault(className, {})[methodName] = (int(count), elapsed)
+    return result
+
+
+def report(limit: int | None = None) -> str:
+    """Format the counters as text, grouped by class and method.
+
+    Classes are sorted by their total call count and methods by their
+    call count, both in descending order.
+
+    :param limit: The maximum number of methods to list per class.
+        If :obj:`None`, all methods are listed.
+
+    """
+    data = snapshot()
+    lines = []
+    classes = sorted(
+        data.items(),
+        key=lambda item: sum(count for count, _ in item[1].values()),
+        reverse=True,
+    )
+    for className, methods in classes:
+        total = sum(count for count, _ in methods.values())
+        lines.append(f"{className} ({total} calls)")
+        ordered = sorted(methods.items(), key=lambda item: item[1][0], reverse=True)
+        for methodName, (count, elapsed) in ordered[:limit]:
+            perCall = elapsed / count * 1e6
+            lines.append(
+                f"    {methodName:<40} {count:>10} {elapsed * 1e3:>10.2f} ms"
+                f" {perCall:>9.2f} us/call"
+            )
+    return "\n".join(lines)
+
+
+@contextmanager
+def instrumented(resetCounters: bool = True) -> Iterator[None]:
+    """Enable instrumentation for the duration of a ``with`` block.
+
+    :param resetCounters: Whether to reset the counters when the block
+        starts.
+
+    """
+    if resetCounters:
+        reset()
+    wasEnabled = isEnabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not wasEnabled:
+            disable()
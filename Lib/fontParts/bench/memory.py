@@ -0,0 +1,175 @@
+"""Measure the memory that fontParts operations allocate.
+
+:func:`measureMemory` runs an operation under :mod:`tracemalloc` and
+reports the peak memory allocated while it ran and the memory still
+held when it returned. The retained memory is attributed to the
+innermost fontParts module on the allocating call stack, so the memory
+held by the wrappers of a font can be told apart from the memory held
+by the environment's native objects.
+
+:func:`countAllocations` counts the fontParts objects, such as glyph and
+point wrappers, that an operation creates, including the short lived
+ones that :mod:`tracemalloc` no longer sees when the operation returns.
+
+Example::
+
+    >>> from fontParts.bench.memory import measureMemory
+    >>> measureMemory(font.copy, items=len(font))["peak"]
+    4231678
+    >>> countAllocations(lambda: [glyph.width for glyph in font])["objects"]
+    100
+
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import fontParts
+from fontParts.bench import instrumentation
+
+_packageDirectory = os.path.dirname(os.path.abspath(fontParts.__file__))
+_otherModules = "<other>"
+
+
+def _moduleName(filename: str) -> str | None:
+    path = os.path.abspath(filename)
+    if not path.startswith(_packageDirectory + os.sep):
+        return None
+    relative = os.path.relpath(path, os.path.dirname(_packageDirectory))
+    return os.path.splitext(relative)[0].replace(os.sep, ".")
+
+
+def _attribute(traceback: tracemalloc.Traceback) -> str:
+    # frames are ordered from the oldest to the most recent call
+    for frame in reversed(traceback):
+        moduleName = _moduleName(frame.filename)
+        if moduleName is not None:
+            return moduleName
+    return _otherModules
+
+
+def measureMemory(
+    operation: Callable[[], Any], items: int = 1, frameCount: int = 30
+) -> dict[str, Any]:
+    """Run `operation` once and report the memory it allocates.
+
+    The value returned by `operation` is kept alive until the
+    measurement is complete, so the memory it holds counts as
+    retained.
+
+    :param operation: The callable to measure. It is called without
+        arguments.
+    :param items: The number of items `operation` processes, used for
+        the per-item figures.
+    :param frameCount: The number of frames :mod:`tracemalloc` stores
+        per allocation. Deeper stacks attribute memory more reliably
+        but make the measurement slower.
+    :return: A :class:`dict` with these keys:
+
+        +-----------------------+-------------------------------------------------+
+        | Key                   | Description                                     |
+        +=======================+=================================================+
+        | ``peak``              | The peak number of bytes allocated while the    |
+        |                       | operation ran.                                  |
+        +-----------------------+-------------------------------------------------+
+        | ``retained``          | The number of bytes still allocated after the   |
+        |                       | operation returned.                             |
+        +-----------------------+-------------------------------------------------+
+        | ``peakPerItem``       | ``peak`` divided by `items`.                    |
+        +-----------------------+-------------------------------------------------+
+        | ``retainedPerItem``   | ``retained`` divided by `items`.                |
+        +-----------------------+-------------------------------------------------+
+        | ``modules``           | A :class:`dict` mapping module names to the     |
+        |                       | retained bytes allocated from them.             |
+        +-----------------------+-------------------------------------------------+
+
+        Memory allocated outside of fontParts modules, for example by
+        the standard library while no fontParts code was on the stack,
+        is listed under ``"<other>"``.
+
+    """
+    wasTracing = tracemalloc.is_tracing()
+    if wasTracing:
+        previousFrameCount = tracemalloc.get_traceback_limit()
+        tracemalloc.stop()
+    gc.collect()
+    tracemalloc.start(frameCount)
+    try:
+        before = tracemalloc.take_snapshot()
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = operation()
+        peak = tracemalloc.get_traced_memory()[1]
+        gc.collect()
+        current = tracemalloc.get_traced_memory()[0]
+        after = tracemalloc.take_snapshot()
+        del result
+    finally:
+        tracemalloc.stop()
+        if wasTracing:
+            tracemalloc.start(previousFrameCount)
+    modules: dict[str, int] = {}
+    for difference in after.compare_to(before, "traceback"):
+        if difference.size_diff == 0:
+            continue
+        moduleName = _attribute(difference.traceback)
+        modules[moduleName] = modules.get(moduleName, 0) + difference.size_diff
+    # snapshots are allocated while tracing, leave them out
+    thisModule = _moduleName(__file__)
+    if thisModule is not None:
+        modules.pop(thisModule, None)
+    peak = max(0, peak - baseline)
+    retained = max(0, current - baseline)
+    items = max(1, items)
+    return {
+        "peak": peak,
+        "retained": retained,
+        "peakPerItem": peak / items,
+        "retainedPerItem": retained / items,
+        "modules": {name: size for name, size in modules.items() if size > 0},
+    }
+
+
+def countAllocations(operation: Callable[[], Any], items: int = 1) -> dict[str, Any]:
+    """Run `operation` once and count the fontParts objects it creates.
+
+    Objects are counted when :class:`~fontParts.base.BaseObject`
+    initializes them, with :mod:`fontParts.bench.instrumentation`
+    enabled. The instrumentation counters are reset.
+
+    :param operation: The callable to measure. It is called without
+        arguments.
+    :param items: The number of items `operation` processes, used for
+        the per-item figure.
+    :return: A :class:`dict` with these keys:
+
+        +-----------------------+-------------------------------------------------+
+        | Key                   | Description                                     |
+        +=======================+=================================================+
+        | ``objects``           | The number of objects created.                  |
+        +-----------------------+-------------------------------------------------+
+        | ``objectsPerItem``    | ``objects`` divided by `items`.                 |
+        +-----------------------+-------------------------------------------------+
+        | ``classes``           | A :class:`dict` mapping class names to the      |
+        |                       | number of objects of the class created.         |
+        +-----------------------+-------------------------------------------------+
+
+    """
+    with instrumentation.instrumented():
+        operation()
+    classes = {
+        className: methods["__init__"][0]
+        for className, methods in instrumentation.snapshot().items()
+        if "__init__" in methods
+    }
+    objects = sum(classes.values())
+    return {
+        "objects": objects,
+        "objectsPerItem": objects / max(1, items),
+        "classes": classes,
+    }
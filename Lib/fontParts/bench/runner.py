@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import gc
+import json
+import math
+import platform
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from fontParts.bench import instrumentation
+from fontParts.bench.memory import countAllocations, measureMemory
+
+Operation = Callable[[], Any]
+ObjectGenerator = Callable[[str], tuple[Any, list[str]]]
+
+
+# -----
+# Cases
+# -----
+
+
+class BenchmarkCase:
+    """Base class for a group of benchmarks.
+
+    Every method whose name starts with ``bench_`` defines one
+    benchmark. The method builds whatever data the benchmark needs
+    with :attr:`objectGenerator` and returns a tuple of the operation
+    to time and the number of items the operation processes per call.
+    The item count is used to compute throughput.
+
+    Example::
+
+        class BenchGlyph(BenchmarkCase):
+            def bench_moveBy(self):
+                glyph = self.getGlyph()
+                return lambda: glyph.moveBy((1, 0)), 1
+
+    :param objectGenerator: The environment's object generator, as
+        used by :func:`fontParts.test.testEnvironment`.
+    :param glyphCount: The number of glyphs in generated fonts.
+
+    """
+
+    def __init__(self, objectGenerator: ObjectGenerator, glyphCount: int) -> None:
+        self.objectGenerator = objectGenerator
+        self.glyphCount = glyphCount
+        self._cleanups: list[tuple[Callable[..., Any], tuple, dict]] = []
+
+    def addCleanup(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
+        """Call `function` once the current benchmark has been timed."""
+        self._cleanups.append((function, args, kwargs))
+
+    def doCleanups(self) -> None:
+        """Call the registered cleanup functions in reverse order."""
+        while self._cleanups:
+            function, args, kwargs = self._cleanups.pop()
+            function(*args, **kwargs)
+
+    @classmethod
+    def benchmarkNames(cls) -> list[str]:
+        """Return the names of the benchmark methods in the case."""
+        return sorted(name for name in dir(cls) if name.startswith("bench_"))
+
+    @classmethod
+    def benchmarkPrefix(cls) -> str:
+        """Return the prefix used to name the benchmarks in the case."""
+        name = cls.__name__
+        name = name.removeprefix("Bench")
+        return name[:1].lower() + name[1:]
+
+
+# ------
+# Timing
+# ------
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Return the `q` percentile of `values` using linear interpolation.
+
+    :param values: A sorted sequence of numbers.
+    :param q: The percentile as a number between ``0`` and ``100``.
+
+    """
+    if not values:
+        raise ValueError("Can't compute a percentile of an empty sequence.")
+    position = (len(values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return values[lower]
+    fraction = position - lower
+    return values[lower] + (values[upper] - values[lower]) * fraction
+
+
+def _timeCalls(operation: Operation, number: int) -> float:
+    timer = time.perf_counter
+    start = timer()
+    for _ in range(number):
+        operation()
+    return timer() - start
+
+
+def _calibrate(operation: Operation, minTime: float, maxNumber: int) -> int:
+    number = 1
+    while number < maxNumber:
+        elapsed = _timeCalls(operation, number)
+        if elapsed >= minTime:
+            break
+        if elapsed <= 0:
+            number *= 10
+        else:
+            number = math.ceil(number * min(10, 1.2 * minTime / elapsed))
+    return min(number, maxNumber)
+
+
+def timeOperation(
+    operation: Operation, repeat: int = 20, minTime: float = 0.01
+) -> dict[str, Any]:
+    """Time `operation` and summarize the per-call times.
+
+    The number of calls per sample is calibrated so that one sample
+    takes at least `minTime` seconds. Garbage collection is disabled
+    while samples are taken.
+
+    :param operation: The callable to time. It is called without
+        arguments.
+    :param repeat: The number of samples to take.
+    :param minTime: The minimum duration of one sample in seconds.
+    :return: A :class:`dict` with the number of calls per sample and
+        the minimum, mean, median, 90th and 99th percentile, maximum and
+        standard deviation of the per-call times in seconds.
+
+    """
+    gcEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        number = _calibrate(operation, minTime, maxNumber=1_000_000)
+        samples = sorted(
+            _timeCalls(operation, number) / number for _ in range(max(1, repeat))
+        )
+    finally:
+        if gcEnabled:
+            gc.enable()
+    mean = sum(samples) / len(samples)
+    variance = sum((sample - mean) ** 2 for sample in samples) / len(samples)
+    return {
+        "number": number,
+        "repeat": len(samples),
+        "min": samples[0],
+        "mean": mean,
+        "median": percentile(samples, 50),
+        "p90": percentile(samples, 90),
+        "p99": percentile(samples, 99),
+        "max": samples[-1],
+        "stdev": math.sqrt(variance),
+    }
+
+
+# -------
+# Running
+# -------
+
+
+def runBenchmarks(
+    cases: Sequence[type[BenchmarkCase]],
+    objectGenerator: ObjectGenerator,
+    glyphCount: int = 100,
+    repeat: int = 20,
+    minTime: float = 0.01,
+    names: Sequence[str] | None = None,
+    countCalls: bool = False,
+    memory: bool = False,
+    allocations: bool = False,
+    verbosity: int = 1,
+) -> list[dict[str, Any]]:
+    """Run the benchmarks defined by `cases`.
+
+    :param cases: The :class:`BenchmarkCase` subclasses to run.
+    :param objectGenerator: The environment's object generator.
+    :param glyphCount: The number of glyphs in generated fonts.
+    :param repeat: The number of samples to take per benchmark.
+    :param minTime: The minimum duration of one sample in seconds.
+    :param names: Optional substrings. If given, only benchmarks whose
+        name contains one of them are run.
+    :param countCalls: If :obj:`True`, each operation is run once more
+        with :mod:`fontParts.bench.instrumentation` enabled and the
+        result gets a ``"calls"`` entry with the counters.
+    :param memory: If :obj:`True`, each operation is run once more
+        under :func:`fontParts.bench.memory.measureMemory` and the
+        result gets a ``"memory"`` entry with the measurement.
+    :param allocations: If :obj:`True`, each operation is run once
+        more under :func:`fontParts.bench.memory.countAllocations` and
+        the result gets an ``"allocations"`` entry with the counts.
+    :param verbosity: ``0`` is silent, ``1`` prints one line per
+        benchmark.
+    :return: A :class:`list` of result dictionaries. Benchmarks that the
+        environment does not implement are reported with
+        ``"skipped": True``.
+
+    """
+    results = []
+    for caseClass in cases:
+        case = caseClass(objectGenerator, glyphCount)
+        prefix = caseClass.benchmarkPrefix()
+        for methodName in caseClass.benchmarkNames():
+            name = prefix + "." + methodName[len("bench_") :]
+            if names and not any(part in name for part in names):
+                continue
+            result: dict[str, Any] = {"name": name}
+            try:
+                operation, items = getattr(case, methodName)()
+                result.update(timeOperation(operation, repeat=repeat, minTime=minTime))
+                if countCalls:
+                    with instrumentation.instrumented():
+                        operation()
+                    result["calls"] = instrumentation.snapshot()
+                if memory:
+                    result["memory"] = measureMemory(operation, items=items)
+                if allocations:
+                    result["allocations"] = countAllocations(operation, items=items)
+            except NotImplementedError:
+                result["skipped"] = True
+            else:
+                result["skipped"] = False
+                result["items"] = items
+                result["throughput"] = (
+                    items / result["median"] if result["median"] else None
+                )
+            finally:
+                case.doCleanups()
+            results.append(result)
+            if verbosity:
+                print(formatResult(result))
+    return results
+
+
+# -------
+# Reports
+# -------
+
+_units = ((1.0, "s"), (1e-3, "ms"), (1e-6, "us"), (1e-9, "ns"))
+
+
+def formatDuration(seconds: float) -> str:
+    """Format `seconds` with the largest unit that keeps it above one."""
+    for scale, unit in _units:
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def formatSize(size: float) -> str:
+    """Format a number of bytes with a binary unit."""
+    if abs(size) < 1024:
+        return f"{size:.0f} B"
+    for unit in ("KiB", "MiB"):
+        size /= 1024
+        if abs(size) < 1024:
+            return f"{size:.3g} {unit}"
+    size /= 1024
+    return f"{size:.3g} GiB"
+
+
+def formatResult(result: dict[str, Any]) -> str:
+    """Format a result returned by :func:`runBenchmarks` as one line."""
+    name = result["name"]
+    if result.get("skipped"):
+        return f"{name:<36} skipped"
+    line = (
+        f"{name:<36} median {formatDuration(result['median']):>9}"
+        f"  p90 {formatDuration(result['p90']):>9}"
+        f"  p99 {formatDuration(result['p99']):>9}"
+    )
+    if result.get("throughput"):
+        line += f"  {result['throughput']:,.0f} items/s"
+    if "memory" in result:
+        line += (
+            f"  peak {formatSize(result['memory']['peak'])}"
+            f"  retained {formatSize(result['memory']['retained'])}"
+        )
+    if "allocations" in result:
+        line += f"  {result['allocations']['objectsPerItem']:.3g} objects/item"
+    return line
+
+
+def makeReport(
+    results: list[dict[str, Any]], environment: str | None = None, **settings: Any
+) -> dict[str, Any]:
+    r"""Wrap `results` with information about the machine and run.
+
+    :param results: The results returned by :func:`runBenchmarks`.
+    :param environment: An optional name for the environment.
+    :param \**settings: The settings the benchmarks were run with.
+
+    """
+    from fontParts import __version__
+
+    return {
+        "fontParts": __version__,
+        "environment": environment,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "settings": settings,
+        "results": results,
+    }
+
+
+def writeReport(report: dict[str, Any], path: str) -> None:
+    """Write a report created by :func:`makeReport` to `path` as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
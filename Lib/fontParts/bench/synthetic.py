@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Any
+
+from fontParts.bench.fixtures import glyphName
+
+if TYPE_CHECKING:
+    from fontParts.base.font import BaseFont
+    from fontParts.base.glyph import BaseGlyph
+
+_segmentTypes = ("line", "curve", "qcurve")
+
+
+def _drawRandomOutline(
+    glyph: BaseGlyph,
+    rng: random.Random,
+    contourCount: int,
+    pointCount: int,
+    offset: float,
+) -> None:
+    pen = glyph.getPen()
+    for _ in range(contourCount):
+        points = [
+            (rng.randint(0, 1000) + offset, rng.randint(-200, 800) + offset)
+            for _ in range(pointCount)
+        ]
+        pen.moveTo(points[0])
+        for previous, point in zip(points, points[1:] + points[:1]):
+            segmentType = rng.choice(_segmentTypes)
+            if segmentType == "line":
+                pen.lineTo(point)
+                continue
+            handle = ((previous[0] + point[0]) / 2, (previous[1] + point[1]) / 2 + 50)
+            if segmentType == "curve":
+                pen.curveTo(previous, handle, point)
+            else:
+                pen.qCurveTo(handle, point)
+        pen.closePath()
+
+
+def makeSyntheticFont(
+    objectGenerator: Any,
+    glyphCount: int = 1000,
+    contourCount: int = 2,
+    pointCount: int = 8,
+    componentDepth: int = 2,
+    kerningGroupCount: int = 50,
+    kerningPairCount: int = 5000,
+    layerCount: int = 0,
+    libSize: int = 0,
+    seed: int = 0,
+    offset: float = 0,
+) -> BaseFont:
+    """Build a deterministic synthetic font of configurable size.
+
+    The font is built through the public font API, so any environment
+    can be loaded with it. The same arguments always produce the same
+    font. Fonts built with the same arguments except for `offset` are
+    compatible for interpolation.
+
+    Glyphs are assigned to component levels in turn. Glyphs at level
+    ``0`` get `contourCount` contours of `pointCount` on-curve points
+    with a random mix of line, cubic and quadratic segments. Glyphs at
+    level ``n`` get those contours and a component referencing a glyph
+    at level ``n - 1``, which gives nesting of up to `componentDepth`
+    levels. Every glyph also gets a width, a Unicode value and an anchor.
+
+    :param objectGenerator: The environment's object generator.
+    :param glyphCount: The number of glyphs in every layer.
+    :param contourCount: The number of contours per glyph.
+    :param pointCount: The number of on-curve points per contour.
+    :param componentDepth: The maximum component nesting depth.
+        ``0`` creates no components.
+    :param kerningGroupCount: The number of kerning groups per side.
+        Every glyph is a member of at most one group per side.
+    :param kerningPairCount: The number of kerning pairs. Pairs are
+        drawn from groups and glyphs of both sides.
+    :param layerCount: The number of layers in addition to the default
+        layer. Every layer holds a compatible version of every glyph.
+    :param libSize: The number of keys in the font lib.
+    :param seed: The seed for the random number generator.
+    :param offset: A value added to coordinates, metrics and kerning
+        values.
+    :return: The new font.
+    :raises ValueError: If a count is negative.
+
+    Example::
+
+        >>> font = makeSyntheticFont(objectGenerator, glyphCount=20000,
+        ...     kerningPairCount=100000, layerCount=3, seed=1)
+
+    """
+    counts = {
+        "glyphCount": glyphCount,
+        "contourCount": contourCount,
+        "pointCount": pointCount,
+        "componentDepth": componentDepth,
+        "kerningGroupCount": kerningGroupCount,
+        "kerningPairCount": kerningPairCount,
+        "layerCount": layerCount,
+        "libSize": libSize,
+    }
+    for name, value in counts.items():
+        if value < 0:
+            raise ValueError(f"{name} must be at least 0, not {value}.")
+    font, _ = objectGenerator("font")
+    font.info.familyName = "Synthetic"
+    font.info.styleName = f"Seed {seed}"
+    font.info.unitsPerEm = 1000
+    names = [glyphName(index) for index in range(glyphCount)]
+    layers = [font.defaultLayer]
+    for layerIndex in range(layerCount):
+        layers.append(font.newLayer(f"layer{layerIndex + 1}"))
+    for layerIndex, layer in enumerate(layers):
+        # every layer replays the same sequence of random choices so
+        # that its glyphs are compatible with the default layer
+        rng = random.Random(seed)
+        layerOffset = offset + layerIndex * 10
+        levels: list[list[str]] = [[] for _ in range(componentDepth + 1)]
+        for index, name in enumerate(names):
+            glyph = layer.newGlyph(name)
+            glyph.width = rng.randint(200, 1000) + layerOffset
+            glyph.unicodes = [0xF0000 + index]
+            _drawRandomOutline(glyph, rng, contourCount, pointCount, layerOffset)
+            glyph.appendAnchor("top", (rng.randint(0, 1000) + layerOffset, 700))
+            level = index % (componentDepth + 1)
+            if level and levels[level - 1]:
+                baseName = rng.choice(levels[level - 1])
+                glyph.appendComponent(
+                    baseName, offset=(rng.randint(-100, 100) + layerOffset, 0)
+                )
+            levels[level].append(name)
+    rng = random.Random(seed)
+    _makeKerning(font, rng, names, kerningGroupCount, kerningPairCount, offset)
+    for index in range(libSize):
+        font.lib[f"com.example.synthetic.key{index}"] = [
+            rng.randint(0, 1000) for _ in range(8)
+        ]
+    return font
+
+
+def _makeKerning(
+    font: BaseFont,
+    rng: random.Random,
+    names: list[str],
+    groupCount: int,
+    pairCount: int,
+    offset: float,
+) -> None:
+    sides: list[list[str]] = []
+    groups = {}
+    for prefix in ("public.kern1.", "public.kern2."):
+        members = list(names)
+        rng.shuffle(members)
+        # about half of the glyphs are grouped, the rest kern alone
+        grouped = members[: len(members) // 2]
+        sideGroups = [f"{prefix}group{index}" for index in range(groupCount)]
+        for index, groupName in enumerate(sideGroups):
+            groupMembers = tuple(sorted(grouped[index::groupCount]))
+            if groupMembers:
+                groups[groupName] = groupMembers
+        sides.append([name for name in sideGroups if name in groups] + names)
+    font.groups.update(groups)
+    firstSide, secondSide = sides
+    pairCount = min(pairCount, len(firstSide) * len(secondSide))
+    kerning: dict[tuple[str, str], float] = {}
+    while len(kerning) < pairCount:
+        pair = (rng.choice(firstSide), rng.choice(secondSide))
+        if pair not in kerning:
+            kerning[pair] = rng.randint(-150, 50) - offset
+    font.kerning.update(kerning)
+
+
+def writeSyntheticFont(objectGenerator: Any, path: str, **kwargs: Any) -> BaseFont:
+    r"""Build a synthetic font and save it as a UFO at `path`.
+
+    :param objectGenerator: The environment's object generator.
+    :param path: The path of the UFO to write.
+    :param \**kwargs: The arguments passed on to
+        :func:`makeSyntheticFont`.
+    :return: The saved font.
+
+    """
+    font = makeSyntheticFont(objectGenerator, **kwargs)
+    font.save(path)
+    return font
@@ -8,10 +8,10 @@ from fontParts.fontshell.lib import RLib
 from fontParts.fontshell.layer import RLayer
 from fontParts.fontshell.glyph import RGlyph
 from fontParts.fontshell.contour import RContour
-from fontParts.fontshell.point import RPoint
-from fontParts.fontshell.segment import RSegment
-from fontParts.fontshell.bPoint import RBPoint
+from fontParts.fontshell.point import RPoint, RCompactPoint
+from fontParts.fontshell.segment import RSegment, RCompactSegment
+from fontParts.fontshell.bPoint import RBPoint, RCompactBPoint
 from fontParts.fontshell.component import RComponent
-from fontParts.fontshell.anchor import RAnchor
-from fontParts.fontshell.guideline import RGuideline
+from fontParts.fontshell.anchor import RAnchor, RCompactAnchor
+from fontParts.fontshell.guideline import RGuideline, RCompactGuideline
 from fontParts.fontshell.image import RImage
@@ -6,10 +6,13 @@ from fontParts.base.annotations import RGBALike, RGBA
 from fontParts.fontshell.base import RBaseObject
 
 
-class RAnchor(RBaseObject, BaseAnchor):
+class RCompactAnchor(RBaseObject, BaseAnchor):
+    __slots__ = ("_glyph",)
+
     wrapClass = defcon.Anchor
 
     def _init(self, pathOrObject: defcon.Anchor | None = None) -> None:
+        self._glyph = None
         if self.wrapClass is not None:
             if pathOrObject is None:
                 pathOrObject = self.wrapClass()
@@ -70,3 +73,7 @@ class RAnchor(RBaseObject, BaseAnchor):
 
     def _set_color(self, value: RGBALike | None) -> None:
         self.naked().color = value
+
+
+class RAnchor(RCompactAnchor):
+    pass
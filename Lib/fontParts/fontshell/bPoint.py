@@ -1,6 +1,21 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
 from fontParts.base import BaseBPoint
 from fontParts.fontshell.base import RBaseObject
 
+if TYPE_CHECKING:
+    from fontParts.base import BaseSegment
+
+
+class RCompactBPoint(BaseBPoint, RBaseObject):
+    __slots__ = ("_contour", "_point", "_segments")
+
+    def _init(self, *args, **kwargs) -> None:
+        self._contour = None
+        self._segments: tuple[BaseSegment, BaseSegment] | None = None
+        super()._init(*args, **kwargs)
+
 
-class RBPoint(BaseBPoint, RBaseObject):
+class RBPoint(RCompactBPoint):
     pass
@@ -1,12 +1,28 @@
 from __future__ import annotations
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from collections.abc import Iterator
+from contextlib import contextmanager
+import weakref
+
+if TYPE_CHECKING:
+    from fontParts.base.base import BaseObject
 
 RBaseObjectType = TypeVar("RBaseObjectType", bound="RBaseObject")
+RWrapperType = TypeVar("RWrapperType", bound="BaseObject")
 
 
 class RBaseObject(Generic[RBaseObjectType]):
+    # Type checkers see the slots of the compact objects on the base
+    # classes of fontParts.base, which they can't combine with slots
+    # here, so they treat this class as having a __dict__.
+    if not TYPE_CHECKING:
+        __slots__ = ("__weakref__", "_wrapped", "_wrapperCache")
+
     wrapClass: type[RBaseObjectType] | None = None
     dirty: bool
+    changeNotificationName: str
+    dispatcher: Any
+    _wrapperCache: weakref.WeakValueDictionary[tuple[type[Any], int], Any]
 
     def _init(self, pathOrObject: RBaseObjectType | None = None) -> None:
         if pathOrObject is None and self.wrapClass is not None:
@@ -14,9 +30,60 @@ class RBaseObject(Generic[RBaseObjectType]):
         if pathOrObject is not None:
             self._wrapped = pathOrObject
 
+    def _wrapNaked(self, cls: type[RWrapperType], wrapped: Any) -> RWrapperType:
+        # Live child wrappers are kept per parent wrapper, keyed by
+        # (wrapper class, id(naked object)), so that a child is linked
+        # to the parent it was requested from. A wrapper holds a strong
+        # reference to its naked object, so an id can't be reused while
+        # its entry is alive, and entries vanish together with their
+        # wrappers.
+        try:
+            cache = self._wrapperCache
+        except AttributeError:
+            cache = self._wrapperCache = weakref.WeakValueDictionary()
+        key = (cls, id(wrapped))
+        wrapper = cache.get(key)
+        if wrapper is None:
+            wrapper = cls(pathOrObject=wrapped)
+            cache[key] = wrapper
+        return wrapper
+
     def changed(self) -> None:
         self.naked().dirty = True
 
+    def _getHeldNotifications(self) -> list[tuple[str, Any]]:
+        # The (notification, observable) pairs held by holdChanges. An
+        # observable of None holds the notification for every object.
+        naked = self.naked()
+        return [(naked.changeNotificationName, naked)]
+
+    @contextmanager
+    def _holdChanges(self) -> Iterator[None]:
+        # defcon objects share their font's notification center. Holding
+        # queues each distinct notification once and posts the queue when
+        # the outermost hold is released. Only change notifications are
+        # held, so renames, additions and removals still update names and
+        # membership at once. Objects outside a font have no dispatcher
+        # and post nothing.
+        dispatcher = self.naked().dispatcher
+        if dispatcher is None:
+            yield
+            return
+        held = self._getHeldNotifications()
+        for notification, observable in held:
+            dispatcher.holdNotifications(
+                observable=observable,
+                notification=notification,
+                note="fontParts holdChanges",
+            )
+        try:
+            yield
+        finally:
+            for notification, observable in reversed(held):
+                dispatcher.releaseHeldNotifications(
+                    observable=observable, notification=notification
+                )
+
     def naked(self) -> RBaseObjectType:
         if hasattr(self, "_wrapped"):
             return self._wrapped
@@ -0,0 +1,115 @@
+from fontParts.bench import benchmarkEnvironment
+from fontParts.bench.synthetic import writeSyntheticFont
+from fontParts.fontshell import (
+    RAnchor,
+    RBPoint,
+    RComponent,
+    RContour,
+    RFeatures,
+    RFont,
+    RGlyph,
+    RGroups,
+    RGuideline,
+    RImage,
+    RInfo,
+    RKerning,
+    RLayer,
+    RLib,
+    RPoint,
+    RSegment,
+)
+
+classMapping = {
+    "font": RFont,
+    "info": RInfo,
+    "groups": RGroups,
+    "kerning": RKerning,
+    "features": RFeatures,
+    "layer": RLayer,
+    "glyph": RGlyph,
+    "contour": RContour,
+    "segment": RSegment,
+    "bPoint": RBPoint,
+    "point": RPoint,
+    "anchor": RAnchor,
+    "component": RComponent,
+    "image": RImage,
+    "lib": RLib,
+    "guideline": RGuideline,
+}
+
+
+def fontshellObjectGenerator(cls):
+    unrequested = []
+    obj = classMapping[cls]()
+    return obj, unrequested
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the fontshell environment.")
+    parser.add_argument("names", nargs="*", help="only run benchmarks matching these")
+    parser.add_argument("--glyphs", type=int, default=100, help="glyphs per font")
+    parser.add_argument("--repeat", type=int, default=20, help="samples per benchmark")
+    parser.add_argument(
+        "--min-time", type=float, default=0.01, help="minimum seconds per sample"
+    )
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON")
+    parser.add_argument(
+        "--count-calls",
+        action="store_true",
+        help="count environment calls, normalizers and wrappers per operation",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="measure the memory allocated and retained per operation",
+    )
+    parser.add_argument(
+        "--allocations",
+        action="store_true",
+        help="count the fontParts objects created per operation",
+    )
+    synthetic = parser.add_argument_group(
+        "synthetic fonts",
+        "write a synthetic font instead of running the benchmarks; "
+        "--glyphs sets the number of glyphs",
+    )
+    synthetic.add_argument("--write-font", metavar="PATH", help="the UFO to write")
+    synthetic.add_argument("--seed", type=int, default=0)
+    synthetic.add_argument("--contours", type=int, default=2)
+    synthetic.add_argument("--points", type=int, default=8)
+    synthetic.add_argument("--component-depth", type=int, default=2)
+    synthetic.add_argument("--kerning-groups", type=int, default=50)
+    synthetic.add_argument("--kerning-pairs", type=int, default=5000)
+    synthetic.add_argument("--layers", type=int, default=0)
+    synthetic.add_argument("--lib-size", type=int, default=0)
+    args = parser.parse_args()
+    if args.write_font:
+        writeSyntheticFont(
+            fontshellObjectGenerator,
+            args.write_font,
+            glyphCount=args.glyphs,
+            contourCount=args.contours,
+            pointCount=args.points,
+            componentDepth=args.component_depth,
+            kerningGroupCount=args.kerning_groups,
+            kerningPairCount=args.kerning_pairs,
+            layerCount=args.layers,
+            libSize=args.lib_size,
+            seed=args.seed,
+        )
+    else:
+        benchmarkEnvironment(
+            fontshellObjectGenerator,
+            glyphCount=args.glyphs,
+            repeat=args.repeat,
+            minTime=args.min_time,
+            names=args.names,
+            outputPath=args.json,
+            environment="fontshell",
+            countCalls=args.count_calls,
+            memory=args.memory,
+            allocations=args.allocations,
+        )
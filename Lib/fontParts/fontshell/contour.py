@@ -1,9 +1,13 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Any
+from array import array
+from itertools import chain
+from operator import attrgetter
 
 import defcon
 from fontParts.base import BaseContour
 from fontParts.base.annotations import BoundingBox, CoordinateLike
+from fontParts.base.arrays import PolygonPen
 from fontParts.fontshell.base import RBaseObject
 from fontParts.fontshell.point import RPoint
 from fontParts.fontshell.segment import RSegment
@@ -12,6 +16,19 @@ from fontParts.fontshell.bPoint import RBPoint
 if TYPE_CHECKING:
     from fontParts.base import BasePoint
 
+_getSegmentType = attrgetter("segmentType")
+_getCoordinates = attrgetter("x", "y")
+_getSmooth = attrgetter("smooth")
+
+
+def _getPolygonKey(contour: defcon.Contour) -> tuple[array, tuple[str | None, ...]]:
+    # Representations aren't destroyed while notifications are held or
+    # for orphan contours, so compare the outline data instead.
+    return (
+        array("d", chain.from_iterable(map(_getCoordinates, contour))),
+        tuple(map(_getSegmentType, contour)),
+    )
+
 
 class RContour(RBaseObject, BaseContour):
     wrapClass = defcon.Contour
@@ -78,6 +95,7 @@ class RContour(RBaseObject, BaseContour):
 
     def _reverse(self, **kwargs: Any) -> None:
         self.naked().reverse()
+        self._structureChanged()
 
     # ------------------------
     # Point and Contour Inside
@@ -86,8 +104,53 @@ class RContour(RBaseObject, BaseContour):
     def _pointInside(self, point: CoordinateLike) -> bool:
         return self.naked().pointInside(point)
 
-    def _contourInside(self, otherContour: BaseContour) -> bool:
-        return self.naked().contourInside(otherContour.naked(), segmentLength=5)
+    def _getPolygonKey(self) -> tuple[array, tuple[str | None, ...]]:
+        return _getPolygonKey(self.naked())
+
+    def _buildPolygon(self) -> array:
+        pen = PolygonPen()
+        self.naked().draw(pen)
+        return pen.polygons[0] if pen.polygons else array("d")
+
+    # --------
+    # Segments
+    # --------
+
+    # defcon doesn't notify orphan contours of changes, so the methods
+    # that add, remove, reorder or retype points count their changes
+    # instead. The point count catches most changes made to the native
+    # contour directly.
+    _structureVersion = 0
+
+    def _structureChanged(self) -> None:
+        self._structureVersion += 1
+
+    def _getSegmentStructureKey(self) -> tuple[int, int]:
+        return self._structureVersion, len(self.naked())
+
+    # -----------
+    # Coordinates
+    # -----------
+
+    def _get_coordinates(self) -> array:
+        return array("d", chain.from_iterable(map(_getCoordinates, self.naked())))
+
+    def _set_coordinates(self, value: array) -> None:
+        contour = self.naked()
+        for point, x, y in zip(contour, value[::2], value[1::2]):
+            point.x = x
+            point.y = y
+        contour.postNotification("Contour.PointsChanged")
+        contour.dirty = True
+
+    def _get_pointTypes(self) -> tuple[str, ...]:
+        return tuple(
+            "offcurve" if segmentType is None else segmentType
+            for segmentType in map(_getSegmentType, self.naked())
+        )
+
+    def _get_smoothFlags(self) -> tuple[bool, ...]:
+        return tuple(map(_getSmooth, self.naked()))
 
     # ------
     # Points
@@ -99,7 +162,7 @@ class RContour(RBaseObject, BaseContour):
     def _getPoint(self, index: int, **kwargs: Any) -> RPoint:
         contour = self.naked()
         point = contour[index]
-        return self.pointClass(point)
+        return self._wrapNaked(self.pointClass, point)
 
     def _insertPoint(
         self,
@@ -123,8 +186,40 @@ class RContour(RBaseObject, BaseContour):
         point.identifier = identifier
         contour = self.naked()
         contour.insertPoint(index, point)
+        self._structureChanged()
+
+    def _insertPoints(
+        self,
+        index: int,
+        points: list[tuple[CoordinateLike, str, bool, str | None, str | None]],
+        **kwargs: Any,
+    ) -> None:
+        contour = self.naked()
+        pointClass = self.pointClass.wrapClass
+        with self._holdChanges():
+            for offset, (position, type, smooth, name, identifier) in enumerate(points):
+                point = pointClass(
+                    position,
+                    segmentType=None if type == "offcurve" else type,
+                    smooth=smooth,
+                    name=name,
+                    identifier=identifier,
+                )
+                contour.insertPoint(index + offset, point)
+        self._structureChanged()
 
     def _removePoint(self, index: int, preserveCurve: bool, **kwargs: Any) -> None:
         contour = self.naked()
         point = contour[index]
         contour.removePoint(point)
+        self._structureChanged()
+
+    def _removePoints(
+        self, indexes: list[int], preserveCurve: bool, **kwargs: Any
+    ) -> None:
+        contour = self.naked()
+        points = [contour[index] for index in indexes]
+        with self._holdChanges():
+            for point in reversed(points):
+                contour.removePoint(point)
+        self._structureChanged()
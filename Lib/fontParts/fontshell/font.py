@@ -77,17 +77,17 @@ class RFont(RBaseObject, BaseFont):
     # info
 
     def _get_info(self) -> RInfo:
-        return self.infoClass(pathOrObject=self.naked().info)
+        return self._wrapNaked(self.infoClass, self.naked().info)
 
     # groups
 
     def _get_groups(self) -> RGroups:
-        return self.groupsClass(pathOrObject=self.naked().groups)
+        return self._wrapNaked(self.groupsClass, self.naked().groups)
 
     # kerning
 
     def _get_kerning(self) -> RKerning:
-        return self.kerningClass(pathOrObject=self.naked().kerning)
+        return self._wrapNaked(self.kerningClass, self.naked().kerning)
 
     # features
 
@@ -110,7 +110,7 @@ class RFont(RBaseObject, BaseFont):
 
     def _get_layers(self, **kwargs: Any) -> tuple[RLayer, ...]:
         return tuple(
-            self.layerClass(pathOrObject=layer) for layer in self.naked().layers
+            self._wrapNaked(self.layerClass, layer) for layer in self.naked().layers
         )
 
     # order
@@ -140,7 +140,7 @@ class RFont(RBaseObject, BaseFont):
         layers = self.naked().layers
         layer = layers.newLayer(name)
         layer.color = color
-        return self.layerClass(pathOrObject=layer)
+        return self._wrapNaked(self.layerClass, layer)
 
     # remove
 
@@ -195,3 +195,15 @@ class RFont(RBaseObject, BaseFont):
         font = self.naked()
         guideline = font.guidelines[index]
         font.removeGuideline(guideline)
+
+    # -------
+    # Changes
+    # -------
+
+    def _getHeldNotifications(self) -> list[tuple[str, Any]]:
+        return super()._getHeldNotifications() + [
+            ("Layer.Changed", None),
+            ("Glyph.Changed", None),
+            ("Contour.PointsChanged", None),
+            ("Contour.Changed", None),
+        ]
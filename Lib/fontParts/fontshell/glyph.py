@@ -1,9 +1,14 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Any
+from array import array
+from copy import deepcopy
+from itertools import chain
+from operator import attrgetter
 
 import defcon
 import booleanOperations
-from fontParts.base import BaseGlyph
+from fontParts.base import BaseGlyph, normalizers
+from fontParts.base.arrays import PackedOutline, pointTypeCodes, transformCoordinates
 from fontParts.base.annotations import (
     AffineTransformationLike,
     RGBALike,
@@ -15,7 +20,7 @@ from fontParts.base.annotations import (
 )
 from fontParts.base.errors import FontPartsError
 from fontParts.fontshell.base import RBaseObject
-from fontParts.fontshell.contour import RContour
+from fontParts.fontshell.contour import RContour, _getPolygonKey
 from fontParts.fontshell.component import RComponent
 from fontParts.fontshell.anchor import RAnchor
 from fontParts.fontshell.guideline import RGuideline
@@ -34,6 +39,21 @@ if TYPE_CHECKING:
         GlyphObjectLoadingPointPen,
     )
 
+_getSegmentType = attrgetter("segmentType")
+_getCoordinates = attrgetter("x", "y")
+_getSmooth = attrgetter("smooth")
+_segmentTypes = (None,) + pointTypeCodes[1:]
+_segmentTypeCodes = {
+    segmentType: code for code, segmentType in enumerate(_segmentTypes)
+}
+# Line and curve segments are compatible, so fingerprints don't tell
+# them apart.
+_fingerprintTypes: dict[str | None, str] = dict(zip(_segmentTypes, pointTypeCodes))
+_fingerprintTypes["line"] = "curve"
+_getFingerprintType = _fingerprintTypes.__getitem__
+_getName = attrgetter("name")
+_getBaseGlyph = attrgetter("baseGlyph")
+
 
 class RGlyph(RBaseObject, BaseGlyph):
     wrapClass = defcon.Glyph
@@ -44,6 +64,110 @@ class RGlyph(RBaseObject, BaseGlyph):
     imageClass = RImage
     libClass = RLib
 
+    # ----
+    # Copy
+    # ----
+
+    def _copyData(self, source: BaseGlyph) -> None:
+        if not isinstance(source, RGlyph):
+            super()._copyData(source)
+            return
+        sourceGlyph = source.naked()
+        glyph = self.naked()
+        # Points are added to orphan contours, which have no
+        # notification dispatcher, so each contour is announced once
+        # when it is appended instead of once per point.
+        pointClass = glyph.pointClass
+        contours = []
+        for sourceContour in sourceGlyph:
+            contour = glyph.contourClass(pointClass=pointClass)
+            contour.identifier = sourceContour.identifier
+            for index, point in enumerate(sourceContour):
+                contour.insertPoint(
+                    index,
+                    pointClass(
+                        (point.x, point.y),
+                        segmentType=point.segmentType,
+                        smooth=point.smooth,
+                        name=point.name,
+                        identifier=point.identifier,
+                    ),
+                )
+            contours.append(contour)
+        # Identifiers that are already used by an element of the same
+        # kind are dropped, like the base implementation does.
+        identifiers = {component.identifier for component in glyph.components}
+        components = []
+        for sourceComponent in sourceGlyph.components:
+            if glyph.name is not None and sourceComponent.baseGlyph == glyph.name:
+                raise FontPartsError(
+                    "A glyph cannot contain a component referencing itself."
+                )
+            identifier = sourceComponent.identifier
+            if identifier in identifiers:
+                identifier = None
+            identifiers.add(identifier)
+            component = glyph.instantiateComponent()
+            component.baseGlyph = sourceComponent.baseGlyph
+            component.transformation = sourceComponent.transformation
+            component.identifier = identifier
+            components.append(component)
+        identifiers = {anchor.identifier for anchor in glyph.anchors}
+        anchors = []
+        for sourceAnchor in sourceGlyph.anchors:
+            identifier = sourceAnchor.identifier
+            if identifier in identifiers:
+                identifier = None
+            identifiers.add(identifier)
+            anchors.append(
+                {
+                    "x": sourceAnchor.x,
+                    "y": sourceAnchor.y,
+                    "name": sourceAnchor.name,
+                    "color": sourceAnchor.color,
+                    "identifier": identifier,
+                }
+            )
+        identifiers = {guideline.identifier for guideline in glyph.guidelines}
+        guidelines = []
+        for sourceGuideline in sourceGlyph.guidelines:
+            identifier = sourceGuideline.identifier
+            if identifier in identifiers:
+                identifier = None
+            identifiers.add(identifier)
+            guidelines.append(
+                {
+                    "x": sourceGuideline.x,
+                    "y": sourceGuideline.y,
+                    "angle": sourceGuideline.angle,
+                    "name": sourceGuideline.name,
+                    "color": sourceGuideline.color,
+                    "identifier": identifier,
+                }
+            )
+        with self._holdChanges():
+            for contour in contours:
+                glyph.appendContour(contour)
+            for component in components:
+                glyph.appendComponent(component)
+            for anchor in anchors:
+                glyph.appendAnchor(glyph.instantiateAnchor(anchor))
+            for guideline in guidelines:
+                glyph.appendGuideline(glyph.instantiateGuideline(guideline))
+
+    # -------
+    # Changes
+    # -------
+
+    def _getHeldNotifications(self) -> list[tuple[str, Any]]:
+        # The glyph posts a change for every contour change, so the
+        # changes of its contours are held as well.
+        held = super()._getHeldNotifications()
+        for contour in self.naked():
+            held.append(("Contour.PointsChanged", contour))
+            held.append((contour.changeNotificationName, contour))
+        return held
+
     # --------------
     # Identification
     # --------------
@@ -125,6 +249,13 @@ class RGlyph(RBaseObject, BaseGlyph):
             return None
         return value
 
+    # ------------
+    # Point Inside
+    # ------------
+
+    def _getPolygonKey(self) -> tuple[tuple[array, tuple[str | None, ...]], ...]:
+        return tuple(map(_getPolygonKey, self.naked()))
+
     # ----
     # Pens
     # ----
@@ -146,7 +277,7 @@ class RGlyph(RBaseObject, BaseGlyph):
 
     def _getContour(self, index: int, **kwargs: Any) -> RContour:
         contour = self.naked()[index]
-        return self.contourClass(contour)
+        return self._wrapNaked(self.contourClass, contour)
 
     def _removeContour(self, index: int, **kwargs: Any) -> None:
         glyph = self.naked()
@@ -169,9 +300,6 @@ class RGlyph(RBaseObject, BaseGlyph):
             )
             booleanOperations.union(contours, self.getPointPen())
 
-    def _correctDirection(self, trueType: bool = False, **kwargs: Any) -> None:
-        self.naked().correctContourDirection(trueType=trueType)
-
     # Components
 
     def _lenComponents(self, **kwargs: Any) -> int:
@@ -260,6 +388,230 @@ class RGlyph(RBaseObject, BaseGlyph):
         guideline = glyph.guidelines[index]
         glyph.removeGuideline(guideline)
 
+    # --------------
+    # Transformation
+    # --------------
+
+    def _transformBy(self, matrix: AffineTransformationLike, **kwargs: Any) -> None:
+        glyph = self.naked()
+        with self.holdChanges():
+            # Transform the points of all contours as one buffer.
+            points = list(chain.from_iterable(glyph))
+            values = transformCoordinates(
+                array("d", chain.from_iterable(map(_getCoordinates, points))), matrix
+            )
+            for point, x, y in zip(points, values[::2], values[1::2]):
+                point.x = x
+                point.y = y
+            for contour in glyph:
+                contour.postNotification("Contour.PointsChanged")
+                contour.dirty = True
+            for component in self.components:
+                component.transformBy(matrix)
+            for anchor in self.anchors:
+                anchor.transformBy(matrix)
+            for guideline in self.guidelines:
+                guideline.transformBy(matrix)
+
+    # --------------
+    # Packed Outline
+    # --------------
+
+    def _toPackedOutline(self) -> PackedOutline:
+        glyph = self.naked()
+        coordinates = array("d")
+        pointTypes = array("B")
+        smoothFlags = array("B")
+        contourEnds = array("L")
+        for contour in glyph:
+            if not len(contour):
+                continue
+            coordinates.extend(chain.from_iterable(map(_getCoordinates, contour)))
+            pointTypes.extend(
+                map(_segmentTypeCodes.__getitem__, map(_getSegmentType, contour))
+            )
+            smoothFlags.extend(map(_getSmooth, contour))
+            contourEnds.append(len(pointTypes) - 1)
+        components = glyph.components
+        anchors = glyph.anchors
+        return PackedOutline(
+            coordinates,
+            pointTypes,
+            smoothFlags,
+            contourEnds,
+            tuple(component.baseGlyph for component in components),
+            array(
+                "d",
+                chain.from_iterable(
+                    component.transformation for component in components
+                ),
+            ),
+            tuple(anchor.name for anchor in anchors),
+            array("d", chain.from_iterable(map(_getCoordinates, anchors))),
+        )
+
+    def _fromPackedOutline(self, outline: PackedOutline) -> None:
+        glyph = self.naked()
+        glyph.clearContours()
+        glyph.clearComponents()
+        glyph.clearAnchors()
+        # Points are added to orphan contours, which have no
+        # notification dispatcher, so each contour is announced once
+        # when it is appended instead of once per point.
+        pointClass = glyph.pointClass
+        coordinates = outline.coordinates
+        pointTypes = outline.pointTypes
+        smoothFlags = outline.smoothFlags
+        start = 0
+        for end in outline.contourEnds:
+            contour = glyph.contourClass(pointClass=pointClass)
+            for index in range(start, end + 1):
+                contour.insertPoint(
+                    index - start,
+                    pointClass(
+                        (coordinates[index * 2], coordinates[index * 2 + 1]),
+                        segmentType=_segmentTypes[pointTypes[index]],
+                        smooth=bool(smoothFlags[index]),
+                    ),
+                )
+            glyph.appendContour(contour)
+            start = end + 1
+        transformations = outline.componentTransformations
+        for index, baseGlyph in enumerate(outline.componentNames):
+            component = glyph.instantiateComponent()
+            component.baseGlyph = baseGlyph
+            component.transformation = tuple(transformations[index * 6 : index * 6 + 6])
+            glyph.appendComponent(component)
+        coordinates = outline.anchorCoordinates
+        for index, name in enumerate(outline.anchorNames):
+            glyph.appendAnchor(
+                glyph.instantiateAnchor(
+                    {
+                        "x": coordinates[index * 2],
+                        "y": coordinates[index * 2 + 1],
+                        "name": name,
+                    }
+                )
+            )
+
+    # -------------
+    # Interpolation
+    # -------------
+
+    def _getMathOutlines(
+        self, glyphs: CollectionType[BaseGlyph]
+    ) -> list[PackedOutline] | None:
+        if not all(isinstance(glyph, RGlyph) for glyph in glyphs):
+            return super()._getMathOutlines(glyphs)
+        componentIdentifiers = None
+        for glyph in glyphs:
+            naked = glyph.naked()
+            if naked.guidelines or not all(map(len, naked)):
+                return None
+            identifiers = [component.identifier for component in naked.components]
+            if componentIdentifiers is None:
+                componentIdentifiers = identifiers
+            elif identifiers != componentIdentifiers:
+                return None
+        return [glyph._toPackedOutline() for glyph in glyphs]
+
+    def _getCompatibilityFingerprint(
+        self,
+    ) -> tuple[
+        tuple[tuple[str, ...], ...],
+        tuple[str | None, ...],
+        tuple[str | None, ...],
+        tuple[str | None, ...],
+    ]:
+        # Nothing is stored, because defcon doesn't notify orphan glyphs
+        # of changes. Reading the native data takes a few passes at C
+        # speed, which is cheaper than validating a cached value.
+        glyph = self.naked()
+        contours = []
+        for contour in glyph:
+            contours.append(
+                tuple(map(_getFingerprintType, map(_getSegmentType, contour)))
+            )
+        return (
+            tuple(contours),
+            tuple(map(_getBaseGlyph, glyph.components)),
+            tuple(map(_getName, glyph.anchors)),
+            tuple(map(_getName, glyph.guidelines)),
+        )
+
+    def _setMathOutline(
+        self,
+        source: BaseGlyph,
+        outline: PackedOutline,
+        width: float,
+        height: float,
+        round: bool,
+    ) -> None:
+        if not isinstance(source, RGlyph):
+            super()._setMathOutline(source, outline, width, height, round)
+            return
+        convert = int if round else float
+        if round:
+            width = normalizers.normalizeVisualRounding(width)
+            height = normalizers.normalizeVisualRounding(height)
+        # Build the result from the source before clearing, because it
+        # may be this glyph. The orphan contours post no notifications.
+        sourceNaked = source.naked()
+        glyph = self.naked()
+        pointClass = glyph.pointClass
+        coordinates = iter(map(convert, outline.coordinates))
+        contours = []
+        for sourceContour in sourceNaked:
+            contour = glyph.contourClass(pointClass=pointClass)
+            contour.identifier = sourceContour.identifier
+            for index, point in enumerate(sourceContour):
+                contour.insertPoint(
+                    index,
+                    pointClass(
+                        (next(coordinates), next(coordinates)),
+                        segmentType=point.segmentType,
+                        smooth=point.smooth,
+                        name=point.name,
+                        identifier=point.identifier,
+                    ),
+                )
+            contours.append(contour)
+        components = []
+        transformations = outline.componentTransformations
+        for index, sourceComponent in enumerate(sourceNaked.components):
+            transformation = list(transformations[index * 6 : index * 6 + 6])
+            transformation[4:] = map(convert, transformation[4:])
+            component = glyph.instantiateComponent()
+            component.baseGlyph = sourceComponent.baseGlyph
+            component.transformation = tuple(transformation)
+            component.identifier = sourceComponent.identifier
+            components.append(component)
+        anchorCoordinates = iter(map(convert, outline.anchorCoordinates))
+        anchors = [
+            {
+                "x": next(anchorCoordinates),
+                "y": next(anchorCoordinates),
+                "name": anchor.name,
+                "color": anchor.color,
+                "identifier": anchor.identifier,
+            }
+            for anchor in sourceNaked.anchors
+        ]
+        lib = deepcopy(dict(sourceNaked.lib))
+        note = sourceNaked.note
+        with self._holdChanges():
+            self.clear()
+            for contour in contours:
+                glyph.appendContour(contour)
+            for component in components:
+                glyph.appendComponent(component)
+            for anchor in anchors:
+                glyph.appendAnchor(glyph.instantiateAnchor(anchor))
+            glyph.lib.update(lib)
+            glyph.width = width
+            glyph.height = height
+            glyph.note = note
+
     # -----------------
     # Layer Interaction
     # -----------------
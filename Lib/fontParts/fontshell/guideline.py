@@ -6,10 +6,14 @@ from fontParts.base.annotations import RGBALike, RGBA, IntFloatType
 from fontParts.fontshell.base import RBaseObject
 
 
-class RGuideline(RBaseObject, BaseGuideline):
+class RCompactGuideline(RBaseObject, BaseGuideline):
+    __slots__ = ("_font", "_glyph")
+
     wrapClass = defcon.Guideline
 
     def _init(self, pathOrObject: defcon.Guideline | None = None) -> None:
+        self._glyph = None
+        self._font = None
         if self.wrapClass is not None:
             if pathOrObject is None:
                 pathOrObject = self.wrapClass()
@@ -80,3 +84,7 @@ class RGuideline(RBaseObject, BaseGuideline):
 
     def _set_color(self, value: RGBALike | None) -> None:
         self.naked().color = value
+
+
+class RGuideline(RCompactGuideline):
+    pass
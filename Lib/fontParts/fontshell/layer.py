@@ -61,11 +61,17 @@ class RLayer(RBaseObject, BaseLayer):
     def _getItem(self, name: str, **kwargs: Any) -> RGlyph:
         layer = self.naked()
         glyph = layer[name]
-        return self.glyphClass(glyph)
+        return self._wrapNaked(self.glyphClass, glyph)
 
     def _keys(self, **kwargs: Any) -> tuple[str, ...]:
         return tuple(self.naked().keys())
 
+    def _contains(self, name: str, **kwargs: Any) -> bool:
+        return name in self.naked()
+
+    def _len(self, **kwargs: Any) -> int:
+        return len(self.naked())
+
     def _newGlyph(self, name: str, **kwargs: Any) -> BaseGlyph:
         layer = self.naked()
         layer.newGlyph(name)
@@ -86,3 +92,16 @@ class RLayer(RBaseObject, BaseLayer):
     def _getCharacterMapping(self) -> dict[int, tuple[str, ...]]:
         mapping = self.naked().unicodeData
         return {k: tuple(v) for k, v in mapping.items()}
+
+    # -------
+    # Changes
+    # -------
+
+    def _getHeldNotifications(self) -> list[tuple[str, Any]]:
+        # Glyph changes can only be held by name, which holds them for
+        # the glyphs of every layer in the font.
+        return super()._getHeldNotifications() + [
+            ("Glyph.Changed", None),
+            ("Contour.PointsChanged", None),
+            ("Contour.Changed", None),
+        ]
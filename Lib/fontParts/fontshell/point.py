@@ -7,10 +7,13 @@ from fontParts.base import BasePoint, FontPartsError
 from fontParts.fontshell.base import RBaseObject
 
 
-class RPoint(RBaseObject, BasePoint):
+class RCompactPoint(RBaseObject, BasePoint):
+    __slots__ = ("_contour",)
+
     wrapClass = defcon.Point
 
     def _init(self, pathOrObject: defcon.Point | None = None) -> None:
+        self._contour = None
         if pathOrObject is None and self.wrapClass is not None:
             pathOrObject = self.wrapClass((0, 0))
         super()._init(pathOrObject=pathOrObject)
@@ -39,6 +42,9 @@ class RPoint(RBaseObject, BasePoint):
 
     def _set_type(self, value: str) -> None:
         self.naked().segmentType = None if value == "offcurve" else value
+        contour = self.contour
+        if contour is not None:
+            contour._structureChanged()
         self._postChangeNotification()
 
     # smooth
@@ -102,3 +108,7 @@ class RPoint(RBaseObject, BasePoint):
                 "belong to a contour."
             )
         return value
+
+
+class RPoint(RCompactPoint):
+    pass
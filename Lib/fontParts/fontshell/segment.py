@@ -2,5 +2,13 @@ from fontParts.base import BaseSegment
 from fontParts.fontshell.base import RBaseObject
 
 
-class RSegment(BaseSegment, RBaseObject):
+class RCompactSegment(BaseSegment, RBaseObject):
+    __slots__ = ("_contour", "_points")
+
+    def _init(self, *args, **kwargs) -> None:
+        self._contour = None
+        super()._init(*args, **kwargs)
+
+
+class RSegment(RCompactSegment):
     pass
@@ -1,4 +1,5 @@
 from fontParts.test import testEnvironment
+from fontParts.base import BaseSegment, BaseBPoint, BasePoint
 from fontParts.fontshell.font import RFont
 from fontParts.fontshell.info import RInfo
 from fontParts.fontshell.groups import RGroups
@@ -7,14 +8,14 @@ from fontParts.fontshell.features import RFeatures
 from fontParts.fontshell.layer import RLayer
 from fontParts.fontshell.glyph import RGlyph
 from fontParts.fontshell.contour import RContour
-from fontParts.fontshell.segment import RSegment
-from fontParts.fontshell.bPoint import RBPoint
-from fontParts.fontshell.point import RPoint
-from fontParts.fontshell.anchor import RAnchor
+from fontParts.fontshell.segment import RSegment, RCompactSegment
+from fontParts.fontshell.bPoint import RBPoint, RCompactBPoint
+from fontParts.fontshell.point import RPoint, RCompactPoint
+from fontParts.fontshell.anchor import RAnchor, RCompactAnchor
 from fontParts.fontshell.component import RComponent
 from fontParts.fontshell.image import RImage
 from fontParts.fontshell.lib import RLib
-from fontParts.fontshell.guideline import RGuideline
+from fontParts.fontshell.guideline import RGuideline, RCompactGuideline
 
 
 # defcon does not have prebuilt support for
@@ -24,15 +25,15 @@ from fontParts.fontshell.guideline import RGuideline
 
 
 def _get_selected(self):
-    if isinstance(self, FSTestSegment):
+    if isinstance(self, BaseSegment):
         for point in self.points:
             if point.selected:
                 return True
         return False
-    elif isinstance(self, FSTestBPoint):
+    elif isinstance(self, BaseBPoint):
         point = self._point.naked()
         return point.name == "selected"
-    elif isinstance(self, FSTestPoint):
+    elif isinstance(self, BasePoint):
         return self.name == "selected"
     else:
         if not hasattr(self.naked(), "_testSelected"):
@@ -41,16 +42,16 @@ def _get_selected(self):
 
 
 def _set_selected(self, value):
-    if isinstance(self, FSTestSegment):
+    if isinstance(self, BaseSegment):
         for point in self.points:
             point.selected = value
-    elif isinstance(self, FSTestBPoint):
+    elif isinstance(self, BaseBPoint):
         point = self._point.naked()
         if value:
             point.name = "selected"
         else:
             point.name = None
-    elif isinstance(self, FSTestPoint):
+    elif isinstance(self, BasePoint):
         if value:
             self.name = "selected"
         else:
@@ -150,6 +151,100 @@ def fontshellObjectGenerator(cls):
     return obj, unrequested
 
 
+# The compact variants of the point level
+# objects are run through the same tests.
+
+
+class FSTestCompactPoint(RCompactPoint):
+    __slots__ = ()
+
+    _get_selected = _get_selected
+    _set_selected = _set_selected
+
+
+class FSTestCompactBPoint(RCompactBPoint):
+    __slots__ = ()
+
+    _get_selected = _get_selected
+    _set_selected = _set_selected
+
+
+class FSTestCompactSegment(RCompactSegment):
+    __slots__ = ()
+
+    _get_selected = _get_selected
+    _set_selected = _set_selected
+
+
+class FSTestCompactGuideline(RCompactGuideline):
+    __slots__ = ()
+
+    _get_selected = _get_selected
+    _set_selected = _set_selected
+
+
+class FSTestCompactAnchor(RCompactAnchor):
+    __slots__ = ()
+
+    _get_selected = _get_selected
+    _set_selected = _set_selected
+
+
+# The parent objects only swap their child classes. They are built
+# from attribute dicts, because overriding the child classes in a
+# subclass body conflicts with the types inferred for the classes above.
+
+FSTestCompactContour = type(
+    "FSTestCompactContour",
+    (FSTestContour,),
+    {
+        "segmentClass": FSTestCompactSegment,
+        "bPointClass": FSTestCompactBPoint,
+        "pointClass": FSTestCompactPoint,
+    },
+)
+
+FSTestCompactGlyph = type(
+    "FSTestCompactGlyph",
+    (FSTestGlyph,),
+    {
+        "contourClass": FSTestCompactContour,
+        "anchorClass": FSTestCompactAnchor,
+        "guidelineClass": FSTestCompactGuideline,
+    },
+)
+
+FSTestCompactLayer = type(
+    "FSTestCompactLayer", (FSTestLayer,), {"glyphClass": FSTestCompactGlyph}
+)
+
+FSTestCompactFont = type(
+    "FSTestCompactFont",
+    (FSTestFont,),
+    {"layerClass": FSTestCompactLayer, "guidelineClass": FSTestCompactGuideline},
+)
+
+
+compactClassMapping = dict(
+    classMapping,
+    font=FSTestCompactFont,
+    layer=FSTestCompactLayer,
+    glyph=FSTestCompactGlyph,
+    contour=FSTestCompactContour,
+    segment=FSTestCompactSegment,
+    bPoint=FSTestCompactBPoint,
+    point=FSTestCompactPoint,
+    anchor=FSTestCompactAnchor,
+    guideline=FSTestCompactGuideline,
+)
+
+
+def fontshellCompactObjectGenerator(cls):
+    unrequested = []
+    obj = compactClassMapping[cls]()
+    return obj, unrequested
+
+
 if __name__ == "__main__":
     import sys
 
@@ -157,4 +252,11 @@ if __name__ == "__main__":
         verbosity = 2
     else:
         verbosity = 1
-    testEnvironment(fontshellObjectGenerator, verbosity=verbosity)
+    success = testEnvironment(fontshellObjectGenerator, inApp=True, verbosity=verbosity)
+    compactSuccess = testEnvironment(
+        fontshellCompactObjectGenerator,
+        inApp=True,
+        verbosity=verbosity,
+        testNormalizers=False,
+    )
+    sys.exit(not (success and compactSuccess))
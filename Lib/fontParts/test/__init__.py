@@ -21,6 +21,8 @@ from fontParts.test import test_deprecated
 from fontParts.test import test_color
 from fontParts.test import test_bounds
 from fontParts.test import test_world
+from fontParts.test import test_base
+from fontParts.test import test_bench
 
 
 def testEnvironment(objectGenerator, inApp=False, verbosity=1, testNormalizers=True):
@@ -45,6 +47,8 @@ def testEnvironment(objectGenerator, inApp=False, verbosity=1, testNormalizers=T
         test_color,
         test_bounds,
         test_world,
+        test_base,
+        test_bench,
     ]
     if testNormalizers:
         modules.append(test_normalizers)
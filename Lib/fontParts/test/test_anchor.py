@@ -169,6 +169,19 @@ class TestAnchor(unittest.TestCase):
         for i, anchor in enumerate(glyph.anchors):
             self.assertEqual(anchor.index, i)
 
+    def test_get_index_after_remove(self):
+        glyph = self.getAnchor_index()
+        anchor = glyph.anchors[2]
+        self.assertEqual(anchor.index, 2)
+        glyph.removeAnchor(0)
+        self.assertEqual(anchor.index, 1)
+
+    def test_get_index_notInGlyph(self):
+        glyph = self.getAnchor_index()
+        anchor, _ = self.objectGenerator("anchor")
+        anchor.glyph = glyph
+        self.assertRaises(ValueError, getattr, anchor, "index")
+
     def test_set_index_noParent(self):
         anchor, _ = self.objectGenerator("anchor")
         with self.assertRaises(FontPartsError):
@@ -437,6 +437,34 @@ class TestBPoint(unittest.TestCase):
         with self.assertRaises(TypeError):
             bPoint.bcpOut = None
 
+    # handles after changes
+
+    def test_bcps_after_neighbor_change(self):
+        bPoint = self.getBPoint_corner()
+        contour = bPoint.contour
+        bPoints = contour.bPoints
+        self.assertEqual([b.bcpIn for b in bPoints], [(0, 0), (0, 0), (0, 0)])
+        bPoints[1].bcpOut = (51, 45)
+        contour.bPoints[2].bcpIn = (-20, 10)
+        self.assertEqual(bPoints[1].bcpOut, (51, 45))
+        self.assertEqual(bPoints[2].bcpIn, (-20, 10))
+        contour.removePoint(2)
+        self.assertEqual(bPoints[1].bcpOut, (182, -192))
+        self.assertEqual(bPoints[2].bcpIn, (-20, 10))
+
+    def test_bcps_after_insertPoint(self):
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoint((0, 0), "line")
+        contour.appendPoint((0, 50), "offcurve")
+        contour.appendPoint((50, 100), "offcurve")
+        contour.appendPoint((100, 100), "curve")
+        contour.appendPoint((100, 0), "line")
+        bPoints = contour.bPoints
+        expected = [(b.bcpIn, b.bcpOut) for b in bPoints]
+        contour.insertPoint(1, (0, 20), "line")
+        expected[0] = ((0, 0), (0, 0))
+        self.assertEqual([(b.bcpIn, b.bcpOut) for b in bPoints], expected)
+
     # --------------
     # Identification
     # --------------
@@ -455,6 +483,15 @@ class TestBPoint(unittest.TestCase):
         bPoint = self.getBPoint_corner()
         self.assertEqual(bPoint.index, 1)
 
+    def test_get_index_after_type_change(self):
+        bPoint = self.getBPoint_corner()
+        contour = bPoint.contour
+        self.assertEqual([b.index for b in contour.bPoints], [0, 1, 2])
+        contour.insertPoint(1, (50, 50), "line")
+        self.assertEqual(bPoint.index, 2)
+        contour.points[1].type = "offcurve"
+        self.assertEqual(bPoint.index, 1)
+
     # def test_get_index_noParentContour(self):
     #     bPoint = self.getBPoint_noParentContour()
     #     self.assertEqual(
@@ -0,0 +1,95 @@
+import unittest
+
+from fontParts.base.base import BaseObject, dynamicProperty
+from fontParts.base.errors import FontPartsError
+
+
+class _Base(BaseObject):
+    _foo = 1
+
+    foo = dynamicProperty("foo")
+
+    def _get_foo(self):
+        return self._foo
+
+    def _set_foo(self, value):
+        self._foo = value
+
+    bar = dynamicProperty("bar")
+
+    def _get_bar(self):
+        return "bar"
+
+
+class _Override(_Base):
+    def _set_foo(self, value):
+        self._foo = value * 100
+
+
+class _StaticGetter(_Base):
+    @staticmethod
+    def _get_bar():
+        return "static"
+
+
+class _Plain:
+    foo = dynamicProperty("foo")
+
+    def _get_foo(self):
+        return "plain"
+
+
+class _PlainOverride(_Plain):
+    def _get_foo(self):
+        return "plain override"
+
+
+class TestDynamicProperty(unittest.TestCase):
+    def test_get(self):
+        obj = _Base()
+        self.assertEqual(obj.foo, 1)
+
+    def test_set(self):
+        obj = _Base()
+        obj.foo = 2
+        self.assertEqual(obj.foo, 2)
+
+    def test_subclass_override(self):
+        base = _Base()
+        override = _Override()
+        base.foo = 2
+        override.foo = 2
+        self.assertEqual(base.foo, 2)
+        self.assertEqual(override.foo, 200)
+
+    def test_staticmethod_getter(self):
+        self.assertEqual(_StaticGetter().bar, "static")
+        self.assertEqual(_Base().bar, "bar")
+
+    def test_no_setter(self):
+        obj = _Base()
+        with self.assertRaises(FontPartsError):
+            obj.bar = "baz"
+
+    def test_class_access(self):
+        self.assertIsInstance(_Base.foo, dynamicProperty)
+
+    def test_not_baseObject(self):
+        self.assertEqual(_Plain().foo, "plain")
+        self.assertEqual(_PlainOverride().foo, "plain override")
+        with self.assertRaises(FontPartsError):
+            _Plain().foo = "baz"
+
+    def test_patched_after_creation(self):
+        class Patched(_Base):
+            pass
+
+        class PatchedSubclass(Patched):
+            pass
+
+        obj = Patched()
+        subclassObj = PatchedSubclass()
+        self.assertEqual(obj.bar, "bar")
+        Patched._get_bar = lambda self: "patched"
+        self.assertEqual(obj.bar, "patched")
+        self.assertEqual(subclassObj.bar, "patched")
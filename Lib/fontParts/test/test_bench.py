@@ -0,0 +1,326 @@
+import json
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+
+from fontParts.base import normalizers
+from fontParts.base.base import dynamicProperty
+from fontParts.bench import (
+    BenchmarkCase,
+    benchmarkEnvironment,
+    instrumentation,
+    makeReport,
+    percentile,
+    runBenchmarks,
+    timeOperation,
+    writeReport,
+)
+from fontParts.bench.memory import countAllocations, measureMemory
+from fontParts.bench.synthetic import makeSyntheticFont, writeSyntheticFont
+
+
+class _NotImplementedCase(BenchmarkCase):
+    def bench_missing(self):
+        raise NotImplementedError
+
+    def bench_noop(self):
+        return (lambda: None), 10
+
+
+class TestBench(unittest.TestCase):
+    # ----------
+    # Statistics
+    # ----------
+
+    def test_percentile(self):
+        values = [1, 2, 3, 4, 5]
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 3)
+        self.assertEqual(percentile(values, 100), 5)
+        self.assertEqual(percentile(values, 90), 4.6)
+
+    def test_percentile_empty(self):
+        with self.assertRaises(ValueError):
+            percentile([], 50)
+
+    def test_timeOperation(self):
+        calls = []
+        result = timeOperation(lambda: calls.append(None), repeat=3, minTime=0)
+        self.assertEqual(result["repeat"], 3)
+        self.assertEqual(len(calls), 3 * result["number"] + 1)
+        self.assertLessEqual(result["min"], result["median"])
+        self.assertLessEqual(result["median"], result["max"])
+
+    # -------
+    # Running
+    # -------
+
+    def test_runBenchmarks_skipped(self):
+        results = runBenchmarks(
+            [_NotImplementedCase],
+            self.objectGenerator,
+            repeat=1,
+            minTime=0,
+            verbosity=0,
+        )
+        results = {result["name"]: result for result in results}
+        self.assertTrue(results["_NotImplementedCase.missing"]["skipped"])
+        self.assertFalse(results["_NotImplementedCase.noop"]["skipped"])
+        self.assertEqual(results["_NotImplementedCase.noop"]["items"], 10)
+
+    def test_runBenchmarks_names(self):
+        results = runBenchmarks(
+            [_NotImplementedCase],
+            self.objectGenerator,
+            repeat=1,
+            minTime=0,
+            names=["noop"],
+            verbosity=0,
+        )
+        self.assertEqual(
+            [result["name"] for result in results], ["_NotImplementedCase.noop"]
+        )
+
+    def test_benchmarkEnvironment(self):
+        root = tempfile.mkdtemp()
+        path = os.path.join(root, "bench.json")
+        try:
+            report = benchmarkEnvironment(
+                self.objectGenerator,
+                glyphCount=4,
+                repeat=1,
+                minTime=0,
+                outputPath=path,
+                verbosity=0,
+            )
+            with open(path) as f:
+                written = json.load(f)
+        finally:
+            shutil.rmtree(root)
+        self.assertEqual(written, report)
+        names = {result["name"] for result in report["results"]}
+        for name in (
+            "font.glyphLookup",
+            "font.getFlatKerning",
+            "font.interpolate",
+            "font.open",
+            "glyph.transformBy",
+            "contour.pointIteration",
+            "largeContour.segmentGetItem",
+        ):
+            self.assertIn(name, names)
+
+    # -------
+    # Reports
+    # -------
+
+    def test_writeReport(self):
+        report = makeReport([], environment="test", repeat=1)
+        root = tempfile.mkdtemp()
+        path = os.path.join(root, "bench.json")
+        try:
+            writeReport(report, path)
+            with open(path) as f:
+                written = json.load(f)
+        finally:
+            shutil.rmtree(root)
+        self.assertEqual(written["environment"], "test")
+        self.assertEqual(written["settings"], {"repeat": 1})
+        self.assertEqual(written["results"], [])
+
+    # ---------------
+    # Synthetic Fonts
+    # ---------------
+
+    def getFont_synthetic(self, **kwargs):
+        settings = {
+            "glyphCount": 12,
+            "contourCount": 2,
+            "pointCount": 5,
+            "componentDepth": 3,
+            "kerningGroupCount": 3,
+            "kerningPairCount": 40,
+            "layerCount": 1,
+            "libSize": 4,
+        }
+        settings.update(kwargs)
+        return makeSyntheticFont(self.objectGenerator, **settings)
+
+    def test_synthetic_counts(self):
+        font = self.getFont_synthetic()
+        self.assertEqual(len(font), 12)
+        self.assertEqual(len(font.layers), 2)
+        self.assertEqual(len(font.layers[1]), 12)
+        self.assertEqual(len(font.kerning), 40)
+        libKeys = [key for key in font.lib if "synthetic" in key]
+        self.assertEqual(len(libKeys), 4)
+        for glyph in font:
+            self.assertEqual(len(glyph.contours), 2)
+            self.assertEqual(len(glyph.contours[0].segments), 5)
+
+    def test_synthetic_componentDepth(self):
+        font = self.getFont_synthetic()
+        glyph = font["glyph00003"]
+        depth = 0
+        while glyph.components:
+            glyph = font[glyph.components[0].baseGlyph]
+            depth += 1
+        self.assertEqual(depth, 3)
+
+    def test_synthetic_deterministic(self):
+        font1 = self.getFont_synthetic(seed=5)
+        font2 = self.getFont_synthetic(seed=5)
+        font3 = self.getFont_synthetic(seed=6)
+        self.assertEqual(dict(font1.kerning), dict(font2.kerning))
+        self.assertEqual(
+            [glyph.dumpToGLIF() for glyph in font1],
+            [glyph.dumpToGLIF() for glyph in font2],
+        )
+        self.assertNotEqual(
+            [glyph.dumpToGLIF() for glyph in font1],
+            [glyph.dumpToGLIF() for glyph in font3],
+        )
+
+    def test_synthetic_compatible(self):
+        font1 = self.getFont_synthetic()
+        font2 = self.getFont_synthetic(offset=100)
+        self.assertTrue(font1.isCompatible(font2)[0])
+        layer1, layer2 = font1.layers
+        self.assertTrue(layer1.isCompatible(layer2)[0])
+
+    def test_synthetic_negative(self):
+        with self.assertRaises(ValueError):
+            self.getFont_synthetic(glyphCount=-1)
+
+    def test_writeSyntheticFont(self):
+        root = tempfile.mkdtemp()
+        path = os.path.join(root, "synthetic.ufo")
+        try:
+            font = writeSyntheticFont(
+                self.objectGenerator, path, glyphCount=5, kerningPairCount=10
+            )
+            opened = type(font)(path, showInterface=False)
+            self.assertEqual(sorted(opened.keys()), sorted(font.keys()))
+            self.assertEqual(dict(opened.kerning), dict(font.kerning))
+            opened.close()
+        finally:
+            shutil.rmtree(root)
+
+    # ---------------
+    # Instrumentation
+    # ---------------
+
+    def test_instrumented_counts(self):
+        point, _ = self.objectGenerator("point")
+        className = type(point).__name__
+        with instrumentation.instrumented():
+            for value in range(5):
+                point.x = value
+            _ = point.y
+        counts = instrumentation.snapshot()
+        self.assertEqual(counts[className]["base_x [set]"][0], 5)
+        self.assertEqual(counts[className]["base_y [get]"][0], 1)
+        self.assertEqual(counts["normalizers"]["normalizeX"][0], 5)
+        self.assertIn(className, instrumentation.report())
+
+    def test_runBenchmarks_countCalls(self):
+        results = runBenchmarks(
+            [_NotImplementedCase],
+            self.objectGenerator,
+            repeat=1,
+            minTime=0,
+            names=["noop"],
+            countCalls=True,
+            verbosity=0,
+        )
+        self.assertEqual(results[0]["calls"], {})
+        self.assertFalse(instrumentation.isEnabled())
+
+    def test_runBenchmarks_memory(self):
+        results = runBenchmarks(
+            [_NotImplementedCase],
+            self.objectGenerator,
+            repeat=1,
+            minTime=0,
+            names=["noop"],
+            memory=True,
+            verbosity=0,
+        )
+        self.assertIn("peak", results[0]["memory"])
+
+    def test_runBenchmarks_allocations(self):
+        results = runBenchmarks(
+            [_NotImplementedCase],
+            self.objectGenerator,
+            repeat=1,
+            minTime=0,
+            names=["noop"],
+            allocations=True,
+            verbosity=0,
+        )
+        self.assertEqual(results[0]["allocations"]["objects"], 0)
+
+    def test_instrumented_restores(self):
+        getter = dynamicProperty.__get__
+        normalizer = normalizers.normalizeX
+        with instrumentation.instrumented():
+            self.assertTrue(instrumentation.isEnabled())
+            self.assertIsNot(dynamicProperty.__get__, getter)
+        self.assertFalse(instrumentation.isEnabled())
+        self.assertIs(dynamicProperty.__get__, getter)
+        self.assertIs(normalizers.normalizeX, normalizer)
+
+    def test_instrumented_disabled_does_not_count(self):
+        point, _ = self.objectGenerator("point")
+        instrumentation.reset()
+        point.x = 10
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    # ------
+    # Memory
+    # ------
+
+    def test_measureMemory(self):
+        result = measureMemory(lambda: [0] * 100000, items=10)
+        self.assertGreater(result["retained"], 100000 * 7)
+        self.assertGreaterEqual(result["peak"], result["retained"])
+        self.assertEqual(result["retainedPerItem"], result["retained"] / 10)
+        self.assertGreater(result["modules"][__name__], 100000 * 7)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_measureMemory_released(self):
+        result = measureMemory(lambda: [0] * 100000 and None)
+        self.assertGreater(result["peak"], 100000 * 7)
+        self.assertLess(result["retained"], 100000)
+
+    def test_countAllocations(self):
+        result = countAllocations(lambda: self.objectGenerator("point"), items=2)
+        self.assertEqual(result["objects"], 1)
+        self.assertEqual(result["objectsPerItem"], 0.5)
+        self.assertFalse(instrumentation.isEnabled())
+
+    def test_countAllocations_reused(self):
+        glyph, _ = self.objectGenerator("glyph")
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.closePath()
+        contour = glyph.contours[0]
+        points = contour.points
+        result = countAllocations(lambda: [point.x for point in contour.points])
+        self.assertLessEqual(result["objects"], len(points))
+
+    def test_measureMemory_glyph(self):
+        glyph, _ = self.objectGenerator("glyph")
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.lineTo((100, 100))
+        pen.closePath()
+        result = measureMemory(glyph.copy)
+        self.assertGreater(result["retained"], 0)
+        self.assertTrue(
+            any(name.startswith("fontParts.") for name in result["modules"])
+        )
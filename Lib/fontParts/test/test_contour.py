@@ -161,6 +161,15 @@ class TestContour(unittest.TestCase):
         self.assertEqual(contour2.index, 1)
         self.assertEqual(contour3.index, 2)
 
+    def test_index_after_remove(self):
+        glyph, _ = self.objectGenerator("glyph")
+        glyph.appendContour(self.getContour_bounds())
+        glyph.appendContour(self.getContour_bounds())
+        contour = glyph.contours[1]
+        self.assertEqual(contour.index, 1)
+        glyph.removeContour(0)
+        self.assertEqual(contour.index, 0)
+
     def test_set_index(self):
         glyph, _ = self.objectGenerator("glyph")
         contour1 = glyph.appendContour(self.getContour_bounds())
@@ -493,6 +502,75 @@ class TestContour(unittest.TestCase):
         segments = contour.segments
         self.assertEqual(segments, ())
 
+    def test_segments_after_point_type_change(self):
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoint((0, 0), "line")
+        contour.appendPoint((0, 100), "line")
+        contour.appendPoint((100, 100), "line")
+        contour.appendPoint((100, 0), "line")
+        self.assertEqual(len(contour), 4)
+        contour.points[1].type = "offcurve"
+        self.assertEqual([len(segment.points) for segment in contour], [2, 1, 1])
+
+    def test_segments_after_point_insert_and_remove(self):
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoint((0, 0), "line")
+        contour.appendPoint((0, 100), "line")
+        contour.appendPoint((100, 0), "line")
+        self.assertEqual(len(contour.segments), 3)
+        contour.insertPoint(1, (50, 50), "line")
+        self.assertEqual(len(contour.segments), 4)
+        self.assertEqual(
+            [(point.x, point.y) for point in contour[0].points], [(50, 50)]
+        )
+        contour.removePoint(0)
+        self.assertEqual(len(contour.segments), 3)
+        self.assertEqual(
+            [(point.x, point.y) for point in contour[-1].points], [(50, 50)]
+        )
+
+    def test_segments_after_setStartPoint(self):
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoint((0, 0), "line")
+        contour.appendPoint((0, 100), "line")
+        contour.appendPoint((100, 0), "line")
+        self.assertEqual((contour[0].onCurve.x, contour[0].onCurve.y), (0, 100))
+        contour.setStartPoint(2)
+        self.assertEqual((contour[0].onCurve.x, contour[0].onCurve.y), (0, 0))
+
+    def test_segments_after_reverse(self):
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoint((0, 0), "line")
+        contour.appendPoint((0, 100), "line")
+        contour.appendPoint((100, 0), "line")
+        self.assertEqual((contour[0].onCurve.x, contour[0].onCurve.y), (0, 100))
+        contour.reverse()
+        self.assertEqual(
+            [(segment.onCurve.x, segment.onCurve.y) for segment in contour],
+            [(100, 0), (0, 100), (0, 0)],
+        )
+
+    def test_segments_after_segment_type_change(self):
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoint((0, 0), "line")
+        contour.appendPoint((0, 100), "line")
+        contour.appendPoint((100, 0), "line")
+        self.assertEqual([segment.type for segment in contour], ["line"] * 3)
+        contour[1].type = "curve"
+        self.assertEqual(
+            [segment.type for segment in contour], ["line", "curve", "line"]
+        )
+        self.assertEqual(len(contour.points), 5)
+
+    def test_segments_read_moved_points(self):
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoint((0, 0), "line")
+        contour.appendPoint((0, 100), "line")
+        segment = contour[0]
+        contour.points[1].x = 50
+        self.assertEqual(contour[0], segment)
+        self.assertEqual(contour[0].onCurve.x, 50)
+
     def test_segment_insert_open(self):
         # at index 0
         contour, _ = self.objectGenerator("contour")
@@ -623,3 +701,231 @@ class TestContour(unittest.TestCase):
             [(point.x, point.y) for point in contour.points],
             [(2, 2), (3, 3), (0, 0), (1, 1)],
         )
+
+    def test_appendPoints(self):
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoints(
+            [((0, 0),), ((0, 100), "line", True), [(100, 100), "line", False, "a"]]
+        )
+        self.assertEqual(
+            [(point.position, point.type) for point in contour.points],
+            [((0, 0), "line"), ((0, 100), "line"), ((100, 100), "line")],
+        )
+        self.assertTrue(contour.points[1].smooth)
+        self.assertEqual(contour.points[2].name, "a")
+
+    def test_appendPoints_point(self):
+        contour = self.getContour_bounds()
+        other, _ = self.objectGenerator("contour")
+        other.appendPoints(contour.points)
+        self.assertEqual(other.coordinates.tolist(), contour.coordinates.tolist())
+
+    def test_insertPoints(self):
+        contour = self.getContour_bounds()
+        contour.insertPoints(
+            1, [((0, 50), "offcurve"), ((50, 100), "offcurve"), ((50, 100), "curve")]
+        )
+        self.assertEqual(
+            contour.pointTypes,
+            ("line", "offcurve", "offcurve", "curve", "line", "line", "line"),
+        )
+        self.assertEqual(contour.points[4].position, (0, 100))
+        self.assertEqual(len(contour.segments), 5)
+
+    def test_insertPoints_invalid(self):
+        contour = self.getContour_bounds()
+        with self.assertRaises(TypeError):
+            contour.insertPoints(0, [((0, 0), "line"), "point"])
+        with self.assertRaises(ValueError):
+            contour.insertPoints(0, [((0, 0), "line"), ()])
+        with self.assertRaises(ValueError):
+            contour.insertPoints(0, [((0, 0), "line"), ((0, 0), "foo")])
+        self.assertEqual(len(contour.points), 4)
+
+    def test_removePoint_point(self):
+        contour = self.getContour_bounds()
+        contour.removePoint(contour.points[3])
+        self.assertEqual(
+            [point.position for point in contour.points], [(0, 0), (0, 100), (100, 100)]
+        )
+
+    def test_removePoint_point_not_in_contour(self):
+        contour = self.getContour_bounds()
+        other = self.getContour_bounds()
+        with self.assertRaises(ValueError):
+            contour.removePoint(other.points[0])
+
+    def test_removePoints(self):
+        contour = self.getContour_bounds()
+        contour.removePoints([contour.points[3], 0])
+        self.assertEqual(
+            [point.position for point in contour.points], [(0, 100), (100, 100)]
+        )
+
+    def test_removePoints_invalid(self):
+        contour = self.getContour_bounds()
+        other = self.getContour_bounds()
+        with self.assertRaises(ValueError):
+            contour.removePoints([4])
+        with self.assertRaises(ValueError):
+            contour.removePoints([1, 1])
+        with self.assertRaises(ValueError):
+            contour.removePoints([other.points[0]])
+        with self.assertRaises(ValueError):
+            contour.removePoints([-5])
+        with self.assertRaises(ValueError):
+            contour.removePoints([-1, 3])
+        self.assertEqual(len(contour.points), 4)
+
+    def test_removePoints_negative_index(self):
+        contour = self.getContour_bounds()
+        contour.removePoints([-1, 0])
+        self.assertEqual(
+            [point.position for point in contour.points], [(0, 100), (100, 100)]
+        )
+
+    # ------------
+    # Point Inside
+    # ------------
+
+    def test_pointsInside(self):
+        contour = self.getContour_bounds()
+        points = [(50, 50), (150, 50), (50, -50), (-1, 99)]
+        self.assertEqual(
+            contour.pointsInside(points),
+            tuple(contour.pointInside(point) for point in points),
+        )
+        self.assertEqual(contour.pointsInside(points), (True, False, False, False))
+
+    def test_pointsInside_curve(self):
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoint((0, 0), "curve")
+        contour.appendPoint((0, 300), "offcurve")
+        contour.appendPoint((300, 300), "offcurve")
+        contour.appendPoint((300, 0), "curve")
+        points = [(x, y) for x in range(-25, 350, 50) for y in range(-25, 300, 50)]
+        self.assertEqual(
+            contour.pointsInside(points),
+            tuple(contour.pointInside(point) for point in points),
+        )
+
+    def test_pointsInside_changed(self):
+        contour = self.getContour_bounds()
+        self.assertEqual(contour.pointsInside([(50, 50), (250, 50)]), (True, False))
+        contour.moveBy((200, 0))
+        self.assertEqual(contour.pointsInside([(50, 50), (250, 50)]), (False, True))
+        contour.removePoint(3)
+        self.assertEqual(contour.pointsInside([(220, 90), (280, 10)]), (True, False))
+
+    def test_pointsInside_empty(self):
+        contour = self.getContour_bounds()
+        self.assertEqual(contour.pointsInside([]), ())
+        contour, _ = self.objectGenerator("contour")
+        self.assertEqual(contour.pointsInside([(0, 0)]), (False,))
+
+    def test_contourInside(self):
+        contour = self.getContour_bounds()
+        other, _ = self.objectGenerator("contour")
+        other.appendPoint((20, 20), "curve")
+        other.appendPoint((20, 90), "offcurve")
+        other.appendPoint((80, 90), "offcurve")
+        other.appendPoint((80, 20), "curve")
+        self.assertTrue(contour.contourInside(other))
+        self.assertFalse(other.contourInside(contour))
+        other.moveBy((50, 0))
+        self.assertFalse(contour.contourInside(other))
+
+    # -----------
+    # Coordinates
+    # -----------
+
+    def test_coordinates_get(self):
+        contour = self.getContour_boundsExtrema()
+        self.assertEqual(
+            contour.coordinates.tolist(),
+            [[0, 0], [0, 100], [50, 100], [117, 100], [117, 0], [50, 0]],
+        )
+
+    def test_coordinates_get_empty(self):
+        contour, _ = self.objectGenerator("contour")
+        self.assertEqual(contour.coordinates.tolist(), [])
+
+    def test_coordinates_get_is_copy(self):
+        contour = self.getContour_bounds()
+        coordinates = contour.coordinates
+        coordinates[0, 0] = 500
+        self.assertEqual(contour.points[0].x, 0)
+
+    def test_coordinates_set(self):
+        contour = self.getContour_boundsExtrema()
+        coordinates = contour.coordinates
+        coordinates[1, 0] = 10.5
+        coordinates[5, 1] = -20
+        contour.coordinates = coordinates
+        self.assertEqual((contour.points[1].x, contour.points[1].y), (10.5, 100))
+        self.assertEqual((contour.points[5].x, contour.points[5].y), (50, -20))
+        self.assertEqual(contour.pointTypes[1], "line")
+
+    def test_coordinates_set_sequence(self):
+        contour = self.getContour_bounds()
+        contour.coordinates = [(1, 2), (3, 4), (5, 6), (7, 8)]
+        self.assertEqual(
+            [(point.x, point.y) for point in contour.points],
+            [(1, 2), (3, 4), (5, 6), (7, 8)],
+        )
+
+    def test_coordinates_set_in_glyph(self):
+        glyph, _ = self.objectGenerator("glyph")
+        contour = glyph.appendContour(self.getContour_bounds())
+        self.assertEqual(glyph.bounds, (0, 0, 100, 100))
+        contour.coordinates = [(0, 0), (0, 200), (200, 200), (200, 0)]
+        self.assertEqual(glyph.bounds, (0, 0, 200, 200))
+
+    def test_coordinates_set_wrong_count(self):
+        contour = self.getContour_bounds()
+        with self.assertRaises(ValueError):
+            contour.coordinates = [(1, 2), (3, 4)]
+
+    def test_coordinates_set_invalid_pair(self):
+        contour = self.getContour_bounds()
+        with self.assertRaises(ValueError):
+            contour.coordinates = [(1, 2, 3), (3, 4), (5, 6), (7, 8)]
+
+    def test_coordinates_set_invalid_type(self):
+        contour = self.getContour_bounds()
+        with self.assertRaises(TypeError):
+            contour.coordinates = "abc"
+        with self.assertRaises(TypeError):
+            contour.coordinates = [(1, "2"), (3, 4), (5, 6), (7, 8)]
+
+    def test_pointTypes(self):
+        contour = self.getContour_boundsExtrema()
+        self.assertEqual(
+            contour.pointTypes,
+            ("line", "line", "line", "offcurve", "offcurve", "curve"),
+        )
+
+    def test_smoothFlags(self):
+        contour = self.getContour_bounds()
+        contour.points[2].smooth = True
+        self.assertEqual(contour.smoothFlags, (False, False, True, False))
+
+    # --------------
+    # Transformation
+    # --------------
+
+    def test_transformBy(self):
+        contour = self.getContour_boundsExtrema()
+        contour.transformBy((2, 0, 0, 0.5, 10, 20))
+        self.assertEqual(
+            contour.coordinates.tolist(),
+            [[10, 20], [10, 70], [110, 70], [244, 70], [244, 20], [110, 20]],
+        )
+
+    def test_rotateBy_origin(self):
+        contour = self.getContour_bounds()
+        contour.rotateBy(90, origin=(50, 50))
+        self.assertEqual(
+            [(round(point.x), round(point.y)) for point in contour.points],
+            [(100, 0), (0, 0), (0, 100), (100, 100)],
+        )
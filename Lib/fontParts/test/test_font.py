@@ -3,6 +3,7 @@ import collections
 import tempfile
 import os
 import shutil
+from fontParts.base import FontPartsError
 
 
 class TestFont(unittest.TestCase):
@@ -31,6 +32,16 @@ class TestFont(unittest.TestCase):
             font.newGlyph(name)
         return font
 
+    def test_glyph_font_sameNativeFont(self):
+        font = self.getFont_glyphs()
+        other = type(font)(pathOrObject=font.naked())
+        glyph = font["A"]
+        kerning = font.kerning
+        self.assertIs(glyph.font, font)
+        self.assertIs(other["A"].font, other)
+        self.assertIs(other.kerning.font, other)
+        self.assertIs(kerning.font, font)
+
     def getFont_guidelines(self):
         font, _ = self.objectGenerator("font")
         font.appendGuideline((1, 2), 0, "Test Guideline 1")
@@ -166,6 +177,110 @@ class TestFont(unittest.TestCase):
         }
         self.assertEqual(font.getFlatKerning(), expected)
 
+    # ------------
+    # Units Per Em
+    # ------------
+
+    def getFont_unitsPerEm(self):
+        font = self.getFont_glyphs()
+        font.info.unitsPerEm = 1000
+        font.info.ascender = 750
+        font.info.openTypeOS2TypoLineGap = 201
+        glyph = font["A"]
+        glyph.width = 500
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.lineTo((100, 100))
+        pen.closePath()
+        glyph.appendAnchor("top", (50, 700))
+        glyph.appendGuideline((0, 300), 0)
+        glyph = font["B"]
+        glyph.appendComponent("A", offset=(10, 20), scale=(2, 1))
+        font.appendGuideline((0, 500), 0)
+        font.kerning[("A", "B")] = -51
+        background = font.newLayer("background")
+        background.newGlyph("A").width = 300
+        return font
+
+    def test_rescaleUnitsPerEm(self):
+        font = self.getFont_unitsPerEm()
+        font.rescaleUnitsPerEm(2000)
+        self.assertEqual(font.info.unitsPerEm, 2000)
+        self.assertEqual(font.info.ascender, 1500)
+        self.assertEqual(font.info.openTypeOS2TypoLineGap, 402)
+        glyph = font["A"]
+        self.assertEqual(glyph.bounds, (0, 0, 200, 200))
+        self.assertEqual(glyph.width, 1000)
+        self.assertEqual(glyph.anchors[0].position, (100, 1400))
+        self.assertEqual(glyph.guidelines[0].position, (0, 600))
+        self.assertEqual(font["B"].components[0].transformation, (2, 0, 0, 1, 20, 40))
+        self.assertEqual(font.guidelines[0].position, (0, 1000))
+        self.assertEqual(font.kerning[("A", "B")], -102)
+        self.assertEqual(font.getLayer("background")["A"].width, 600)
+
+    def test_rescaleUnitsPerEm_round(self):
+        font = self.getFont_unitsPerEm()
+        font.rescaleUnitsPerEm(1024, round=True)
+        self.assertEqual(font.info.unitsPerEm, 1024)
+        self.assertEqual(font.info.ascender, 768)
+        self.assertEqual(font["A"].width, 512)
+        self.assertEqual(font["A"].bounds, (0, 0, 102, 102))
+        self.assertEqual(font["B"].components[0].transformation, (2, 0, 0, 1, 10, 20))
+        self.assertEqual(font.kerning[("A", "B")], -52)
+
+    def test_rescaleUnitsPerEm_invalid(self):
+        font = self.getFont_unitsPerEm()
+        with self.assertRaises(ValueError):
+            font.rescaleUnitsPerEm(0)
+        with self.assertRaises(TypeError):
+            font.rescaleUnitsPerEm("1000")
+        with self.assertRaises(ValueError):
+            font.rescaleUnitsPerEm(1000, round="yes")
+
+    def test_rescaleUnitsPerEm_notSet(self):
+        font, _ = self.objectGenerator("font")
+        with self.assertRaises(FontPartsError):
+            font.rescaleUnitsPerEm(1000)
+
+    # -------
+    # Changes
+    # -------
+
+    def test_holdChanges(self):
+        font = self.getFont_glyphs()
+        pen = font["A"].getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.lineTo((100, 100))
+        pen.closePath()
+        with font.holdChanges(), font.holdChanges():
+            font["A"].moveBy((10, 20))
+        self.assertEqual(font["A"].bounds, (10, 20, 110, 120))
+
+    def test_holdChanges_structure(self):
+        font = self.getFont_glyphs()
+        with font.holdChanges():
+            glyph = font["A"]
+            with glyph.holdChanges():
+                glyph.name = "X"
+                self.assertIn("X", font)
+                self.assertNotIn("A", font)
+            font.newGlyph("Y")
+            self.assertIn("Y", font.keys())
+            font.removeGlyph("B")
+            self.assertNotIn("B", font.keys())
+            self.assertEqual(font["X"], glyph)
+        self.assertEqual(sorted(font.keys()), ["C", "D", "X", "Y"])
+
+    def test_holdChanges_released_on_error(self):
+        font = self.getFont_glyphs()
+        with self.assertRaises(ValueError), font.holdChanges():
+            font["A"].width = 100
+            raise ValueError
+        font["A"].width = 200
+        self.assertEqual(font["A"].width, 200)
+
     # ----
     # Hash
     # ----
@@ -509,3 +624,27 @@ class TestFont(unittest.TestCase):
         )
         self.assertEqual(len(interpolated_font.guidelines), 1)
         self.assertEqual(interpolated_font.guidelines[0].position, (100, 100))
+
+    def test_combine(self):
+        combined_font, _ = self.objectGenerator("font")
+        masters = []
+        for index, weight in enumerate((0.25, 0.5, 0.25)):
+            font, _ = self.objectGenerator("font")
+            font.info.unitsPerEm = 1000 * (index + 1)
+            font.kerning[("A", "B")] = -100 * (index + 1)
+            glyph = font.newGlyph("A")
+            glyph.width = 100 * (index + 1)
+            font.newGlyph("B" * (index + 1))
+            masters.append((font, weight))
+        combined_font.combine(masters)
+        self.assertEqual(combined_font.keys(), ("A",))
+        self.assertEqual(combined_font["A"].width, 200)
+        self.assertEqual(combined_font.kerning[("A", "B")], -200)
+        self.assertEqual(combined_font.info.unitsPerEm, 2000)
+
+    def test_combine_invalid(self):
+        font, _ = self.objectGenerator("font")
+        with self.assertRaises(TypeError):
+            font.combine([(font.info, 1)])
+        with self.assertRaises(ValueError):
+            font.combine([])
@@ -1,6 +1,8 @@
 import unittest
 import collections
+import pickle
 from fontParts.base import FontPartsError
+from fontParts.base.base import isTrustedMode, trustedMode
 from .test_image import testImageData
 
 
@@ -40,6 +42,68 @@ class TestGlyph(unittest.TestCase):
         fp_object, _ = self.objectGenerator(obj_name)
         return fp_object
 
+    # ----
+    # Copy
+    # ----
+
+    def test_copy(self):
+        glyph = self.getGlyph_generic()
+        glyph.contours[0].getIdentifier()
+        glyph.contours[1].points[2].name = "corner"
+        glyph.appendComponent("A", offset=(10, 20), scale=(2, 1))
+        copied = glyph.copy()
+        self.assertIsNot(copied, glyph)
+        self.assertEqual(copied.name, glyph.name)
+        self.assertEqual(copied.width, glyph.width)
+        self.assertEqual(
+            [
+                [(p.position, p.type, p.smooth, p.name) for p in contour.points]
+                for contour in copied.contours
+            ],
+            [
+                [(p.position, p.type, p.smooth, p.name) for p in contour.points]
+                for contour in glyph.contours
+            ],
+        )
+        self.assertEqual(copied.contours[0].identifier, glyph.contours[0].identifier)
+        self.assertEqual(
+            [(c.baseGlyph, c.transformation) for c in copied.components],
+            [("A", (2, 0, 0, 1, 10, 20))],
+        )
+        self.assertEqual(
+            [(a.name, a.position) for a in copied.anchors],
+            [(a.name, a.position) for a in glyph.anchors],
+        )
+        self.assertEqual(
+            [(g.name, g.position, g.angle) for g in copied.guidelines],
+            [(g.name, g.position, g.angle) for g in glyph.guidelines],
+        )
+
+    def test_copyData_existing_identifiers(self):
+        source = self.getGlyph_generic()
+        anchor = source.anchors[0]
+        identifier = anchor.getIdentifier()
+        glyph, _ = self.objectGenerator("glyph")
+        glyph.appendAnchor(anchor=anchor)
+        glyph.copyData(source)
+        self.assertEqual(
+            [a.name for a in glyph.anchors],
+            ["Test Anchor 1", "Test Anchor 1", "Test Anchor 2"],
+        )
+        self.assertEqual(glyph.anchors[0].identifier, identifier)
+        self.assertNotEqual(glyph.anchors[1].identifier, identifier)
+        self.assertEqual(len(glyph.contours), 2)
+
+    def test_copyData_self_reference(self):
+        source, _ = self.objectGenerator("glyph")
+        source.name = "A"
+        source.appendComponent("B")
+        source.name = "B"
+        glyph, _ = self.objectGenerator("glyph")
+        with self.assertRaises(FontPartsError):
+            glyph.copyData(source)
+        self.assertEqual(len(glyph.components), 0)
+
     # -------
     # Parents
     # -------
@@ -189,6 +253,60 @@ class TestGlyph(unittest.TestCase):
         glyph = self.getGlyph_generic()
         self.assertEqual(glyph.bounds, (100, -10, 200, 100))
 
+    def test_pointsInside(self):
+        glyph = self.getGlyph_generic()
+        points = [(150, 50), (105, 50), (50, 50), (150, 150), (250, -20)]
+        self.assertEqual(
+            glyph.pointsInside(points),
+            tuple(glyph.pointInside(point) for point in points),
+        )
+        self.assertEqual(glyph.pointsInside(points), (True, True, False, False, False))
+
+    def test_pointsInside_curve(self):
+        glyph, _ = self.objectGenerator("glyph")
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.curveTo((0, 300), (300, 300), (300, 0))
+        pen.closePath()
+        points = [(x, y) for x in range(-25, 350, 50) for y in range(-25, 300, 50)]
+        self.assertEqual(
+            glyph.pointsInside(points),
+            tuple(glyph.pointInside(point) for point in points),
+        )
+
+    def test_pointsInside_changed(self):
+        glyph = self.getGlyph_generic()
+        self.assertEqual(glyph.pointsInside([(150, 50), (350, 50)]), (True, False))
+        glyph.moveBy((200, 0))
+        self.assertEqual(glyph.pointsInside([(150, 50), (350, 50)]), (False, True))
+        glyph.clearContours()
+        self.assertEqual(glyph.pointsInside([(150, 50), (350, 50)]), (False, False))
+
+    def test_pointsInside_component(self):
+        font, _ = self.objectGenerator("font")
+        glyph = font.newGlyph("glyph")
+        base = font.newGlyph("base")
+        pen = base.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.lineTo((100, 100))
+        pen.lineTo((100, 0))
+        pen.closePath()
+        glyph.appendComponent("base", offset=(200, 0))
+        glyph.appendComponent("missing")
+        self.assertEqual(glyph.pointsInside([(50, 50), (250, 50)]), (False, True))
+
+    def test_pointsInside_empty(self):
+        glyph = self.getGlyph_generic()
+        self.assertEqual(glyph.pointsInside([]), ())
+
+    def test_pointsInside_invalid(self):
+        glyph = self.getGlyph_generic()
+        with self.assertRaises(TypeError):
+            glyph.pointsInside(123)
+        with self.assertRaises(TypeError):
+            glyph.pointsInside([("a", 1)])
+
     # ------
     # Layers
     # ------
@@ -536,6 +654,81 @@ class TestGlyph(unittest.TestCase):
             glyph.contours[0].points[0].y == 0 and glyph.contours[1].points[0].y == 50
         )
 
+    def getGlyph_nested(self):
+        glyph = self.getGlyph_empty()
+        pen = glyph.getPen()
+        for xMin, yMin, xMax, yMax in (
+            (40, 40, 60, 60),
+            (0, 0, 100, 100),
+            (200, 0, 300, 100),
+            (20, 20, 80, 80),
+            (220, 20, 280, 80),
+        ):
+            pen.moveTo((xMin, yMin))
+            pen.lineTo((xMin, yMax))
+            pen.lineTo((xMax, yMax))
+            pen.lineTo((xMax, yMin))
+            pen.closePath()
+        return glyph
+
+    def test_getContourHierarchy(self):
+        glyph = self.getGlyph_nested()
+        self.assertEqual(
+            glyph.getContourHierarchy(),
+            ((3, ()), (None, (3,)), (None, (4,)), (1, (0,)), (2, ())),
+        )
+
+    def test_getContourHierarchy_changed(self):
+        glyph = self.getGlyph_nested()
+        glyph.getContourHierarchy()
+        glyph.contours[0].moveBy((500, 0))
+        self.assertEqual(
+            glyph.getContourHierarchy(),
+            ((None, ()), (None, (3,)), (None, (4,)), (1, ()), (2, ())),
+        )
+        glyph.removeContour(1)
+        self.assertEqual(
+            glyph.getContourHierarchy(), ((None, ()), (None, (3,)), (None, ()), (1, ()))
+        )
+
+    def test_getContourHierarchy_empty(self):
+        glyph = self.getGlyph_empty()
+        self.assertEqual(glyph.getContourHierarchy(), ())
+
+    def test_correctDirection(self):
+        glyph = self.getGlyph_nested()
+        glyph.correctDirection()
+        self.assertEqual(
+            [contour.clockwise for contour in glyph.contours],
+            [False, False, False, True, True],
+        )
+
+    def test_correctDirection_overlapping(self):
+        glyph = self.getGlyph_empty()
+        pen = glyph.getPen()
+        for xMin, yMin, xMax, yMax in (
+            (0, 0, 200, 200),
+            (100, 0, 300, 200),
+            (120, 50, 180, 150),
+        ):
+            pen.moveTo((xMin, yMin))
+            pen.lineTo((xMin, yMax))
+            pen.lineTo((xMax, yMax))
+            pen.lineTo((xMax, yMin))
+            pen.closePath()
+        glyph.correctDirection()
+        self.assertEqual(
+            [contour.clockwise for contour in glyph.contours], [False, False, False]
+        )
+
+    def test_correctDirection_trueType(self):
+        glyph = self.getGlyph_nested()
+        glyph.correctDirection(trueType=True)
+        self.assertEqual(
+            [contour.clockwise for contour in glyph.contours],
+            [True, True, True, False, False],
+        )
+
     # ----------
     # Components
     # ----------
@@ -1158,6 +1351,42 @@ class TestGlyph(unittest.TestCase):
         self.assertEqual(report.componentsMissingFromGlyph1, ["a", "b"])
         self.assertEqual(report.componentsMissingFromGlyph2, ["x", "y"])
 
+    def test_isCompatible_contours(self):
+        glyph1 = self.getGlyph_generic()
+        glyph2 = self.getGlyph_generic()
+        glyph2.moveBy((100, 50))
+        is_compatible, report = glyph1.isCompatible(glyph2)
+        self.assertTrue(is_compatible)
+        self.assertFalse(report.warning)
+        self.assertEqual(report.contours, [])
+
+    def test_isCompatible_contours_line_curve(self):
+        glyph1, _ = self.objectGenerator("glyph")
+        glyph2, _ = self.objectGenerator("glyph")
+        for glyph, segmentType in ((glyph1, "line"), (glyph2, "curve")):
+            pen = glyph.getPointPen()
+            pen.beginPath()
+            pen.addPoint((0, 0), "line")
+            pen.addPoint((0, 100), segmentType)
+            pen.addPoint((100, 100), "line")
+            pen.endPath()
+        is_compatible, report = glyph1.isCompatible(glyph2)
+        self.assertTrue(is_compatible)
+        self.assertEqual(report.contours, [])
+
+    def test_isCompatible_contours_after_change(self):
+        glyph1 = self.getGlyph_generic()
+        glyph2 = self.getGlyph_generic()
+        self.assertTrue(glyph1.isCompatible(glyph2)[0])
+        glyph2.contours[0].segments[1].type = "qcurve"
+        is_compatible, report = glyph1.isCompatible(glyph2)
+        self.assertFalse(is_compatible)
+        self.assertTrue(report.contours[0].segments[0].typeDifference)
+        glyph2.removeContour(0)
+        is_compatible, report = glyph1.isCompatible(glyph2)
+        self.assertFalse(is_compatible)
+        self.assertTrue(report.contourCountDifference)
+
     # -------------
     # Interpolation
     # -------------
@@ -1180,10 +1409,215 @@ class TestGlyph(unittest.TestCase):
         interpolated.interpolate(0.5154, glyph_min, glyph_max, round=True)
         self.assertEqual(interpolated.width, 1515)
 
+    def test_interpolate_anchors_and_lib(self):
+        interpolated, _ = self.objectGenerator("glyph")
+        glyph_min, _ = self.objectGenerator("glyph")
+        glyph_max, _ = self.objectGenerator("glyph")
+        glyph_min.appendAnchor("top", (100, 100))
+        glyph_max.appendAnchor("top", (200, 300))
+        glyph_min.lib["key"] = "value"
+        interpolated.interpolate(0.5, glyph_min, glyph_max)
+        self.assertEqual(
+            [(a.name, a.position) for a in interpolated.anchors], [("top", (150, 200))]
+        )
+        self.assertEqual(interpolated.lib["key"], "value")
+        self.assertFalse(isTrustedMode())
+
+    def getGlyph_interpolationMasters(self):
+        glyph_min, _ = self.objectGenerator("glyph")
+        glyph_max, _ = self.objectGenerator("glyph")
+        for glyph, scale in ((glyph_min, 1), (glyph_max, 2)):
+            pen = glyph.getPen()
+            pen.moveTo((0, 0))
+            pen.lineTo((0, 100 * scale))
+            pen.curveTo((25, 150 * scale), (75, 150 * scale), (100 * scale, 100))
+            pen.lineTo((100 * scale, 0))
+            pen.closePath()
+            glyph.width = 200 * scale
+        return glyph_min, glyph_max
+
+    def test_interpolate_outline(self):
+        interpolated, _ = self.objectGenerator("glyph")
+        glyph_min, glyph_max = self.getGlyph_interpolationMasters()
+        glyph_min.note = "min"
+        glyph_min.contours[0].points[0].name = "start"
+        interpolated.interpolate(0.5, glyph_min, glyph_max, round=False)
+        points = interpolated.contours[0].points
+        self.assertEqual(
+            [(point.type, point.position) for point in points],
+            [
+                ("line", (0, 0)),
+                ("line", (0, 150)),
+                ("offcurve", (25, 225)),
+                ("offcurve", (75, 225)),
+                ("curve", (150, 100)),
+                ("line", (150, 0)),
+            ],
+        )
+        self.assertEqual(points[0].name, "start")
+        self.assertEqual(interpolated.width, 300)
+        self.assertEqual(interpolated.note, "min")
+
+    def test_interpolate_outline_with_rounding(self):
+        interpolated, _ = self.objectGenerator("glyph")
+        glyph_min, glyph_max = self.getGlyph_interpolationMasters()
+        interpolated.interpolate(0.333, glyph_min, glyph_max, round=True)
+        self.assertEqual(interpolated.contours[0].points[4].position, (133, 100))
+        self.assertEqual(interpolated.width, 267)
+
+    def test_interpolate_replaces_existing_data(self):
+        glyph_min, glyph_max = self.getGlyph_interpolationMasters()
+        interpolated = self.getGlyph_generic()
+        interpolated.interpolate(0.5, glyph_min, glyph_max)
+        self.assertEqual(len(interpolated.contours), 1)
+        self.assertEqual(len(interpolated.components), 0)
+        self.assertEqual(len(interpolated.anchors), 0)
+
+    def test_interpolate_self_as_master(self):
+        glyph_min, glyph_max = self.getGlyph_interpolationMasters()
+        glyph_min.interpolate(0.5, glyph_min, glyph_max)
+        self.assertEqual(glyph_min.contours[0].points[4].position, (150, 100))
+        self.assertEqual(glyph_min.width, 300)
+
+    def test_interpolate_with_guidelines(self):
+        interpolated, _ = self.objectGenerator("glyph")
+        glyph_min, glyph_max = self.getGlyph_interpolationMasters()
+        glyph_min.appendGuideline((0, 100), 0)
+        glyph_max.appendGuideline((0, 200), 0)
+        interpolated.interpolate(0.5, glyph_min, glyph_max)
+        self.assertEqual(interpolated.guidelines[0].position, (0, 150))
+        self.assertEqual(interpolated.contours[0].points[4].position, (150, 100))
+
+    def test_interpolate_degenerate_curve(self):
+        interpolated, _ = self.objectGenerator("glyph")
+        glyph_min, _ = self.objectGenerator("glyph")
+        glyph_max, _ = self.objectGenerator("glyph")
+        for glyph, offset in ((glyph_min, 0), (glyph_max, 100)):
+            pen = glyph.getPen()
+            pen.moveTo((0, 0))
+            pen.curveTo((0, 0), (100, offset), (100, offset))
+            pen.lineTo((0, 100))
+            pen.closePath()
+        interpolated.interpolate(0, glyph_min, glyph_max)
+        self.assertEqual(
+            [point.type for point in interpolated.contours[0].points],
+            ["line", "line", "line"],
+        )
+
+    def test_interpolate_incompatible_outlines(self):
+        interpolated, _ = self.objectGenerator("glyph")
+        glyph_min, glyph_max = self.getGlyph_interpolationMasters()
+        glyph_max.contours[0].removePoint(5)
+        interpolated.interpolate(0.5, glyph_min, glyph_max)
+        self.assertEqual(len(interpolated.contours), 0)
+
+    def test_combine(self):
+        combined, _ = self.objectGenerator("glyph")
+        glyph_min, glyph_max = self.getGlyph_interpolationMasters()
+        glyph_min.appendAnchor("top", (100, 100))
+        glyph_max.appendAnchor("top", (200, 300))
+        combined.combine([(glyph_min, 0.5), (glyph_max, 0.5)], round=False)
+        interpolated, _ = self.objectGenerator("glyph")
+        interpolated.interpolate(0.5, glyph_min, glyph_max, round=False)
+        self.assertEqual(
+            [point.position for point in combined.contours[0].points],
+            [point.position for point in interpolated.contours[0].points],
+        )
+        self.assertEqual(
+            [(a.name, a.position) for a in combined.anchors], [("top", (150, 200))]
+        )
+        self.assertEqual(combined.width, 300)
+
+    def test_combine_many_masters(self):
+        combined, _ = self.objectGenerator("glyph")
+        glyph_min, glyph_max = self.getGlyph_interpolationMasters()
+        glyph_min.lib["key"] = "value"
+        combined.combine(
+            [(glyph_min, 1), (glyph_max, (0.5, 0)), (glyph_min, (-0.5, 0))]
+        )
+        self.assertEqual(
+            [point.position for point in combined.contours[0].points],
+            [(0, 0), (0, 100), (25, 150), (75, 150), (150, 100), (150, 0)],
+        )
+        self.assertEqual(combined.width, 300)
+        self.assertEqual(combined.lib["key"], "value")
+
+    def test_combine_matches_glyph_math(self):
+        combined, _ = self.objectGenerator("glyph")
+        glyph_min, glyph_max = self.getGlyph_interpolationMasters()
+        glyph_min.appendGuideline((0, 100), 0)
+        glyph_max.appendGuideline((0, 200), 0)
+        combined.combine([(glyph_min, 0.3), (glyph_max, (1.2, 0.7))], round=False)
+        expected = glyph_min * 0.3 + glyph_max * (1.2, 0.7)
+        self.assertEqual(
+            [point.position for point in combined.contours[0].points],
+            [point.position for point in expected.contours[0].points],
+        )
+        self.assertEqual(combined.guidelines[0].position, (0, 170))
+        self.assertEqual(combined.width, expected.width)
+
+    def test_combine_degenerate_curve(self):
+        combined, _ = self.objectGenerator("glyph")
+        glyph_min, _ = self.objectGenerator("glyph")
+        glyph_max, _ = self.objectGenerator("glyph")
+        for glyph, offset in ((glyph_min, 0), (glyph_max, 100)):
+            pen = glyph.getPen()
+            pen.moveTo((0, 0))
+            pen.curveTo((0, 0), (100, offset), (100, offset))
+            pen.lineTo((0, 100))
+            pen.closePath()
+        combined.combine([(glyph_min, 1), (glyph_max, 0)])
+        self.assertEqual(
+            [point.type for point in combined.contours[0].points],
+            ["line", "line", "line"],
+        )
+
+    def test_combine_incompatible(self):
+        combined, _ = self.objectGenerator("glyph")
+        glyph_min, glyph_max = self.getGlyph_interpolationMasters()
+        glyph_min.appendContour(glyph_max.contours[0])
+        with self.assertRaises(FontPartsError):
+            combined.combine([(glyph_min, 0.5), (glyph_max, 0.5)], suppressError=False)
+
+    def test_combine_invalid(self):
+        glyph, _ = self.objectGenerator("glyph")
+        with self.assertRaises(TypeError):
+            glyph.combine([(1, 1)])
+        with self.assertRaises(TypeError):
+            glyph.combine([(glyph, "1")])
+        with self.assertRaises(ValueError):
+            glyph.combine([])
+
+    def test_trustedMode_restored_on_error(self):
+        with self.assertRaises(ValueError), trustedMode():
+            self.assertTrue(isTrustedMode())
+            raise ValueError
+        self.assertFalse(isTrustedMode())
+
     # ---------------
     # Transformations
     # ---------------
 
+    def test_holdChanges_points(self):
+        glyph = self.getGlyph_generic()
+        with glyph.holdChanges(), glyph.holdChanges():
+            for contour in glyph.contours:
+                for point in contour.points:
+                    point.x += 10
+        self.assertEqual(glyph.bounds, (110, -10, 210, 100))
+
+    def test_transformBy_parts(self):
+        glyph = self.getGlyph_generic()
+        glyph.appendComponent("base", offset=(10, 20))
+        glyph.addImage(data=testImageData)
+        glyph.transformBy((2, 0, 0, 2, 5, 0))
+        self.assertEqual(glyph.contours[0].bounds, (205, -20, 405, 200))
+        self.assertEqual(glyph.contours[1].points[0].position, (225, 20))
+        self.assertEqual(glyph.components[0].offset, (25, 40))
+        self.assertEqual(glyph.anchors[1].position, (11, 8))
+        self.assertEqual(glyph.guidelines[0].position, (7, 4))
+        self.assertEqual(glyph.image.transformation, (1, 0, 0, 1, 0, 0))
+
     def test_moveBy_only_contours(self):
         glyph = self.getGlyph_generic()
         glyph.moveBy((100, 0))
@@ -1191,6 +1625,95 @@ class TestGlyph(unittest.TestCase):
         glyph.moveBy((0, 250))
         self.assertEqual(glyph.bounds[1], 240)
 
+    # --------------
+    # Packed Outline
+    # --------------
+
+    def getGlyph_packed(self):
+        glyph = self.getGlyph_generic()
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.curveTo((10, 50), (40, 60), (50, 50))
+        pen.endPath()
+        glyph.contours[0].points[1].smooth = True
+        glyph.appendComponent("base", offset=(10, 20), scale=(2, 3))
+        return glyph
+
+    def test_toPackedOutline(self):
+        glyph = self.getGlyph_packed()
+        outline = glyph.toPackedOutline()
+        self.assertEqual(outline.contourCount, 3)
+        self.assertEqual(outline.pointCount, 12)
+        self.assertEqual(list(outline.contourEnds), [3, 7, 11])
+        self.assertEqual(
+            outline.getCoordinateArray().tolist()[:4],
+            [[100, -10], [100, 100], [200, 100], [200, 0]],
+        )
+        self.assertEqual(list(outline.pointTypes[8:]), [1, 0, 0, 3])
+        self.assertEqual(list(outline.smoothFlags[:4]), [0, 1, 0, 0])
+        self.assertEqual(outline.componentNames, ("base",))
+        self.assertEqual(list(outline.componentTransformations), [2, 0, 0, 3, 10, 20])
+        self.assertEqual(outline.anchorNames, ("Test Anchor 1", "Test Anchor 2"))
+        self.assertEqual(list(outline.anchorCoordinates), [1, 2, 3, 4])
+
+    def test_toPackedOutline_empty(self):
+        glyph = self.getGlyph_empty()
+        outline = glyph.toPackedOutline()
+        self.assertEqual(outline.contourCount, 0)
+        self.assertEqual(outline.pointCount, 0)
+        self.assertEqual(outline.componentNames, ())
+
+    def test_fromPackedOutline(self):
+        source = self.getGlyph_packed()
+        glyph = self.getGlyph_empty()
+        glyph.appendAnchor("old", (0, 0))
+        glyph.fromPackedOutline(source.toPackedOutline())
+        self.assertEqual(glyph.toPackedOutline(), source.toPackedOutline())
+        self.assertEqual(glyph.contours[1].bounds, (110, 10, 190, 90))
+        self.assertEqual(
+            [contour.open for contour in glyph.contours], [False, False, True]
+        )
+        self.assertTrue(glyph.contours[0].points[1].smooth)
+        self.assertEqual(glyph.components[0].transformation, (2, 0, 0, 3, 10, 20))
+        self.assertEqual(
+            [(anchor.name, anchor.position) for anchor in glyph.anchors],
+            [("Test Anchor 1", (1, 2)), ("Test Anchor 2", (3, 4))],
+        )
+        self.assertEqual(glyph.width, 0)
+
+    def test_fromPackedOutline_unnamedAnchor(self):
+        source = self.getGlyph_packed()
+        anchor = source.appendAnchor("unnamed", (5, 6))
+        anchor.name = None
+        outline = source.toPackedOutline()
+        self.assertEqual(outline.anchorNames[-1], None)
+        glyph = self.getGlyph_empty()
+        glyph.fromPackedOutline(outline)
+        self.assertEqual(glyph.toPackedOutline(), outline)
+        self.assertEqual(
+            [(anchor.name, anchor.position) for anchor in glyph.anchors][-1],
+            (None, (5, 6)),
+        )
+
+    def test_fromPackedOutline_pickled(self):
+        source = self.getGlyph_packed()
+        outline = pickle.loads(pickle.dumps(source.toPackedOutline()))
+        glyph = self.getGlyph_empty()
+        glyph.fromPackedOutline(outline)
+        self.assertEqual(glyph.toPackedOutline(), source.toPackedOutline())
+
+    def test_fromPackedOutline_invalid(self):
+        glyph = self.getGlyph_empty()
+        outline = self.getGlyph_packed().toPackedOutline()
+        with self.assertRaises(TypeError):
+            glyph.fromPackedOutline(tuple(outline))
+        with self.assertRaises(ValueError):
+            glyph.fromPackedOutline(outline._replace(contourEnds=[3, 7]))
+        with self.assertRaises(ValueError):
+            glyph.fromPackedOutline(outline._replace(pointTypes=[9] * 12))
+        with self.assertRaises(ValueError):
+            glyph.fromPackedOutline(outline._replace(anchorNames=("top",)))
+
     # ---
     # API
     # ---
@@ -78,6 +78,29 @@ class TestInfo(unittest.TestCase):
         info.round()
         self.assertEqual(info.unitsPerEm, 2000)
 
+    # -----
+    # Scale
+    # -----
+
+    def test_scaleBy(self):
+        info = self.getInfo_generic()
+        info.ascender = 750
+        info.descender = -250.5
+        info.openTypeHheaAscender = 801
+        info.openTypeOS2SubscriptXSize = 650
+        info.postscriptBlueValues = [-10, 0, 500, 510]
+        info.italicAngle = -12
+        info.scaleBy((2, 0.5))
+        self.assertEqual(info.unitsPerEm, 1000)
+        self.assertEqual(info.ascender, 375)
+        self.assertEqual(info.descender, -125.25)
+        self.assertEqual(info.openTypeHheaAscender, 401)
+        self.assertIsInstance(info.openTypeHheaAscender, int)
+        self.assertEqual(info.openTypeOS2SubscriptXSize, 1300)
+        self.assertEqual(info.postscriptBlueValues, [-5, 0, 250, 255])
+        self.assertEqual(info.italicAngle, -12)
+        self.assertIsNone(info.xHeight)
+
     # ------
     # Update
     # ------
@@ -131,3 +154,16 @@ class TestInfo(unittest.TestCase):
             0.5154, font_min.info, font_max.info, round=True
         )
         self.assertEqual(interpolated_font.info.unitsPerEm, 1515)
+
+    def test_combine_unitsPerEm(self):
+        combined_font, _ = self.objectGenerator("font")
+        fonts = []
+        for unitsPerEm in (1000, 2000, 4000):
+            font, _ = self.objectGenerator("font")
+            font.info.unitsPerEm = unitsPerEm
+            fonts.append(font)
+        combined_font.info.combine(
+            [(fonts[0].info, 0.25), (fonts[1].info, 0.5), (fonts[2].info, 0.25)],
+            round=False,
+        )
+        self.assertEqual(combined_font.info.unitsPerEm, 2250)
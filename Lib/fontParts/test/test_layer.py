@@ -1,6 +1,8 @@
 import unittest
 import collections
 
+from fontParts.base import FontPartsError
+
 
 class TestLayer(unittest.TestCase):
     # ------
@@ -47,6 +49,163 @@ class TestLayer(unittest.TestCase):
         with self.assertRaises(KeyError):
             layer["E"]
 
+    def test_contains_true(self):
+        layer = self.getLayer_glyphs()
+        self.assertTrue("A" in layer)
+
+    def test_contains_false(self):
+        layer = self.getLayer_glyphs()
+        self.assertFalse("E" in layer)
+
+    def test_iter(self):
+        layer = self.getLayer_glyphs()
+        glyphs = list(layer)
+        self.assertEqual(sorted(glyph.name for glyph in glyphs), ["A", "B", "C", "D"])
+        for glyph in glyphs:
+            self.assertEqual(glyph.layer, layer)
+
+    def test_del_glyph(self):
+        layer = self.getLayer_glyphs()
+        del layer["A"]
+        self.assertFalse("A" in layer)
+        self.assertEqual(len(layer), 3)
+
+    def test_del_glyph_not_in_layer(self):
+        layer = self.getLayer_glyphs()
+        with self.assertRaises(KeyError):
+            del layer["E"]
+
+    def test_holdChanges(self):
+        layer = self.getLayer_glyphs()
+        pen = layer["A"].getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.lineTo((100, 100))
+        pen.closePath()
+        with layer.holdChanges():
+            for glyph in layer:
+                glyph.moveBy((10, 20))
+        self.assertEqual(layer["A"].bounds, (10, 20, 110, 120))
+
+    # -------------
+    # Interpolation
+    # -------------
+
+    def test_combine(self):
+        combined, _ = self.objectGenerator("layer")
+        combined.newGlyph("Z")
+        masters = []
+        for index, weight in enumerate((0.25, 0.5, 0.25)):
+            layer = self.getLayer_glyphs()
+            layer["A"].width = 100 * (index + 1)
+            if index == 1:
+                layer.removeGlyph("D")
+            masters.append((layer, weight))
+        combined.combine(masters)
+        self.assertEqual(sorted(combined.keys()), ["A", "B", "C"])
+        self.assertEqual(combined["A"].width, 200)
+
+    def test_combine_invalid(self):
+        layer = self.getLayer_glyphs()
+        with self.assertRaises(TypeError):
+            layer.combine([(layer["A"], 1)])
+
+    def getLayer_interpolationMasters(self):
+        layers = []
+        for scale in (1, 2):
+            layer = self.getLayer_glyphs()
+            for glyph in layer:
+                pen = glyph.getPen()
+                pen.moveTo((0, 0))
+                pen.lineTo((0, 100 * scale))
+                pen.curveTo((25, 150 * scale), (75, 150 * scale), (100 * scale, 100))
+                pen.closePath()
+                glyph.appendAnchor("top", (50, 100 * scale))
+                glyph.width = 200 * scale
+            layers.append(layer)
+        layers[0]["B"].appendGuideline((0, 0), 0)
+        layers[1]["B"].appendGuideline((0, 100), 0)
+        layers[1].removeGlyph("D")
+        return layers
+
+    def test_prepareInterpolation_interpolateLayer(self):
+        minLayer, maxLayer = self.getLayer_interpolationMasters()
+        layer, _ = self.objectGenerator("layer")
+        expected, _ = self.objectGenerator("layer")
+        interpolation = layer.prepareInterpolation(minLayer, maxLayer)
+        self.assertEqual(sorted(interpolation.keys()), ["A", "B", "C"])
+        for factor, round in ((0.25, True), ((0.3, 0.8), False), (1.5, True)):
+            self.assertIs(interpolation.interpolateLayer(factor, round=round), layer)
+            expected.interpolate(factor, minLayer, maxLayer, round=round)
+            self.assertEqual(sorted(layer.keys()), sorted(expected.keys()))
+            for glyph in expected:
+                result = layer[glyph.name]
+                self.assertEqual(
+                    [point.position for point in result.contours[0].points],
+                    [point.position for point in glyph.contours[0].points],
+                )
+                self.assertEqual(result.anchors[0].position, glyph.anchors[0].position)
+                self.assertEqual(
+                    [g.position for g in result.guidelines],
+                    [g.position for g in glyph.guidelines],
+                )
+                self.assertEqual(result.width, glyph.width)
+
+    def test_prepareInterpolation_interpolateLayer_other(self):
+        minLayer, maxLayer = self.getLayer_interpolationMasters()
+        interpolation = minLayer.prepareInterpolation(minLayer, maxLayer)
+        layer, _ = self.objectGenerator("layer")
+        layer.newGlyph("Z")
+        interpolation.interpolateLayer(0.5, layer)
+        self.assertEqual(sorted(layer.keys()), ["A", "B", "C"])
+        self.assertEqual(layer["A"].width, 300)
+        self.assertEqual(minLayer["A"].width, 200)
+
+    def test_prepareInterpolation_interpolateGlyph(self):
+        minLayer, maxLayer = self.getLayer_interpolationMasters()
+        interpolation = minLayer.prepareInterpolation(minLayer, maxLayer)
+        glyph = interpolation.interpolateGlyph("A", 0.5)
+        self.assertEqual(glyph.name, "A")
+        self.assertEqual(glyph.contours[0].points[4].position, (150, 100))
+        target, _ = self.objectGenerator("glyph")
+        self.assertIs(interpolation.interpolateGlyph("B", 0.5, glyph=target), target)
+        self.assertEqual(target.guidelines[0].position, (0, 50))
+        with self.assertRaises(KeyError):
+            interpolation.interpolateGlyph("D", 0.5)
+
+    def test_prepareInterpolation_interpolateOutline(self):
+        minLayer, maxLayer = self.getLayer_interpolationMasters()
+        interpolation = minLayer.prepareInterpolation(minLayer, maxLayer)
+        for name in ("A", "B"):
+            outline = interpolation.interpolateOutline(name, 0.5, round=False)
+            self.assertEqual(
+                list(outline.coordinates), [0, 0, 0, 150, 25, 225, 75, 225, 150, 100]
+            )
+            self.assertEqual(outline.anchorNames, ("top",))
+            self.assertEqual(list(outline.anchorCoordinates), [50, 150])
+
+    def test_prepareInterpolation_incompatible(self):
+        minLayer, maxLayer = self.getLayer_interpolationMasters()
+        maxLayer["A"].contours[0].removePoint(0)
+        layer, _ = self.objectGenerator("layer")
+        expected, _ = self.objectGenerator("layer")
+        expected.interpolate(0.5, minLayer, maxLayer)
+        interpolation = layer.prepareInterpolation(minLayer, maxLayer)
+        interpolation.interpolateLayer(0.5)
+        self.assertEqual(sorted(layer.keys()), sorted(expected.keys()))
+        self.assertEqual(len(layer["A"].contours), len(expected["A"].contours))
+        self.assertEqual(len(interpolation.interpolateGlyph("A", 0.5).contours), 0)
+        self.assertIsNone(interpolation.interpolateOutline("A", 0.5))
+        with self.assertRaises(FontPartsError):
+            interpolation.interpolateGlyph("A", 0.5, suppressError=False)
+        with self.assertRaises(FontPartsError):
+            interpolation.interpolateLayer(0.5, suppressError=False)
+
+    def test_prepareInterpolation_invalid(self):
+        layer = self.getLayer_glyphs()
+        with self.assertRaises(TypeError):
+            layer.prepareInterpolation(layer, layer["A"])
+
     # ----
     # Hash
     # ----
@@ -1,6 +1,8 @@
 import unittest
 import os
+from array import array
 from fontParts.base import normalizers
+from fontParts.base.arrays import PackedOutline, makeCoordinateArray
 
 
 class TestNormalizers(unittest.TestCase):
@@ -106,6 +108,22 @@ class TestNormalizers(unittest.TestCase):
         with self.assertRaises(ValueError):
             normalizers.normalizeGlyphOrder(["A", "B", "C", "C", "D", "E"])
 
+    # normalizeUnitsPerEm
+
+    def test_normalizeUnitsPerEm_int(self):
+        self.assertEqual(normalizers.normalizeUnitsPerEm(1000), 1000)
+
+    def test_normalizeUnitsPerEm_float(self):
+        self.assertEqual(normalizers.normalizeUnitsPerEm(1000.5), 1000.5)
+
+    def test_normalizeUnitsPerEm_zero(self):
+        with self.assertRaises(ValueError):
+            normalizers.normalizeUnitsPerEm(0)
+
+    def test_normalizeUnitsPerEm_notNumber(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizeUnitsPerEm("1000")
+
     # -------
     # Kerning
     # -------
@@ -1575,6 +1593,36 @@ class TestNormalizers(unittest.TestCase):
         with self.assertRaises(ValueError):
             normalizers.normalizeInterpolationFactor((2, 2, 2))
 
+    # normalizeCombinationMasters
+
+    def test_normalizeCombinationMasters_valid(self):
+        result = normalizers.normalizeCombinationMasters(
+            [("a", 1), ("b", (0.5, 2))], str
+        )
+        self.assertEqual(result, [("a", (1.0, 1.0)), ("b", (0.5, 2.0))])
+
+    def test_normalizeCombinationMasters_notList(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizeCombinationMasters("a", str)
+
+    def test_normalizeCombinationMasters_empty(self):
+        with self.assertRaises(ValueError):
+            normalizers.normalizeCombinationMasters([], str)
+
+    def test_normalizeCombinationMasters_notPair(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizeCombinationMasters(["a"], str)
+        with self.assertRaises(ValueError):
+            normalizers.normalizeCombinationMasters([("a", 1, 2)], str)
+
+    def test_normalizeCombinationMasters_invalidMaster(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizeCombinationMasters([(1, 1)], str)
+
+    def test_normalizeCombinationMasters_invalidWeight(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizeCombinationMasters([("a", "1")], str)
+
     # normalizeRotationAngle
 
     def test_normalizeRotationAngle_zero(self):
@@ -1624,6 +1672,100 @@ class TestNormalizers(unittest.TestCase):
         with self.assertRaises(TypeError):
             normalizers.normalizeRotationAngle("1")
 
+    # normalizeCoordinateArray
+
+    def test_normalizeCoordinateArray_sequence(self):
+        result = normalizers.normalizeCoordinateArray([(1, 2), [3.5, 4]])
+        self.assertIsInstance(result, array)
+        self.assertEqual(result.tolist(), [1, 2, 3.5, 4])
+
+    def test_normalizeCoordinateArray_empty(self):
+        result = normalizers.normalizeCoordinateArray([])
+        self.assertEqual(result.tolist(), [])
+
+    def test_normalizeCoordinateArray_coordinateArray(self):
+        values = array("d", [1, 2, 3, 4])
+        result = normalizers.normalizeCoordinateArray(makeCoordinateArray(values))
+        self.assertEqual(result, values)
+        self.assertIsNot(result, values)
+
+    def test_normalizeCoordinateArray_wrongShape(self):
+        with self.assertRaises(ValueError):
+            normalizers.normalizeCoordinateArray([(1, 2, 3)])
+        values = array("d", [1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            normalizers.normalizeCoordinateArray(memoryview(values))
+
+    def test_normalizeCoordinateArray_notSequence(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizeCoordinateArray("12")
+
+    def test_normalizeCoordinateArray_notNumber(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizeCoordinateArray([(1, "2")])
+
+    # normalizePackedOutline
+
+    def getPackedOutline(self, **kwargs):
+        values = {
+            "coordinates": [0, 0, 0, 100, 100, 0],
+            "pointTypes": [2, 2, 2],
+            "smoothFlags": [0, 0, 0],
+            "contourEnds": [2],
+            "componentNames": ("base",),
+            "componentTransformations": [1, 0, 0, 1, 0, 0],
+            "anchorNames": ("top",),
+            "anchorCoordinates": [50, 100],
+        }
+        values.update(kwargs)
+        return PackedOutline(**values)
+
+    def test_normalizePackedOutline(self):
+        result = normalizers.normalizePackedOutline(self.getPackedOutline())
+        self.assertIsInstance(result, PackedOutline)
+        self.assertEqual(result.coordinates, array("d", [0, 0, 0, 100, 100, 0]))
+        self.assertEqual(result.pointTypes, array("B", [2, 2, 2]))
+        self.assertEqual(result.contourEnds, array("L", [2]))
+
+    def test_normalizePackedOutline_notPackedOutline(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizePackedOutline(tuple(self.getPackedOutline()))
+
+    def test_normalizePackedOutline_pointCountMismatch(self):
+        with self.assertRaises(ValueError):
+            normalizers.normalizePackedOutline(
+                self.getPackedOutline(smoothFlags=[0, 0])
+            )
+
+    def test_normalizePackedOutline_contourEnds(self):
+        with self.assertRaises(ValueError):
+            normalizers.normalizePackedOutline(self.getPackedOutline(contourEnds=[1]))
+        with self.assertRaises(ValueError):
+            normalizers.normalizePackedOutline(
+                self.getPackedOutline(contourEnds=[1, 1, 2])
+            )
+        with self.assertRaises(ValueError):
+            normalizers.normalizePackedOutline(
+                self.getPackedOutline(contourEnds=[-1, 2])
+            )
+
+    def test_normalizePackedOutline_componentTransformations(self):
+        with self.assertRaises(ValueError):
+            normalizers.normalizePackedOutline(
+                self.getPackedOutline(componentTransformations=[1, 0])
+            )
+
+    def test_normalizePackedOutline_names(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizePackedOutline(self.getPackedOutline(anchorNames=(1,)))
+
+    def test_normalizePackedOutline_noneNames(self):
+        result = normalizers.normalizePackedOutline(
+            self.getPackedOutline(componentNames=(None,), anchorNames=(None,))
+        )
+        self.assertEqual(result.componentNames, (None,))
+        self.assertEqual(result.anchorNames, (None,))
+
     # ---------------
     # Transformations
     # ---------------
@@ -270,6 +270,23 @@ class TestPoint(unittest.TestCase):
         point = self.getPoint_generic()
         self.assertEqual(point.index, 1)
 
+    def test_get_index_after_insert_and_remove(self):
+        point = self.getPoint_generic()
+        contour = point.contour
+        self.assertEqual([p.index for p in contour.points], [0, 1])
+        contour.insertPoint(0, (50, 50), "line")
+        self.assertEqual(point.index, 2)
+        contour.removePoint(0)
+        contour.removePoint(0)
+        self.assertEqual(point.index, 0)
+
+    def test_get_index_notInContour(self):
+        point, _ = self.objectGenerator("point")
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoint((0, 0), "line")
+        point.contour = contour
+        self.assertRaises(ValueError, getattr, point, "index")
+
     def test_get_index_noParentContour(self):
         point = self.getPoint_noParentContour()
         self.assertEqual(point.index, None)
@@ -11,6 +11,22 @@ class TestSegment(unittest.TestCase):
         segment = contour[1]
         return segment
 
+    # -----
+    # Index
+    # -----
+
+    def test_index(self):
+        segment = self.getSegment_line()
+        self.assertEqual(segment.index, 1)
+        contour = segment.contour
+        self.assertEqual([s.index for s in contour], [0, 1])
+
+    def test_index_after_insert(self):
+        segment = self.getSegment_line()
+        contour = segment.contour
+        contour.insertPoint(1, (50, 50), "line")
+        self.assertEqual(segment.index, 2)
+
     # ----
     # Type
     # ----